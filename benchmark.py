@@ -0,0 +1,245 @@
+"""
+benchmark.py
+
+Measure the throughput of the fastlydash summary stages against synthetic
+or recorded statistics, with the Fastly API and S3 mocked
+
+"""
+import argh
+import io
+import json
+import logging
+import os
+import random
+import timeit
+import urlparse
+from prettytable import PrettyTable
+
+import fastlydash
+
+
+def synthetic_statistics(service_count, bucket_count=1, seed=0):
+    """
+    Return ({ 'name': 'id' }, { 'data': { 'id': [ {...} ] } }) for service_count
+    services, each with bucket_count hourly statistics buckets
+    """
+    rand = random.Random(seed)
+    services = {}
+    data = {}
+
+    for index in range(service_count):
+        service_id = "service{0:06d}".format(index)
+        services["Service {0}".format(index)] = service_id
+
+        buckets = []
+        for hour in range(bucket_count):
+            hits = rand.randint(0, 100000)
+            miss = rand.randint(0, 20000)
+            requests = hits + miss + rand.randint(0, 5000)
+            status_5xx = rand.randint(0, requests // 100)
+            status_4xx = rand.randint(0, requests // 20)
+            status_3xx = rand.randint(0, requests // 10)
+            buckets.append({'start_time': 1400000000 + hour * 3600,
+                            'hits': hits,
+                            'miss': miss,
+                            'hit_ratio': "{0:.4f}".format(hits / float(hits + miss or 1)),
+                            'requests': requests,
+                            'bandwidth': requests * rand.randint(500, 50000),
+                            'status_2xx': requests - status_3xx - status_4xx - status_5xx,
+                            'status_3xx': status_3xx,
+                            'status_4xx': status_4xx,
+                            'status_5xx': status_5xx})
+        data[service_id] = buckets
+
+    return services, {'data': data}
+
+def legacy_summary(services, stats):
+    """
+    The original per-service summary loop, which only reads bucket [0]
+    """
+    services_data = []
+    for service in services:
+        service_data = {'name': service, 'hit_ratio': '-', 'bandwidth': '-', 'data': '-', 'requests': '-', '20x': '-', '30x': '-', '40x': '-', '50x': '-'}
+
+        if services[service] in stats['data']:
+            if stats['data'][services[service]][0]['hit_ratio']:
+                hitrate = int(float(stats['data'][services[service]][0]['hit_ratio']) * 100)
+            else:
+                hitrate = None
+
+            service_data['hit_ratio'] = hitrate
+            service_data['bandwidth'] = stats['data'][services[service]][0]['bandwidth']
+            service_data['data'] = fastlydash.sizeof_fmt(stats['data'][services[service]][0]['bandwidth'])
+            service_data['requests'] = stats['data'][services[service]][0]['requests']
+            service_data['20x'] = int(100 * (stats['data'][services[service]][0]['status_2xx'] / float(stats['data'][services[service]][0]['requests'])))
+            service_data['30x'] = int(100 * (stats['data'][services[service]][0]['status_3xx'] / float(stats['data'][services[service]][0]['requests'])))
+            service_data['40x'] = int(100 * (stats['data'][services[service]][0]['status_4xx'] / float(stats['data'][services[service]][0]['requests'])))
+            service_data['50x'] = int(100 * (stats['data'][services[service]][0]['status_5xx'] / float(stats['data'][services[service]][0]['requests'])))
+
+        services_data.append(service_data)
+    return services_data
+
+def summary(services, stats):
+    """
+    The current summary, totalling each service's buckets then computing
+    the rows for all services at once
+    """
+    names, totals = [], []
+    for name, service_id in services.items():
+        names.append(name)
+        totals.append(fastlydash.merge_buckets(stats['data'][service_id]))
+    return fastlydash.summarise_services(names, totals)
+
+def report(label, service_count, seconds):
+    """
+    Print the timing of a single benchmark
+    """
+    print "{0:<30} {1:>8.1f}ms {2:>12.0f} services/s".format(label, seconds * 1000, service_count / seconds)
+
+@argh.arg('--services', type=int, help='The number of synthetic services to summarise')
+@argh.arg('--buckets', type=int, help='The number of hourly buckets per service')
+@argh.arg('--repeat', type=int, help='The number of times each benchmark is run, the best run is reported')
+def aggregation(services=10000, buckets=24, repeat=5):
+    """
+    Compare the throughput of the summary computation with the original loop
+    """
+    single = synthetic_statistics(services, 1)
+    hourly = synthetic_statistics(services, buckets)
+
+    report("legacy loop (1 bucket)", services, min(timeit.repeat(lambda: legacy_summary(*single), number=1, repeat=repeat)))
+    report("summary (1 bucket)", services, min(timeit.repeat(lambda: summary(*single), number=1, repeat=repeat)))
+    report("summary ({0} buckets)".format(buckets), services, min(timeit.repeat(lambda: summary(*hourly), number=1, repeat=repeat)))
+
+class FakeResponse(object):
+    """
+    A canned Fastly API response
+    """
+
+    def __init__(self, body):
+        self.status_code = 200
+        self.body = body
+        self.headers = {'Content-Length': str(len(body))}
+        self.links = {}
+        self.raw = io.BytesIO(body)
+
+    @property
+    def content(self):
+        return self.body
+
+    def json(self):
+        return json.loads(self.body)
+
+    def raise_for_status(self):
+        pass
+
+    def close(self):
+        pass
+
+class FakeSession(object):
+    """
+    Answers Fastly API requests from recorded /service and /stats payloads
+    """
+
+    def __init__(self, services, stats):
+        self.services = services
+        self.stats = json.dumps(stats)
+
+    def get(self, url, **kwargs):
+        parsed = urlparse.urlparse(url)
+        if parsed.path == '/service':
+            query = urlparse.parse_qs(parsed.query)
+            page, per_page = int(query['page'][0]), int(query['per_page'][0])
+            return FakeResponse(json.dumps(self.services[(page - 1) * per_page:page * per_page]))
+        return FakeResponse(self.stats)
+
+class FakeKey(object):
+    """
+    An S3 object which discards its contents when written
+    """
+
+    def __init__(self, bucket=None):
+        self.bucket = bucket
+        self.key = None
+
+    def set_metadata(self, name, value):
+        pass
+
+    def set_contents_from_string(self, contents, **kwargs):
+        pass
+
+class FakeBucket(object):
+    """
+    An S3 bucket which holds no objects
+    """
+    name = 'benchmark'
+
+    def get_key(self, key_name):
+        return None
+
+def load_recorded(directory):
+    """
+    Return the ([ {...} ], { 'data': {...} }) payloads recorded from the
+    /service and /stats endpoints in service.json and stats.json
+    """
+    with open(os.path.join(directory, 'service.json')) as services_file:
+        services = json.load(services_file)
+    with open(os.path.join(directory, 'stats.json')) as stats_file:
+        stats = json.load(stats_file)
+    return services, stats
+
+def run_pipeline(services, stats, render_mode):
+    """
+    Run the whole summary, from the API requests to the S3 upload and table,
+    against the given payloads, returning the run's metrics
+    """
+    fastlydash._SESSION = FakeSession(services, stats)
+    fastlydash.Key = FakeKey
+    fastlydash._S3_BUCKETS[(fastlydash.S3_REGION, FakeBucket.name)] = FakeBucket()
+    fastlydash._PUBLISHED_DIGESTS.clear()
+
+    kwargs = {'fastly_api_key': ['benchmark'], 'accounts': None, 'account_timeout': fastlydash.ACCOUNT_TIMEOUT,
+              'cache': None, 'cache_retention': fastlydash.CACHE_RETENTION_HOURS, 'history': None,
+              'render_mode': render_mode, 's3bucket': FakeBucket.name, 's3region': fastlydash.S3_REGION,
+              's3acl': 'private', 'filename': 'fastly-stats.html', 'data_format': 'json'}
+
+    _, table, _, _ = fastlydash.generate_summary(kwargs)
+    with fastlydash.METRICS.stage('sort'):
+        table.get_string(sortby="Hit Ratio")
+    return fastlydash.METRICS.as_dict()
+
+@argh.arg('--sizes', nargs='+', type=int, help='The numbers of synthetic services to run the pipeline with')
+@argh.arg('--recorded', help='Path to a directory of service.json and stats.json responses to replay instead of synthetic payloads')
+@argh.arg('--render-mode', choices=('table', 'virtual'), help='The dashboard rendering mode')
+@argh.arg('--repeat', type=int, help='The number of times each pipeline is run, the fastest run is reported')
+@argh.arg('--output', help='Path to write the stage metrics of each pipeline to as JSON')
+def pipeline(sizes=(100, 1000, 10000), recorded=None, render_mode='table', repeat=3, output=None):
+    """
+    Time each stage of the full pipeline with the network mocked
+    """
+    if recorded:
+        payloads = [('recorded', load_recorded(recorded))]
+    else:
+        payloads = []
+        for size in sizes:
+            services, stats = synthetic_statistics(size)
+            payloads.append((size, ([{'name': name, 'id': service_id} for name, service_id in sorted(services.items())], stats)))
+
+    results = {}
+    for label, (services, stats) in payloads:
+        runs = [run_pipeline(services, stats, render_mode) for _ in range(repeat)]
+        best = min(runs, key=lambda run: run['seconds'])
+        results[str(label)] = best
+
+        table = PrettyTable(["Stage", "Calls", "ms", "Bytes"])
+        for name, totals in sorted(best['stages'].items()):
+            table.add_row([name, totals['calls'], round(totals['seconds'] * 1000, 1), totals['bytes']])
+        print "{0} services: {1:.1f}ms".format(len(services), best['seconds'] * 1000)
+        print table.get_string(sortby="ms", reversesort=True)
+
+    if output:
+        with open(output, 'w') as output_file:
+            json.dump(results, output_file, indent=2, sort_keys=True)
+
+if __name__ == "__main__":
+    logging.basicConfig(level=logging.WARNING)
+    argh.dispatch_commands([aggregation, pipeline])
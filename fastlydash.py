@@ -5,9 +5,29 @@ Generate an HTML summary of all services for a given Fastly account
 
 """
 import argh
+import base64
+import contextlib
+import csv
+import gzip
+import hashlib
+import io
+import json
+import os
+import posixpath
 import time
+import math
 import logging
+import operator
+import sqlite3
+import struct
+import threading
 import requests
+import requests.adapters
+from multiprocessing.pool import ThreadPool
+from BaseHTTPServer import HTTPServer, BaseHTTPRequestHandler
+from SocketServer import ThreadingMixIn
+
+import ijson
 from boto import s3
 from boto.s3.key import Key
 from jinja2 import Template
@@ -15,6 +35,199 @@ from prettytable import PrettyTable
 
 LOGGER = logging.getLogger(__name__)
 
+LOGO_PNG_BASE64 = "iVBORw0KGgoAAAANSUhEUgAAAJYAAACYCAYAAAAGCxCSAAAMF2lDQ1BJQ0MgUHJvZmlsZQAASImVlwdYU8kWx+eWFEISSiACUkJvgvQqvUuVDjZCEiCUGBKCir0sKrAWVFRQVHRFRMW1ALLYsJdFsPcXCyor62LBhsqbFNDnvv3e9+b75t5fzpxz7n/mztzMAKDmwhYK81F1AAoERaL4sEBWalo6i/QAUIAGrCpAk80RCwPi4qLAP5Z3NwAiu1+1k+X6Z7//WjS4PDEHACQOciZXzCmAfBAAXI8jFBUBQOiCdtPpRUIZv4WsJYICASCSZZytYH0ZZyrYQe6TGB8EORgAMpXNFmUDQJflZxVzsmEeuhCyg4DLF0DeAtmXk8PmQpZCHlNQMA2yGhWyVeZ3ebL/I2fmSE42O3uEFX2RF3IwXyzMZ8/8P4fjf5eCfMnwM0xgpeaIwuNlfYbjtjNvWqSMoXakXZAZEwtZE/I5PlfuL+M7OZLwJKV/H0ccBMcMMAFAAZcdHAkZjiXKlOQlBSjZiS2Sx0J/NIZfFJGo5EzRtHhlfrSYJw5JGOYcXkSUMudSQX7MMNdm8UMjIMOZhh4syUlMUehETxXzk2Mg0yF3ifMSIpX+D0pygmKGfUSSeJlmM8hvs0Sh8QofTKdAPNwvzJ7DlmvQgexflJMYrojFUnni1KhhbVxecIhCA8blCZKUmjE4uwLjlbGlwvw4pT9Wy8sPi1eMM7ZPXJwwHHulCE4wxThgj3LZ4+MU+rF3wqK4RIU2HAdRIAgEAxaQwJoJpoFcwO/sa+mDvxQtoYANRCAb8ICd0jIckSJvEcBrAigBf0LiAfFIXKC8lQeKof3LiFVxtQNZ8tZieUQeeAq5ANfDfXFvPApe/WF1wj1wz+E4ltrwU4khxGBiODGUaD2igwNV58MqAvy/275FEp4SugmPCNcJUsJtEAlbebDPMoWCkZ4lgyfyLMrfU/kLRT8oZ4FoIIVxocreZcLo3mEf3AKqdsUDcR+oH2rHmbgesMNdYE8CcD/YN1do/V6hZETFt7H88Xkyfd/3UWmn29BdlSoyR/QHjXj9mCXouzHiwnvkj57YUuwAdhY7gZ3H2rEWwMKOYa3YJeyIjEdmwhP5TBh+WrxcWx7Mwx/2cWh06HX4/Lens5UKRPL3DYp4M4pkCyJomnCmiJ+dU8QKgF9kHitCwLEfw3JycHQBQPZ9V3w+3jDl322EeeGbrfA4AJ5l0Jj9zcY2BeDwUwAY777ZTF/D5bUSgCNdHImoWGHDZRcC/NdQgytDFxgCU2AF++QE3IA38AchYDyIBYkgDUyBo54DCqDq6WA2WABKQTlYCdaCarAZbAM7wR6wH7SAdnACnAEXQRe4Du7CudEDXoB+8A4MIghCQmgIA9FFjBBzxBZxQjwQXyQEiULikTQkA8lGBIgEmY0sQsqRSqQa2Yo0IL8ih5ETyHmkG7mNPER6kdfIJxRDqagWaoBaoGNRDzQAjUQT0cloNlqIlqCL0eXoerQO3Y02oyfQi+h1VIq+QAcwgKliTMwYs8M8sCAsFkvHsjARNhcrw6qwOmwv1gbf9VVMivVhH3EizsBZuB2cn+F4Es7BC/G5eAVeje/Em/FT+FX8Id6PfyXQCPoEW4IXIYKQSsgmTCeUEqoIOwiHCKfhiuohvCMSiUyiJdEdrs00Yi5xFrGCuInYRDxO7CY+Jg6QSCRdki3JhxRLYpOKSKWkDaTdpGOkK6Qe0geyKtmI7EQOJaeTBeSF5CryLvJR8hXyM/KgirqKuYqXSqwKV2WmygqV7SptKpdVelQGKRoUS4oPJZGSS1lAWU/ZSzlNuUd5o6qqaqLqqTpBla86X3W96j7Vc6oPVT9SNak21CDqJKqEupxaTz1OvU19Q6PRLGj+tHRaEW05rYF2kvaA9oHOoNvTI+hc+jx6Db2ZfoX+Uk1FzVwtQG2KWolaldoBtctqfeoq6hbqQeps9bnqNeqH1W+qD2gwNBw1YjUKNCo0dmmc13iuSdK00AzR5Gou1tymeVLzMQNjmDKCGBzGIsZ2xmlGjxZRy1IrQitXq1xrj1anVr+2praLdrL2DO0a7SPaUibGtGBGMPOZK5j7mTeYn0YZjAoYxRu1bNTeUVdGvdcZreOvw9Mp02nSua7zSZelG6Kbp7tKt0X3vh6uZ6M3QW+6Xq3eab2+0VqjvUdzRpeN3j/6jj6qb6Mfrz9Lf5v+Jf0BA0ODMAOhwQaDkwZ9hkxDf8NcwzWGRw17jRhGvkZ8ozVGx4z+YGmzAlj5rPWsU6x+Y33jcGOJ8VbjTuNBE0uTJJOFJk0m900pph6mWaZrTDtM+82MzKLNZps1mt0xVzH3MM8xX2d+1vy9haVFisUSixaL55Y6lhGWJZaNlvesaFZ+VoVWdVbXrInWHtZ51pusu2xQG1ebHJsam8u2qK2bLd92k233GMIYzzGCMXVjbtpR7QLsiu0a7R7aM+2j7Bfat9i/HGs2Nn3sqrFnx351cHXId9jucNdR03G840LHNsfXTjZOHKcap2vONOdQ53nOrc6vXGxdeC61LrdcGa7RrktcO1y/uLm7idz2uvW6m7lnuG90v+mh5RHnUeFxzpPgGeg5z7Pd86OXm1eR136vv7ztvPO8d3k/H2c5jjdu+7jHPiY+bJ+tPlJflm+G7xZfqZ+xH9uvzu+Rv6k/13+H/7MA64DcgN0BLwMdAkWBhwLfB3kFzQk6HowFhwWXBXeGaIYkhVSHPAg1Cc0ObQztD3MNmxV2PJwQHhm+KvxmhEEEJ6Ihon+8+/g5409FUiMTIqsjH0XZRImi2qLR6PHRq6PvxZjHCGJaYkFsROzq2PtxlnGFcb9NIE6Im1Az4Wm8Y/zs+LMJjISpCbsS3iUGJq5IvJtklSRJ6khWS56U3JD8PiU4pTJFmjo2dU7qxTS9NH5aazopPTl9R/rAxJCJayf2THKdVDrpxmTLyTMmn5+iNyV/ypGpalPZUw9kEDJSMnZlfGbHsuvYA5kRmRsz+zlBnHWcF1x/7hpuL8+HV8l7luWTVZn1PNsne3V2b45fTlVOHz+IX81/lRueuzn3fV5sXn3eUH5KflMBuSCj4LBAU5AnODXNcNqMad1CW2GpUFroVbi2sF8UKdohRsSTxa1FWnCrc0liJflJ8rDYt7im+MP05OkHZmjMEMy4NNNm5rKZz0pCS36Zhc/izOqYbTx7weyHcwLmbJ2LzM2c2zHPdN7ieT3zw+bvXEBZkLfg94UOCysXvl2UsqhtscHi+Ysf/xT2U2MpvVRUenOJ95LNS/Gl/KWdy5yXbVj2tYxbdqHcobyq/HMFp+LCz44/r/95aHnW8s4VbitqVxJXClbeWOW3amelRmVJ5ePV0aub17DWlK15u3bq2vNVLlWb11HWSdZJ10etb91gtmHlhs/VOdXXawJrmjbqb1y28f0m7qYrtf61ezcbbC7f/GkLf8utrWFbm+ss6qq2EbcVb3u6PXn72V88fmnYobejfMeXekG9dGf8zlMN7g0Nu/R3rWhEGyWNvbsn7e7aE7ynda/d3q1NzKbyfWCfZN8fv2b8emN/5P6OAx4H9h40P7jxEONQWTPSPLO5vyWnRdqa1tp9ePzhjjbvtkO/2f9W327cXnNE+8iKo5Sji48OHSs5NnBceLzvRPaJxx1TO+6eTD157dSEU52nI0+fOxN65uTZgLPHzvmcaz/vdf7wBY8LLRfdLjZfcr106HfX3w91unU2X3a/3Nrl2dXWPa776BW/KyeuBl89cy3i2sXrMde7byTduHVz0k3pLe6t57fzb7+6U3xn8O78e4R7ZffV71c90H9Q9y/rfzVJ3aRHHgY/vPQo4dHdx5zHL56In3zuWfyU9rTqmdGzhudOz9t7Q3u7/pj4R88L4YvBvtI/Nf7c+NLq5cG//P+61J/a3/NK9GrodcUb3Tf1b13edgzEDTx4V/Bu8H3ZB90POz96fDz7KeXTs8Hpn0mf13+x/tL2NfLrvaGCoSEhW8SWbwUwWNGsLABe1wNAS4N7B3iOo9AV5y95QRRnRjmBf2LFGU1e3ACo9wcgaT4AUXCPUgurOWQqvMu234n+AHV2HqnKIs5ydlLkosJTDOHD0NAbAwBIbQB8EQ0NDW4aGvqyHYq9DcDxQsW5T1aIcI+/RU1G5zsr5oMfyr8BEcVsAvcnWQUAAAAJcEhZcwAAFiUAABYlAUlSJPAAAAGdaVRYdFhNTDpjb20uYWRvYmUueG1wAAAAAAA8eDp4bXBtZXRhIHhtbG5zOng9ImFkb2JlOm5zOm1ldGEvIiB4OnhtcHRrPSJYTVAgQ29yZSA1LjQuMCI+CiAgIDxyZGY6UkRGIHhtbG5zOnJkZj0iaHR0cDovL3d3dy53My5vcmcvMTk5OS8wMi8yMi1yZGYtc3ludGF4LW5zIyI+CiAgICAgIDxyZGY6RGVzY3JpcHRpb24gcmRmOmFib3V0PSIiCiAgICAgICAgICAgIHhtbG5zOmV4aWY9Imh0dHA6Ly9ucy5hZG9iZS5jb20vZXhpZi8xLjAvIj4KICAgICAgICAgPGV4aWY6UGl4ZWxYRGltZW5zaW9uPjE1MDwvZXhpZjpQaXhlbFhEaW1lbnNpb24+CiAgICAgICAgIDxleGlmOlBpeGVsWURpbWVuc2lvbj4xNTI8L2V4aWY6UGl4ZWxZRGltZW5zaW9uPgogICAgICA8L3JkZjpEZXNjcmlwdGlvbj4KICAgPC9yZGY6UkRGPgo8L3g6eG1wbWV0YT4KarKwSgAAP+ZJREFUeAHtnWd7JMlx57MdZtZ7T64j19NKNNK5F7qXum98OvG5506iSB4p2nXkmlk/a2f9DNDm/r+IjKys6m6gGkD3zFBIoKvSREZERkalN4N37/wfi3RmziRwyhIYnjK+M3RnEjAJnCnWmSJsRQJnirUVsZ4hPVOsMx3YigTOFGsrYj1DeqZYZzqwFQmcKdZWxHqG9EyxznRgKxI4U6ytiPUM6ZlinenAViRwplhbEesZ0jPFOtOBrUjgTLG2ItYzpGeKdaYDW5HAzhSLtTmnsT6ni6fr3oqUNkS6OEFKIz1HymqwIVM7Bh/vgp4JKQtiIUdLJoOWS9qXRRr+4VZmtYVdxZO1wVvHzwGHJbJDZ2DcQatLDXqDJX9QOyc8F2lu8YIH8wJEJqAcrovfYQCDhrgo6S4hbjE0K/BbOhQY8eQGU5jwDve23ztRrCIL0l2lqJ30VkDl6GmFSI3coi15ODKEPh6lNJmkwd4kJf0G43EaTEb2TgpbjFWYj4ZpwG8g+1A/y3RQZLzKrcFcdvtJpWbzNJ9OU9JvMJ2ldDBLi4NpWuwf6H0gt8IEY/DOycqnyWtlegL8kECL3AMuQLb03oliwbull/yQhZeyC2839edkX568az+DQg2XDX6OVraBbAv3WSyUgTLECpS4DS2Kc+P5NLzj1jS65440vOu2NLz95jS67aY04HfLjSndcj4NbjyXBuf20hDFk9KhaIuCTLRmUpx9Kc4VKQ6/r6+kxZf6ffZVWlzi92Waf/pFmn/0WZq9/1GaX/o8pa++Tou5eAs8MF8ZkmApItz/zVmXcJZCS2cV0VJauy2ae3RotKG249qtYikNpJHMXplWJLY6hIBiDCy7DJ8jlQ85oSwIoauUGVAqnd9LgxukKDdIUW7Yk9JIce642RRqfN8daXTX7VKym02phlIswgc33yDFkvIRd09iyiWYl1pUVqJD6aNSKUm55l/vZ8W6nNLnX6f5J1+mxadSLJTro0/T7KIU68NP5f4iLRS+uCwF/Iqf4K8oLiWdFLUxKyVkaSzJlSsUrpFohOa3XuHT4N6+bWeKRV6jEPxIaPys9xBfL76lpAJSJsKKv3s7Juxg4qW3RdHDiEh9Jyptbr8lDR+4Kw0ffSCNH7k3jb9xdxree7sUSwp00w1ppBJpcI4SSVXiROKgZNLbqkqUKVeBaQheIyD0ORsJm+inEnAoPCjkIleBI6q9qAqtRJPyfInCfZ7mH1xK0zc/SNM3LqbZaxfT/L2P0kAKlyjJsmQsVTlplj4jrYfJAUfmxV5S9Cwf/6YU0SxSOwdrxGPItv/YmWIhML7zxoTUsoAUED4OI1fJyPgus84YQBvaYGknqVQa3qQSR5k8vFNVHSXSN+9Jw8ceTONH700TKdbg7tukVOdcgYKhrPmOFU4bXvFrXBFBPniOgES53H8ZLuD1pr2lEmr2wadp9NYHaXThYpp+4900e/PDtHjvk7T4+FOVZirppIADqtWpqleiF2VCUTJnq5nqyJC4INi9Gexql87AGw9KZ4heb5dazjX85WFC1NuUymEIiaKeKPyiBaUsFeggzfUb3nKTSqX70+iJh9Lk2UfT8JH70kilE+2ngUqnwU253UTVpvZSolEeJrMDLTMlM7NTL2PJnY2ncVNiweh6QyM/2mVSMNpjc94qxabvf5Jmr19MB89fSPO/vJ2SlG7+udpnC7XjxAtovX2Hra1cyIZfIxdBRFG1nputhuyuxCLVMpHeYbjd2wRj4TyWctCBchTDQb7TkxtSQt18YxpR5T10V5p8+6E0fvqbaYxifUMllZQqUdU5iuYZyPDJgW2Ytgswo7nkveQBaGOCDmBUp0N6n/pJydM90m950/AfSrlm37w3DdSRmN97R1qoUzF756M0u6SG/xdfpqQSLM1UvQKfn4gpqGfVs5Br4bEzxSryzZZSMUo6/sUhDgVKUg7iIgvBzcNCIGCKZ0r1zfvSRIo0+eG30+hbD6qEujMN7rwlJXp3UjraTEQlWqCQtTErPRVc+VtcHjL5ZXbT/9rDfNsweEVp68EV4gxPe84+jL099VJvT4vvPpYWFz9J01feSVd++0pKL72Z5m+8l9IXavi38LnL0MiKcoGdjzc+4Fy2yWMFo5n+Nl47U6xWTuWUrE5qFo7BRAGPQ9LSFz8YSVHOq0pjqEAlkinVdx5Nez+QYj18rzXIFyoRuriXszMzccQr8ERGHQG+RBe2wbGevkJppw1VqqpkHd6pEvbBu9Li0fut05FUvQ/vuCXNVPLO33rfhiwWX6v6pAc5pxfpHHqJ5dyVURdzRgo8bFfPHSpWk6SSVJO2tw1c8OX7yiKRuKxYwCn7SFWfGuYj9fAmP3kqjb/zWBo//qAy4E6v8iihGGKAQM7JprSosrYKb2lCBQK9AHN+m8BiCwDjNj+yX4Ex74YLnB7mWJ2K/EoEWfh4bj6vdN6f9m67OY2ffCjNX30nTf/4Wjr45ctqi6nB/6XGydSLJH6LjYwoeokhh8zdzl67U6yQXGmIttPoYsYvxN6Ii7ZU0jjU6O7b00gN8slzj6bJT5+2ttTwflV9Gm8yY0h41N+vB7WeJRPli70hvhKsBilR18URQCerWzh7OaItdpuqyNv0Id1za1rce6s+Hg2RMC7Hm8b9R5fU+P/aRvopUZ03Mab/4NNqwHD0In46QLtTrE4d3y6bSIyyA5nk3mMjGgXdcEMaP6ZxqO8/nvb+03NW/dHItcFMxo/CrBXg6oCiGzm4DSVXAWhxE9TWvkkbyrWcxhqPUwuay58CxLPveWWTPqCxSuQB43DPPZwGP38hTX//WkqvvZPmn2lE36CRYWCCOtiFp0qHAe7gsTvF6iZGiaUQK2luuSUSBQ7OqcenqmCoIYTJ97+VJn/7RNpTFTh86G6r8qL+AEdkUJdM1YptBRW6Ld8NHWuJwk87sO2q6awJyfIwSKrGG9V/lGKN7tEY3K0qsTRUMjgvRdPMwOzCe2p7fabe5ZUyUOpYTyWVNbO97TtVrDqZ9k23PFwUPE2pJLjRHbel8U+fSpMfPZEm3/2WKdhQPb663RUpbcqHNRkVgHpD9mioNUDB8yoEEQatVeH4H2YUv0QrTYfi42FSspGGIwZ//0waq5E/e+SetP/rP6f9f3shpYsfWAeHoj/aWGXsq1NjHMbGaYTtVLGM4ZBTnQkKsOathLngS1TVN7rrDo1FPayq79k01lACjfSBSi8v4uoccDEE2iWhrA1YguzlEVV1t0RquvMieAyarSjFkXGFrCjFQa425UgT5ENmF/RmdcZCc5XT50fW7krqNdr0UK4Wrc0HzsDTK6UnA9qpYq1LG/5m+EqZd7v/rrT3X79n1d7ouUc00KmqLxroBlxiRMyN3sRGxodj6eaCoKtIlXUl7Yh9OI1O1HXA5t9gxGklNAqmqSoa9IlZhfvvSPv/5w9p/qbGvJjUtrlH/2ibAqsh4jZ/mvLBjpWUQUvvsB4hrU5KYoar670lt9JgJRNMkp5gGjsllYYShvffrUa62lMqqSbfezwNNJRgo9SnzBIkNzYWaV3M7L8ueGNih0cwMkya3zZOI32MiQa+BoPnX1xOUw25MLGdNCThY12H4+qG1klA4ZpmRhdyvXt3JZa4NaWKkUar9mBZRkqVmJ6RUu399x/aUMLkmUdcqepe3/p0bCGkFq+j5ztY9s2kFRDfCT5r4TL45q/1GBlYHWkFB4bpon018K/802803qVpIIoqlVzNXK3zSZVq6YmizEoqIchuD5UTsgI0WAj0NLtTLGOoaZlE0QvDQxXpw/tySfWTp9OeSqyhpjZsSgaATVPVJ/HgxKzPLw/PzwC377cZNCowEY6HoQyPnvgLok0sRkMPLe8ZTFQtqreMkmFYQWEDqCq5FpRca0ywWQfj17AtG45VgHWkjn3HitXwx3iLLQFRsT1UQ33vv30vTf7+ubSnkgqlWrBkWKZJYIfzXTpN0iFZ+BZfK5Sr8Bug2+TRaBhjToWSRjIbahB5LBme0+JDRu8PfvY7LULUEpwy/eMfd8i1sNoqubR2P4oq5UDAbpKcHSoWhatXfbzNzjjVnRpNf/YRTdFQUj1u0zOM12As0WTiJik6ArYI0rH3E1vmAZ7d6G1MHcGZgolxBNQRHFfBgczYCEdwJAUY0tbScISqxT0os0TnohYVssL140tatXrZ2+ZECUWq0C8zenzOd6dYOSGRObDM6s7JT5/x0XR6fzTUo02V4Zsxq1oCx7OTFZYnevIdwgMlZyNtx7tOnI0/tsblsapnDmroHQpdRTzcWgqRUNeKhcpq1SHKNXlOCwXVmGfZ0PTnf1KDXm0ujNJc8sEiaj2bhxBYUkaQycfCagoFeK1ld4pVsWDrkTT3x6K8yY+etCUvrJ1qen9RslWRTmh1hQokjZBQr1ZYOBqQiKT3Sk8LJySi4lHbDeA0H9HQXodTvcTBmDbXPWnvhxp2YJeQ1naxepWVEbZbqMWhf2jBM2/7oPPHvY7MYf47UywrHzQPaEwzofyolgprOGHvu4/74CcDfZhInXIqMn19dnqUTZ6BK97oCvaKrKMzRmvMJUbt2cDKRn4v4cF/OcaxfOpVG0FnJSILlPQ0tjXSwPJEmzZmTFprA8fstXe1FU3r61upllNxjE966+Z0j+B9Ux3bmWKZAFjSwrwXqxTUnpr87ZO2WsEmkw2AB8mK5Cw7gTiOAWMH89FoOhFqZ21fi0hARxUua+MeNwDGsrG9koxzaUXI+G++bY34+WfaIaTG/IDVqGXzxpKaBYpjv3enWOSs1lMNtIyYSWVbpfBjTShrw4ObkEhWKjnxOb2MqatXKz/bZDMXtU6bV7CVeQlno/ryMUenSiUy/pYIHCc1mY5ePv/X4CsLQvAqjkaOzK/uSda0reZvfpym7AhiufNcO4cMjcMiFd/J3aCxdp3h1cOBLcZRj50pFjwNqQJpVz2nBXpPP2wrQCnBWiYyQ56np1QtCi3HalnJl3+2cl1mv+C+v69ol42mSvAfsKfQEiV0bBOL/YtMrbB3kfEk0pbzt0X0mI7CK/VSFk7Ro4wzYApZWVgBwWrbsTbSjr/ziPY7apPGK2+rSlS6zBDLY/AMHB6WMbU9PeiQ584UCx7Y2MCyFxbpsWjPusertCen5RC+jxHUCC4iI6v4Iskgh5BFGWeDi9qGNXv3Y/Wm9HtX27O0o9k2oH5BdaJM0a4b25YvZWLD61BzdexdHGlTR9K2M1+AeDqJ8fLWOQej99ZkC/Swrb8oi0lbBKGEyBqZI3u2/R98rP2N2gXEaROk143H8njZL4IyRN/XbhTLdtNI+Hw1Wk7MOnVrV61Sqr6cnxSuSF2IbEczu5k1kPi5lvzqN5fyzNi5rN7U/B1XrsVHygx2N6NYl3UWA1Mlmp9j5oCt+SjWnC1n/B69z4dP+IC0h3Gg9mWUMidhvWYbVQrjtuVQ8zE5a/MJy5yf/oatm5/+8fWUtI8xfa1ReSas15jA2FBaA9jx3oliMTUz0m6a8VMPqwf4gGWATT3ANRzrHV9kJKQRWuPT4f3YzlpI1jLSxlDbofz2h+ngpbfS7C/vaJ5NGxe012/xhRSNbrqqROu2s+mUgUfOhhAiuuVzOiVjVX3aD3jw73+xmYOh1qsziX7uPz+nntn9TdV4TK5NCllWDQrvZVPshpQibY27kqyq5+F9WomqnuJICsZ+xplWQrBJtphSeoVPgyl8+ryPrViRAFeJIL6CpARvGyCkVBOVVrFGvUqu61BGsUJ2jvQQEiuoLnsVhmVRG8nOTaDkYeexqoXpu9rDd+H9NEWxXn1Xjdz3dbiHqgp2I1vvCQbENdWkrAUdlORQ2SWLfkrvQLiG7GwW/oG24O/t79vGiAF7HCk9+G1qIFhFw+oyrCQJ6g7e4iaMJUka32IgeqKdTaR7/olWnurjaarDDoJjOvsrFhyaNINVHP7jqW9WT7jPYGg+QtaPEXa2Z01+oMll2QmKto0iRUxHj4eZgkgucJ/AwCAojLAUQ1Xd7A0pkfbtzaRIU43tsDl0ocM7GKn2EkoDiTTUUSriYWCpUgpQ1o1na+MAqiXCc50uM/2d4n+qzLv4cTr/j3+XxjpohPVmoVgZK5jNrE1l8B+AGbrAVzy1QFZgpWwbazvZ4AdPpMHn2u7/ovYs6sASl4+/yIhcFi6j6+nTX7GgRgK60hAh72iXZBbSNo5y4w22Rn30rQds3x9HAxUUZuHhcVsYCpAnshT2DbjR6TjbflRXaj8tLqv9RJUmhUqffpWmaozPXn8vTVXlTV9+y0onn0vTlIdlUiYeChUpMmLBqxwGlrkODSMOY0RfiSalHSsLpExjLchjxzaL8cquosDL23DpXQkBL0Nb+QHaNocGtkGzy5om2oNJngy1vHnwjs6O+Fq7fTjI5JRML8WKNJP6mLtzOTaJchg9MzAhQxb7a3iBsxRo2DISvMhfbKzJLgpzSILARX4ZtUwyvqgSP9MFyOBhhE2dahvNVS3t//ntNHtZP6q6tz70NtVnHMAhhdOIdAi14DV6+mQyvUhXw6YTqufSDJTjIOAFhmmPSaHnKh33f/GSFGyc9v7uaSkWswzOOaCYIOMufyJj6K8Kq+F62WtCHCanDsXwPg1U60gCW2KjvYo2Ih8fUy4Fm/T1olKAeimWQcOYpbBY3CkGjOdgvKAWuA7iGOezFNj2zg7lWkpFKao4xQotw+liDae7ClQGyr40qjkySI3tGW0nxms+1BCBFOngz6ry/qytUlKwhfbj2Sl7lGauBU2VVqUDKzy6lz+DfgVWmAkeSxi9Rs3TcS4Wm02H7BF8Umv3+chsjMuxBc5aNoZUASWsUDmuJbgSRnqo2rvI4DTnXNixSnRU1KZcZYi5KR+9FAukhryisJZQDrBk3Hpj2ntW5yo883AaaMtS+fr0VRSlWouokxohDD5IfHzvzpcHLnSA2VxnHtB+2lfJdKBe2lxVHr07qsKkcamkBjW9O0oUVxmpljEL1sDrdp5VkHsawTYvBFij3iH8CbN8dMBL0afa/5e0snOss7GGl7V9XqU5JZglP+Oso5+6fUnOkqCGSM5pVUlifO4Pr6lkhxGl2QRd2fGTcwmFQa9+9FIsotZI4xvG18kHclz6aTCOg8zsfCrGdDR+lW7UaLQBr1aqwnhNKNDyXuWvJhTV3fzLy/bVzTWYOdNhZlP16g5U7dEon7/9gao7lV76I/NB02q3iKdVqCG5ibGkESEsuSrBw3qW2lTKOvSZeowjdRIG92iJkBSrwG9C7JRgOeXQRuSVR+QVS5bg1eYQ4T/Scgx6vRXLcYtSEIsqMBONzLFgTni5TccKafSZcZOBRqX5Oom8qqQiTsTP6Pq9GNjUCPhcinRZu1MOtDN4IUWyIxkZSlBJQQ/NDqAVAWh729BYcRqZsLVn8Da3c2l+VuQ07KCgJoOsOEUcAiGWhTfgpZQ2HvgAdMja/C0NR9zEaTj5aIAKPqw13vA72bsjYRGwUwvVS7fD6bTTenb7rWn2qXrGKvmzGOxjdLqd+Ecws6FigVyiK18j2DPBnGMIZMhxPGJ0xHlPYtwW74WkiFIZvDdjuYm8UEbRu2NQcv9fn0/TP0mxPkEw7Aj2/A/ozF5FzVWgOaAsGKy46SJR7HX81tWHYYB+oDLllIdG9qmq6UwkdWoiuLEEtzt609Y6p4a88mjIqYcXtAH2Mh+jzyEGfyGZTbiiD9PTZDItpWpHNaHrQXd69Jh6gxpxZt21GaLXPzkN3kN7PQMeNNhnqlL2/+X5dOWff6ve3hvq6alRzsSqMtIylVI12BZxL4ecFPExrl4Zs6UNu//MV8oVbFsEQuVhfgLI6C0K8I2Ri6o3e0KHI7kZlFx8rEYyXfsu4ibyYUEV1AmsQRv+mOtUfjFbwEIBkxP+mffjUNlAsYS+VqoO4ZoHq7tVb4/18671atZKphAcCe2CVogLPCWAelwLLf84eP517QB+XdXfxxo20NdG9dg1hrtCVKkToISEAkZUh+apyIVwhBKhsR8RbIAGQy9UVbcd293h03hoUG7dVtgneRr+GGtuc6QJdAoF/wQ9VQVuQ442qwqhAiOFiH/v7lQgGS7lswE4TkX5hgbfYmVoibOBJdNbigEdDUIyBmUN4g/VVeaAflP8WiBNiWFM5+IDtPzcRDnmPuFyiG7nJKddoKQcSgW+EUqFWwCUWgaX40I0w0KxikbIdk1OdJS4QcxWmiq/xqoO963dR6ocmGeOthGvm5VYwYneLiwXi6kXmc2Je5qM5cTiAYfKcjpx3sYVzFUoDreui5D9rfmj467nnJWuNpWdcFcwVjlnfooEfyai+k1gRlisOTzAckoJ7poSs9KOyurgxUMWBia1Nirx43DdygBWQCv/wnLtdxx7ZtY+iMK4I+Ice/LK9nJqdsC27HNGF2YtYx687rlZiQWdzFSMwNeIbdCPolSTrSP9GCC12xyIB2AkaKUEa0xuXwLHw+LqwYoCBlwllAXLnVEcmywmrpcSNRYXqOJl2n64ruLkdtXQ6kL203ksB9NTeI1s3QyAgimqSGaBhFwMlvACn9t54OGj06FpdoqzeM+swG7blIAmqPJqw27gMhkE1YrmwkbiNfVGR4t8U6m1+MqPosyp34CKg7Y/m77RkbdgK948poYUYG54l8ZEmBdDePQ8MDVwbffQpaflc84tAycjI/eARrG0L3Gg8ZfhrTGcQcA65F64mz7UINj5rcy5GhDcmA5gjl9D1naPIxJSNFaW0lseM/JOqYVZBewh/oRch2QdfFK7KVs+4oCCgJLLevLKOwvL6duUTn/F4gvUPxkOLSZDopkc6R5omGGoY6RHjF3Z/kAP4eny25TLHLMoVY5vvCij1JsZM5n6DTU6LaMQhf81ggCHfjlO4SC7A87SA5hDFzxgM+5NI4HG3ZiA590ywMdPAXxgXKMy0nlWw4frrW4ei+OR7Igk+3jaNFp4T+CwllOmE/Ss5olESIYj5g/VjOHyqqiVIngT0v0Vq2CtRVgJAG+rq3WaMVqf21YRLQ6lCPdR74aKxNE4IpsVXf7KqDFHcGvx4ECrKJwbxLfGGACh+hW7W3FG/DWxAyDDrYVaCrBZCB0ix9kKIzo1tD2tRHBQp7sUbeceg3O5rXW3apycf2tleQR3/dtY+Yt1BQly0XdwKjDD0dH8grGSG2RmRDuCqQhuwBtbjYROwuQpLbV9XztPfv+KoqFUoVjEoVRVtsnaDIQGdoIbVcLqMSKba5qRCoVFcIXmKKtVMU9p9azOb6dEt9KcJgLoCpng+yhsxw+n9O1SaSWHaTi1sWjO2L1CItUK34B0f8USUhO8KJlyIZEiFCiKZX2FI84M5eQ9TeucrmmIRVOLoQwOZRtq/IW5ruE5dRxYv814UQPuGWgcdliuGKzBK+/TsWqpkA0U681qi9m5i7aDxz4+dvScV7Vju3qoQMQJuXnKDLk8lpHiE8pj6/dZu88Zp2ovu/9ynD5C6a9Yqo+svSFq+UNvLKJNKHNPA61oGGh5iF3F1oeDDWBM3iEF4nEnzl2a69JitdGDd6eFVjUsdCfgYu5nFBi8wOK9AalTBbU7DTXaPtXE+EIbRkd0btR7Zr/f8AGVYGrXMK+a8pifVf31l3G8vO2dhoJeBQNKZfknO6WbtzF7oyqA/RWrRFlhsZwTeyziu1WXId2Sl+AaaGF7RcTjemVVYdxMDU56hmNNSSy07mrGyDbjWkJtUHpsg4ONOGcqR8tlZoy7icepNpcMY8vYg+ro8GFQ8jJpL6XjbFG72o7TY3ZlEBYFg/LOLgKV3eQnb96bmv6KVYqpTEK5ZfV1UCVcO50TSsXv1KtC0RMJ+5D9YYygNGTE+Em1tTS5O2W71qfaIJB7V7BnfGa2r8qLiy7VDkwfa92Txoxs3IixI3b2qCpk7IhVIJNnvqkd4s+kxIpbfSyL87lq3BXTFAy6WZYfY4NoVD0iuAkb/RWrD1ZOllNxzrLX7shyn+hHwpgyZ+WycsjVZph7hzNtKh1wqdFFhKK2loKvulKRKFa2cmWvrDGgag7CVO8N9lSC6Uo5NsTSzhir1GVxJDuavOQ6Rucd3JXpVWqTfypJbRqO3d0nMBspVmFOFgoo72UEdXnaoCUNUTVI6fVsyRQ+pDamWrRXNDM/0sZSX7AmHvY1ykaGbomHTdA6D95a8RF7lQNlDEWhWpGx+EyN+pdn6bI2xE70gQwlv6Ea9AP1sFOcGbYJ0U1hESrTTPlSgjKwHXx2a6wj8PdWrJKZxeKYS8ZlxuxibjWqG8EdwcEJgyHLWnoWE464rEnb20cXdOffR5qYlmJZ+AlpnEZ01CoUDHwhN1vSrMsu074+gksqZVk6LTNR24vrgEc6635wTx6lt5ATPgrhZTwD5geRJcd7h0Itg/Xy6a1YVComjmBsFXqKdXVT640Cq8CO4xdk4aJrQonpkY7VPmHFg1U9HDJmWbgqVhfLNt1wH60VlQpix9PD0+VqbrarTVm3/1G6/L//oO1j83SedfIMqJ4wo5dSJ4Kh6g1u5Z+1/dSIz/Scu6XYR3ocq75yoazADTMUp1SD2NcCroh7Ui/Ro0czekIj8doZZBPgsIBkYuDrpDROPT7MYbxKt4zWIbQLXXg5/Ys2g/zpgm0MYd1ZbE9z+JM/V2WNKROKlfPPuFsF2IN8b8WKorzQsQwLwYhS1MEoFL9TNkYO4oWBZQL0DifqHTIab11m7c8m08ycPkvLDKz1Me4V6uNCiCp8mJxG+fVZSP9pewmMtmFeazZl2xqn8GkZ9qkaY0A0RTB4cYtcVIl4mhGzkbfh1ePdW7F64Lo6BUOtbBrBpp1lt9ZzkZFuurCxNZg/RCH7pO3EMCWjakzh6e9w2fIfNejnGp6Yah/k9BXtNuKQ2hOYWkyggVah18VrAWtDu9Ar3f0Vi0/pEFqu96KBdh9Dw1dy1/Hky7aqreMfTmsfMM2jNgk32A8f0IH6WnFxtZUqMpU3IuTnfuHjKcAVxmoIDVHMpVQL/WxPZARu621M6VHy75AMP4KH/ooViA6jBUMziSQO0jgMNvCd9A2NoIPy03nQgCM7sLn61m63OCmNU4tfqU62UjkG+yQEb2trYdHxADOdqzB9S3sjtVJ264b8Yy+B8rBRruNR7a9YWYstH/XwgW2JQPYiDC2/5LQ429BQtP54jK2KZbRXBZgfXDgviZF4tbP4jVhwaCHXysOlBae26lVOZBktHcQWomMd/0yHo021RZ8jAbZuRHjBBD6n7GB3FT8W2f6KtRJ9rgBzznEYmQlANyEU6ayMtx1PzzLxpJWQnKg31mkqvhpSA42xhnstaSXiiOp+bdTeAaHilFJwW5sI4w0vetFD1M4jztmysyaiJqijbWrP6FdGQ6OVdwudtdos814JeaRnf8WCoazBLpLSqjIZWMlFMcq8mE5vae5uOZKHYwK4Gllks8KP8zRUI57pkCErS+/VtMhNWsbD3BeZWQRbxccTpYpAnIK1n3nzOL6x2At14wN/jUqB1jPMilaTo8SwDNZBcXMyXJPYCxblw/qJTZ1+RwZuO7mQDaso8QlMf8XKqfE0dQWdU8peOXbNsLVdg3s7MR0hG2dsrmD1gAYXRw+rEa+LNW19/CEMWYZ2wrup7ARv5HRcofxdanUi2lSLK+rHjag2wF2KTUhlU54tviT/1J5j1uIE43/9FYu06+dfnTNjX5Q8CTIeOA/KDofVtIQpVhFLxf1pWTuiqkhFE5jJ6clTD2lsywdMy86ZOh/hPf9anMmzbj92orRA+znq6k9StGpXbymM/QyJOJcg45M0WQtuMNKRQzajoVLPStZ+FDeG4vhxql2mlThOE8mYcHhsZvorVo1XUnZ1yqVySB1mPhdjKBeN+PCv4x7TDqqV6FammQzTj1UP39bVKprmGdziN7+7pOC+jbG4KRnsPyrDYzK8NprllEjEu06X0/Yk6cmpPWx5VzpYOBkj4hZ1Lf6+AU6/Ba08m1vBoPxDycw4N5vS7D9XCH7SbUWyfUuZrAJyWGIhmw6p5zdEsXZlctpNVwpNVyw2Wox0vBFnQVk7a65SlSLB89CaVrK6WapumnTW2R/gG73Fo9HJ8gtSToFSCqZw6c8Bbam3Lbm+V5tT2IVUlVbBcyR9I16IvCIivcGZTjmcaYUFeQkflNpmgmB2HvU6RokVlAI1bvezbqpO0VtkxgpTAXqCd5dqH1SsKR+oncWKh6GuWRvqaCWbJG9roKOKnMZlxDzLm9T1oXgUjOdOlPZA4xN5tlRGagnLUG1EbvPg4A7jSwwF/FHU1oavESa1zJxTEJV/dBQw0axYi2tNQH/FyqnJ31RJpA0rRKaIMSZMOT+cSVP4P7EQKsYD31qcAMQP2hpiWKhtkrTrZKJtYlxjNzivDBICB1PbRXBa0wm0/wgglDTZLwfhfRJj6EEebS2n1/DhknVfVE/um2/Seey6GkY/Vm5syzhNcUbP85KUqp70DjlsSLy/YtWITfh4wFJjTOM581O/pLNAMQW0AduJzZcmi7pm69kgwKoH2lv0Fhu1kjVL1fismK2sW+EX/A2NaHFlTxrqGtjlROPxUzpqUx8FHZGuaeIrJLSjC9THbQWDEHB+K4OxrGQ9YVNmc8XyBkAllMw59b9Gh2fva9MAh+dzErEx3CdlpwuTv3drksDuUBs8JrqJYaSR+IUybA6v8VtF2vgm21TiCUFZTrwKtq+f6BlJ4Sxlk8kSjdCwkTSj9AZVBY4e1PUwT0qpnvimXWhZT005ZxVhR1F5rLcCWsCzxfjCzn2Gyru58tAGuoMQ7w3N5oplBFrsmQ+0rcTS9isORFtwkCx7/E440NZKj8gemUZgqsadyUYbFobaHmb7D9mlTXXIDhiDyxiRLthJWmXCGe8q6BhWVCqnwegFioydtVDibXSfSqrvf0s3z37LVmrErpmAbr2Py1gdj0FXpnGUZ1ZiqSljx0KJkJelLYq9HP0Vy9Q6Z4L4iNKzUIFRDarNmZFXHU3PwgZKOweMFfjjWCAvOvnV1YG1GG2/oyamOVOCkmB0p7ZZsfxWGNAt2mI5uysclHsSK+nKNKvAjayOwvFldKCUgW42kq+dfXGXzr54+pG09w8/SBPdw0PnowYL8OO8obkqpbbBl2M3lW92p9BXOmGaNWHGpHO6KQ/9hxsMs4jUxLqps+kG1dMcms8+OtXXo/vVM6MBXcmwG21jNzxsgk8rIgc6a5MNohMNPyx0GdPMLg7ornESUjQpkpkZ24TUYWlptwzAasK0NeacPTFUSTV66mFdWvm0XfDELWJL9zl2CTRoDpWJU+pEzgmj0W4HAlMFcnsHh9jJ1Kgzqx0E6539FatIpWHRC3Znge/Rjdol2r40e+MD3Sz1ofb86bwl7aI5uWnwr8UVIDWACc8laPsP1c7ibpv5mxd1/YmuVaNlQ7yoPlVyuNVLq0hjk74aeT+7ZVCWH1WLFf5EzTQHN2jS/LGH0lh3DZ37L99Jk2cfteERxt16jbR78oyZEEHl5cmrWLVSWAABaxcucFuHfrSzWiaAWp5HO/or1hIuZYD8QvCtYM01TXWT1kh75caPPtAKOrEjS4xXnWartqIYq6VaEaSnxYqH2bsS4K9fTov31M7SCgK70FJwdVrATb4bqppQhW8Ta7BkvdWB6Gpz6FDtqQFnXXBeqw4MmfxQF1n9zRPWWC/7BjYhsgpWvBvtYCDD1ElifpDLyPnZLfcRoRQmqxAf7tdfsfjMyMrMUcNYtgXjYmauSWhuhJjp4oDFj7vVzeEMrQ8NAg1E5sj4MqVYBmmAsdGI59hpLakZ6MwHO7KRL5TlKVmt+Jr5ZOYZ10lKqhZxk59wk1m6as5OoNFHN/nRU6ZUTDsNdcwRxwX4Zt/MwFFpahFZ7yBNnlNNiYwHcmM9/fRVXVqlgsAuAxUaI8vDI61HvCakv2IFgiq9RrMQDosAdD+f3RLxpg7z55AOue1YR3Z/nLJxdjJTR+DmNJWkqR0a8WTi8PXb1RbU1nebF4P/Bg+2SFGNNvwayDq0Y89IrJ2kzoKdM8G8n9p6drIfY1Q/edrGquweR47W7JiN6HXimrNi1NnJGHmxzImlOHS2yCu2zeUz3kMNV6Hs49dfsfjSjEnnFE03Rs2Ze0+iaM0GpgakUNylPNOZBSPZ7cylvKPXMZxYZH3S14ERZf0PNSF9TuND6b1L6UAz+ZSwoUaUXILISgWPOd16GccEm0Xv2uQSqYzdASdAa0+xCfQ2HUinCxVGulvIVrdyzR5DICqhuGeIy8ktSo1zEzs8rUFQs5v7Jp5PfFAoFW1O7r3WpZg2RATfuf3n8tiEEYftr1gFd5v7tisDMXYlzZ/rsPyZiteZjnOkK20bGxShJYNI9UpEheipWfgcaMSPntDSZQlzqtvc08eXhL/6RjNPwZKH5A8JTgjowESq7KxRFImt6hz0qxJqeKfmK7Wxg2uLR8+plGI9Pmeq24qLjBB8/IIo3jIVKXNnsl2wVrwOCotXY/KUqMBSJ4sGO3m00I4gL62cQrDSpZ+RHfnaQLFEKqgpWSZsc2c2IzUq2fC2oSF1XWfPv5Fmd2nB3d0aO9I5BBR8dOn5EiLKkVyeMgAbW8dao0VpOvj582KWwVJ9veLNeZIFPrNHLdyGawMwsHLKoQCHOih2cKMUV3dgD6VIjJ7bMmlNhA84glFzfii2HbwRiHnzW2MCbFWwc9GEtNDkwChMayIGp7HG6fMX0sELutWDYQZ5Wv4IXRNHji6Rhtxa2waK5WwVGlhyKtyKA5tDoDhsc59xAeU9t6fFdx9PC819ecNUba0c1zir7R69HW5Ap/ig2tHJxdx8NWT/4QVdecdt7jY/5qkp6QhJd8nDs6RP+8lWUWgcihFylIYVq6PHpFSUTGzogM49UipO7yvGE201jmjEsIItSwJvgXML7pZoWo4GpkSL8OJRWViCrA4LNcr0pTfTTNfv2WA2VCtCjkJP8+PR3/RXLOE1QvmRq2BRilrY2QjSCGiusxMWb7xnlwlMdGfg8EutLuCYHI7ICfDN+A30J3qz/5ATXDjkzA5s05lasze0KZTZfcMc5WkwmdkVrw27sqFUGjLgXNGxqlZukrUt/ijSHTpATR0FlI15Puu8VLEhU7BLkXydmzxzUUFYQwvoyl0F2piUB7eekT9dHCBFqeyCK7Wt2Gk9u6Cb7LkuRsZU2hpiwV1FrEXhcEd/xarwBMnwapPOSSEBzD/pplMu8ub+ZdZEcb9OuvUQsiapJXEEqdN5k3mcXsf+QwZMuShT26x8U6hSs6KUsvy20klKgqLQdmIMimpeimRbzVAsraDgSlw7XxR4OO4KbLXXUtpMrm3hLsGs9DhEfKBjTTv3Os7YYc0l659rqVNOc0R1lv25ksYRnofkcCdmRcOJ81SRav7erjL/eOQvDwDWZ+3r6jfaNnZ9rc4ojXKu0aMg4Ng71E/BuYyfE4In333UrvjlfNCkO3li0rwRdOZHRYAdkKYLLJlqGemMCJbhYB9yvQslE0MJnGYYy4hdQrkQatIFJ43LgIrudUsgSp4a1lKBXzc5ckcYwqrj4K7N/BNdbvXvr9h1fJzZaktqA9+hMWssh9v7K9YqPJmZtYkgHMXS3OFMdfmBGu8c2sHumQVDD/qiMTZouAYJKNYEWdx+D2HJX6Qjy20YzgLVEMD42Uc0NyfFou3BuBtVuCbP2Yto7Sd6eJRQbN0HnrPlUSw1zjm1GWXKGFcy201DKz0Emmn5try68XOE1svXn+FV4elE5LwwtncxXjX94+uWJ3alsWEqjLTxZleFtRW+zrGBYmXU9pIYURhhdd8s1kJdFuPTmZ0zuq25uZkOR5vpNlS+8IH2/Q1udMWKJJXomdsG/zr2+/oLc0FeLBoB17QK1aF6bjf840/TRFvyr/z+1TR7+yO7tDIxbKD15ow/sdOH91BuO8deQwVDBjS5klilMyWcSSESA2tGqqIX7C7BRMAx3sKFUkHb0fLMNLuktZCPMavpq++o0a7euvKEkXY+ugJKUWgNtPBZwtqLyQ0Uy/FlFcqJKEloElPIwmB2qK01/+JLjZl8kA50m3uSgk1op1gvSQnIaQA8ivhuFVDQntASLEHSdr3QiOe0YubuxNdCDe4Zk7HsrWPN/P26AkTTQHtqnA854TiqOmPQGfdPjORm5QoeRYwWQdA075YjAF0Eq4Kg0PV3qh43wuLdYKxslNb6Zy07vUDyYPbW+xpiUNvKwJSrhjSwRDqkrEEsgiq0h1k3VqxuKpu9eqIcxI2ZzCyJkkHoM1UzV371UpqrDWIbHO7VvBhLWmzlOVB8dcArrr/wPCXjX3TgB2mhIQVasABQyn6OA2X5illHxhSUFM8uKlAbirlF79EqgVVGYI2ku3/loQBXrigVLCLkl0zg6UKEPxG6Ye6xBiJkyJueoJbFTH/xYpqSBxpld1lI/pS4+jMsufQKOhQkJW1LHK/32FyxalxG/XCyJckCs+EHTU7TG5s+p00CasTTVU+2rKZJSiEB6vAunie1ZI7Kpyh8DD+MpDRSnKEmp9sk265Gyoenu8tlpurpUVTD2kEdcdYlewm85dE4zFYhoV21UM93+uIb3rbiIDe1I5sYTjlSFFFrEQVvfd/9FcvLSn2aQR4SzfePZtdaAJRBWjzZ+BJYqkyVqCmEg395QTGGae/vn02jWK9FhEitRZb7FE1Us0ZEDivwRcdIZro2RxY8tGgHQxFYfckV396bFIz/Vxg8nkksyzIwBVBQCHe8K/TuJY/I9C4OA+hE4B7qfZVSVzTLMNXSmLkWOVIiE9fKKvB5bmVhqBDI7kUmtJJOMLji3V+xcmR4xjCN4fZOKjocRCjedm4WtzR8qCL596/bxdZjJmKpZphXU2PZcNtzOw/jo2hYcFfkWVkyfU9k499JX+RHeR+ZgC6C5XQeChH81NGaZKAhDa+sXGDMSsp08Ju/SOavaaWob5Qw3TZhgCgjNcLuWZM5lJ+aj8reX7EoqaBgVKRURjnaDRmjwkLdCq/V10lU243ytTZavPZOOlCbxpbfsixXN96n29QLq5g7dWvhz8Xmpex6KiFcL5uWOVv2IUbXt8FSh9T24GCVH2H4dzG3YGtHZUepWGe1/4fX0/7v1NuVzGk/WrqF0Dizj8wj5VaWUWzSHAgjHXB0tOmvWODqpq4rRJiFD71rdtyeAxS4mB6oR8LKh3fTgVZyci7BZG+kG1M0/MAtWLy3bIpSBaPr6Fn4IUCRLIsvxzrQnC/5O1tH7VB/E/86/HXmcIYGQwv0wjUwffD/XlappVH2zz43pSLtUQB0ioaK/lpCFcx662aKBR4T0DJRl5vYlMXtmaiKttptdbYBqey69Gk6+MXzNmjHNSlcPpA07TO4SYq1TGJ9KqqQoBXRu+6iUD0IBI4K/WrroYCdQBjqeLUEVId1mVfUJnoEBks5orxNqd79SMd5v5r2f/abdKBrYGyE3eJ34oVT0aO9FRj9HQBt36NcmyvWURgVXssmwJ09Qlz5eHNL1+y9D+zc0AMGTTUSD0OMZtsYEr212oCkkZ+FFFoKiwZtiVLBF792rLb3Nl2e9ELB5aHkhKVSGQMiPciKBHfS0XEWnDTI2Wg6Q6l+90ra/+VLWhbzujaP6AzTo/Z3Zj6KPBusx7JtRbFWcmJ1QCiVBJrd9KJmH11K+//3j+qtXE57uj52cp4rZKVoaoM1RmK2VK9IekvSZAZGT/5bYQ22q2LLrNcsub32aThrqqymnAUyVC4gM1pTKrZxMayw/08qqdRgt8Y6SuWN4oiy9ffOFMsbg5GeEIXeVJVqzE+1bIWNoyyGw0yeeSQNqBatzRVLhSN+9XZJm0dgrUKvOesqFSpJUAJKGrBYgPsUmPArgAJjiTFtKpVU0xcvpH0GQVX9sRSIFSa7ViqEvjPFanLYJeJykyJJUJx9OV9ok+S7amz+r9/YNu8Bp9UIiHv8/CAPYaiE2eDr2gRkwveKJBdcXaCr4oatVhKKRzSmW6EGbPLpcNuBatpUqv6u/M9fpxlK9d6H1km6GkoFuztULMttCQux5PIrvCi1dBra/EvNZb3uB6syJ7fQcZNs3uT2dzsfinGuSqqVtRF9xmmva6oebLHuyt9KAA64bnlauiIEh4nPfAXNilfGqdT72//Ta+nglyqpfvNnbcZ9Txc86UNlF47ha6rSHHXrr50plmr5jsiyBmR/ZgxpbyGQKV/bP/9Wyzu0yUFHTyZt5GSpL1NBLdOg6HjTHvMMaqrg5QxrRdqVI3gWO8tqRAnuvt2OSDcdQNkOZq0WYUjhys9+a+vXF1pTtpiptOdjtTTFc7fKtRPFsqTpgbAie80PN/4SAI15hEfvhSkHtulzhx/jWvR0Jl/t+zUmzOXFqogVyuDrkoLKCoCr6WWJttTmTG+YaTh2W+MWTHEgLMnoa7WnuAaYEXUt82EscPo7NdT1QVrVZ8oJ7hKxIbQj204Ui+QVmZIwaZN/P/5VlfDwBVgKNvvkUpr/25/SVI3SPZ0FwfbzvR8/aRdz2yLBul4wGoEXIm6sNsR69WTsjBQB6PMRL1FLm7dDOIvBZwSEGxgURteRsJT64FcvS6H+rGkatac00Gz3YEtmLtccKdMBVY0mk9vqayeKRQq6CWuKdk9fV9FUdNlqiMTNDNpQuq8SbMF0BNu0PtPRiQxHaO1U0mUBjH+hoo4j8Pl7mXL4X5136ItRl4NvI/xaClALjJWfnLbH+aAfaFD5xTfT/r9qQplFia++bbMYhk/Imk81I9DLP66gspt070yxWq1OE6UnPIZAvfRuVMMVJQuDM7deezsdsDBNC9Rmzz2axj/V1nTO5lSvMd1EC63Oid0IbyMqsGcNJ6Wp04CqOa+zP/y5gmSuk/YOtEhv/xcvaKGeBj3ZZEp7inlXGR8XzIoVVaGV6MJitIGqsePentmZYtUlkifH+yue6jqBRQrmacJlbvEzrlLRFiVOm+OAMM500nv0uHbFcCKyVn/a7hnW0dtu2YzTENT4r6LdeNFjVf5mPyvBVKUxim4HdGjjA+dgTGmkS6Gu/OpFVX2aTLZzrNQOLSYnNJS3+F8dy84Ui/ZByDWUyYptldMWkr+yLB4+wSyRJhfsHHIa9ir+Z1pjdPCn1+1E4cl3dASQzpYaaSs/wxKD4e6StUm2lZSQtOLoYlCAqj62os3feF89PjXOpVDTl7T/T8MKU82vskhvSM+voFFJVeSHr376h0S3d9ilti33TnPAZRnicFd52qfayNsX3GWlQ0SEs4tG67nmjN/ooHuW1845PlpfNSfRjThog5NkdJqLbRbVlNBCGyZsbfu2JHgMvEjATLbQEx6wWVZtyLnSxcK8qTY9sO9vqm1aMynVlI0PuivaPkYiS5Eaebq7fIzC62G8w2YUd/bYmWJZ8hBk/rI8hZFoVZS0MKU8EWwCIdiEn3NAL7flFhUZoZ3WB9psOnvhgh9frU2j46d18AYDq9pIamNfOibyWjA5FZ7r2UE6Gei0bWfaxLGvcxQOXtRF47psfK7dQgP2/Wn7XFIphXAKjspmaYsSHhmah2F2XQsx71AIO1EsS1cjkUoklefaRK+HsZFnVqSy3PmiMuEdnfHE2af6LT783A7jsM2kGljloDObGtLVvqz/snXuWziva20yCFCJa4fGUjpxOJ0m3dnqjlLNL2o3Nku2X3hTu8bVUdEHs/jsizQ0ZZKS5C/u8E5KKJXrbuEFEe5YuXaiWJaunLBGTRobAoiSqggjLAQYaBteHXCDsLIow/hmjXdNsWZahmv30LB9S/cWjtXI59SXEUtytCMnaf1XNPIPy6zIjzb1YK7zLsBhqcOFgWEDTcGg/FzHywl6i9d08uGb6ulyRpUO7mdzr91YbyUUUzKhE304EHQhXSw1Ezuz70SxSE0fsaxNNTKqEOA0seEnCy8KA06LmXPir+2Xk7roTC7OV5g/oM2yOil5/AaKpeqRS4+iFOPkGVZQsIeQDarMR3LyH6tYdXjJglKNakY/69IXPkQQmhBWG8kuqGQ9FCsNaAPmn1Vz3FjKOJQOeZsxFsUlCzpBj7XocykWO5PZGjffZ9mwTCmdZDePQpTQIwxM5WhHQG4zeGeKdeJEdEquRtRe/Efvx8dzyHMJmI2yXBql7U8DlQgHGqW2A9E4Z0GKZafNaLPqgD2FGq6gwc/1KLa5g23zKtUGHAVA1SlFcyWLlLhCcUuWXXfL1nW1+RZfaE+iOhLzT9QI1wZROhdzXahgpxvypqMhBRsIlnbTTFUiCx5RQB/IRCmUpkig60kQvW7e149iIVIJuQg8ixh3ZEhX6nZ98L5KEZUESWvsI48GY5VObODQbWBzzsfScUaDOxvFsqOHbtGwhbXHXLFKuywyHGy2YlPtJc1l2si45jOtzaRr9dIlKRdKRQmlKm6uQ944PnOmwV7OUR/lxvace7TFOMpUUFtCwhVcd1N3bbuvL8VClrmaCLH68da4PGOikevdIdVSyrbIIqAsmxgnYjQfhVDGDy6MNSwhUTA0QXVINchAK0uj2alNdcigq/W4qowWLwMuP2QYJA9qWoeC6tCqRLWpVBLZ9SHQolSinaU/Vyc4gnOM8GZlq8f16vHOOh0W5Rp+jCsxXcNstlmD5xAy9tpNiFWDOUoT3sRACWzsiPYYUyIKKvragBWi7uXPGrcByDtXxoakhGclMeYCU+DWm2VEhFnnA3v4YccAq3D4DzvW68VcNyVWaTsVDZCIlXm2fkmZQD6YMbuyOsMRr1SfyqWocFCAkmluy88GDzbP+FpZCyUnZ3TCj3fYa5uBuqJkhXNlbGAiWc4rZZbw8K8A+GywZlzX+Ou6UaxajibklqQbhylLNyPMM0JqTJWfUNBWq3yazMRT4flVI6jswUNgcNVx38bPIuApDaoh2pQrtLIG5rbvte26fhQrlwxe4ugrtrzKX7bs8aXjTUYAZ/knQHvXKuMenZyRp/+3/J2OvISYaMsK4L61v7FGBLdYLHt0QG2VayHg/DbAOX4nThN+bduuG8Uij5ovHGl3ci0yKGeEKVrOm24WBGj4r8jSHHR4rkZo4AmOjLtwRKABZ09eOXLw6empMEb8eAee6+R93ShW9JiW9Ck8ou0irbG8UL0W9+HgMdD56x5AeM4t2mg5o6ytJrs1qsOTsFAAg5ND+PGKX+Dq5n+OZrEChztgRv96eSmrz0VuV3bh9mCBBIag4LGvl2fplFzrDIeYi7wPYRgdi4zmTZWDOvibiALIimj2jCviZKderkQtN1E78MvxmhgF2DhaD+nqsz68wnhdWK+fEguZm8LIQub6516EHL3AUJjI/HjHd09JgF+ThQox3AGZUToZc1gIRYmM22WREx/zzVHt5WCALhsvluTvpRQAwVesTcxk7B7qsC8juvZ9rh/FOoYsc37nmJ7jMWzRQifAbtlEGecGLF5FmTsjJdQg2kQ8yqpnBuZlUbJlOXqBMPzL4auQX3t+149iZQlbeSPZx5cego82SSm5JOtow7jYAzIyITA0oUA02erwBSqqTgCy6WJ0TcuKk2FKIRWR9A4apUQyRI44noRhdzeRI4XYr31z3bSxioCLxYXbcbYl3gks+Sf/TpDFW+XXICT2kiplP/kvRV4H32B0W8RtysguxPXovn5KLH36S3mXJe7+a0IpMshjvWqIKBGaTGtCG1sTmrttlUe2riiSPP5KLK34LThzwGhjMtvm0Q5pYK5V2/WjWCeR4Jo8vhqZtSnNTeFPIqbTjHvdVIWnmegzXNuXwJlibV/G/yEpnCnWf8hs336itR5rTQNk+7TPKPwVS+CsxPorztyrmbQzxbqa0v8rpv3/AUMxqaF7oTtTAAAAAElFTkSuQmCC"
+
+STYLESHEET = Template("""body {
+    background-color: white;
+    font-family: Arial, sans-serif;
+    padding: 0px;
+    margin: 0px;
+}
+html{
+    padding: 0px;
+    margin: 0px;
+}
+#filter{
+    position: absolute;
+    right: 20px;
+    top: 20px;
+    font-size: 12pt;
+    padding: 5px;
+}
+.header{
+    background-color: rgb(233, 6, 73);
+    height: 80px;
+    width: 100%;
+    color: white;
+}
+table {
+    width: 100%;
+}
+h1,h3{
+    margin: 0;
+    padding: 3px;
+}
+h1 {
+    font-size: 28pt;
+}
+h3 {
+    font-weight: normal;
+    font-size: 11pt;
+}
+#logo {
+    float: left;
+    background-size: contain;
+    margin-right: 20px;
+    width: 80px;
+    height: 80px;
+    background-image: url('{{ logo_url }}');
+}
+#viewport {
+    position: absolute;
+    top: 80px;
+    bottom: 0px;
+    left: 0px;
+    right: 0px;
+    overflow-y: auto;
+}
+#viewport th {
+    position: sticky;
+    top: 0px;
+    cursor: pointer;
+}
+#viewport td {
+    height: 24px;
+    padding-top: 0px;
+    padding-bottom: 0px;
+    white-space: nowrap;
+}
+""")
+
+VIRTUAL_SCRIPT = """(function () {
+    var ROW_HEIGHT = 24;
+    var OVERSCAN = 20;
+
+    var viewport = document.getElementById('viewport');
+    var tbody = document.getElementById('rows');
+    var headers = document.querySelectorAll('#viewport th');
+    var data = JSON.parse(document.getElementById('services-data').textContent);
+
+    var columns = [];
+    for (var i = 0; i < headers.length; i++) {
+        columns.push(data.fields.indexOf(headers[i].getAttribute('data-field')));
+    }
+    var nameColumn = data.fields.indexOf('name');
+    var bandwidthColumn = data.fields.indexOf('bandwidth');
+
+    var visible = data.services;
+    var scheduled = false;
+
+    var escapeHtml = function (value) {
+        return String(value).replace(/&/g, '&amp;').replace(/</g, '&lt;').replace(/>/g, '&gt;');
+    };
+
+    var sizeofFmt = function (num) {
+        var units = ['', 'K', 'M', 'G', 'T', 'P', 'E', 'Z'];
+        for (var i = 0; i < units.length; i++) {
+            if (Math.abs(num) < 1024) {
+                return num.toFixed(1) + units[i] + 'b';
+            }
+            num /= 1024;
+        }
+        return num.toFixed(1) + 'Yib';
+    };
+
+    var cell = function (row, column) {
+        if (column === -1) {
+            return row[bandwidthColumn] === null ? '-' : sizeofFmt(row[bandwidthColumn]);
+        }
+        return row[column] === null ? '-' : escapeHtml(row[column]);
+    };
+
+    var render = function () {
+        scheduled = false;
+        var first = Math.min(Math.max(Math.floor(viewport.scrollTop / ROW_HEIGHT) - OVERSCAN, 0), visible.length);
+        var last = Math.min(first + Math.ceil(viewport.clientHeight / ROW_HEIGHT) + 2 * OVERSCAN, visible.length);
+
+        var html = ['<tr style="height: ' + first * ROW_HEIGHT + 'px"></tr>'];
+        for (var i = first; i < last; i++) {
+            html.push('<tr>');
+            for (var j = 0; j < columns.length; j++) {
+                html.push('<td>' + cell(visible[i], columns[j]) + '</td>');
+            }
+            html.push('</tr>');
+        }
+        html.push('<tr style="height: ' + (visible.length - last) * ROW_HEIGHT + 'px"></tr>');
+        tbody.innerHTML = html.join('');
+    };
+
+    var scheduleRender = function () {
+        if (!scheduled) {
+            scheduled = true;
+            window.requestAnimationFrame(render);
+        }
+    };
+
+    var filter = function (searchTerm) {
+        visible = data.services.filter(function (row) {
+            return !searchTerm || String(row[nameColumn]).indexOf(searchTerm) > -1;
+        });
+        viewport.scrollTop = 0;
+        render();
+    };
+
+    var sort = function (header, column) {
+        var ascending = header.getAttribute('data-sorted-direction') !== 'ascending';
+        for (var i = 0; i < headers.length; i++) {
+            headers[i].removeAttribute('data-sorted');
+            headers[i].removeAttribute('data-sorted-direction');
+        }
+        header.setAttribute('data-sorted', 'true');
+        header.setAttribute('data-sorted-direction', ascending ? 'ascending' : 'descending');
+
+        if (column === -1) {
+            column = bandwidthColumn;
+        }
+        var compare = function (a, b) {
+            if (a[column] === b[column]) {
+                return 0;
+            }
+            if (a[column] === null) {
+                return 1;
+            }
+            if (b[column] === null) {
+                return -1;
+            }
+            return (a[column] < b[column] ? -1 : 1) * (ascending ? 1 : -1);
+        };
+        data.services.sort(compare);
+        visible.sort(compare);
+        render();
+    };
+
+    for (var i = 0; i < headers.length; i++) {
+        headers[i].addEventListener('click', (function (header, column) {
+            return function () {
+                sort(header, column);
+            };
+        })(headers[i], columns[i]));
+    }
+
+    var filterInput = document.getElementById('filter');
+    var debounce;
+    filterInput.addEventListener('keyup', function () {
+        clearTimeout(debounce);
+        debounce = setTimeout(function () {
+            filter(filterInput.value);
+        }, 100);
+    });
+
+    viewport.addEventListener('scroll', scheduleRender);
+    window.addEventListener('resize', scheduleRender);
+    render();
+})();
+"""
+
 TEMPLATE = Template("""<!DOCTYPE html PUBLIC "-//W3C//DTD XHTML 1.0 Strict//EN"
         "http://www.w3.org/TR/xhtml1/DTD/xhtml1-strict.dtd">
       <html xmlns="http://www.w3.org/1999/xhtml" lang="en" xml:lang="en">
@@ -28,7 +241,7 @@ TEMPLATE = Template("""<!DOCTYPE html PUBLIC "-//W3C//DTD XHTML 1.0 Strict//EN"
         <script type="text/javascript">
         $(function () {
             var filter = function (searchTerm) {
-                $('td:first-child').each(function () {
+                $('td.service').each(function () {
                     var $td = $(this);
                     if (!searchTerm || $td.text().indexOf(searchTerm) > -1) {
                         $td.parent().show();
@@ -50,51 +263,7 @@ TEMPLATE = Template("""<!DOCTYPE html PUBLIC "-//W3C//DTD XHTML 1.0 Strict//EN"
         });
         </script>
         <style type="text/css">
-        body {
-            background-color: white;
-            font-family: Arial, sans-serif;
-            padding: 0px;
-            margin: 0px;
-        }
-        html{
-            padding: 0px;
-            margin: 0px;
-        }
-        #filter{
-            position: absolute;
-            right: 20px;
-            top: 20px;
-            font-size: 12pt;
-            padding: 5px;
-        }
-        .header{
-            background-color: rgb(233, 6, 73);
-            height: 80px;
-            width: 100%;
-            color: white;
-        }
-        table {
-            width: 100%;
-        }
-        h1,h3{
-            margin: 0;
-            padding: 3px;
-        }
-        h1 {
-            font-size: 28pt;
-        }
-        h3 {
-            font-weight: normal;
-            font-size: 11pt;
-        }
-        #logo {
-            float: left;
-            background-size: contain;
-            margin-right: 20px;
-            width: 80px;
-            height: 80px;
-            background-image: url('data:image/png;base64,iVBORw0KGgoAAAANSUhEUgAAAJYAAACYCAYAAAAGCxCSAAAMF2lDQ1BJQ0MgUHJvZmlsZQAASImVlwdYU8kWx+eWFEISSiACUkJvgvQqvUuVDjZCEiCUGBKCir0sKrAWVFRQVHRFRMW1ALLYsJdFsPcXCyor62LBhsqbFNDnvv3e9+b75t5fzpxz7n/mztzMAKDmwhYK81F1AAoERaL4sEBWalo6i/QAUIAGrCpAk80RCwPi4qLAP5Z3NwAiu1+1k+X6Z7//WjS4PDEHACQOciZXzCmAfBAAXI8jFBUBQOiCdtPpRUIZv4WsJYICASCSZZytYH0ZZyrYQe6TGB8EORgAMpXNFmUDQJflZxVzsmEeuhCyg4DLF0DeAtmXk8PmQpZCHlNQMA2yGhWyVeZ3ebL/I2fmSE42O3uEFX2RF3IwXyzMZ8/8P4fjf5eCfMnwM0xgpeaIwuNlfYbjtjNvWqSMoXakXZAZEwtZE/I5PlfuL+M7OZLwJKV/H0ccBMcMMAFAAZcdHAkZjiXKlOQlBSjZiS2Sx0J/NIZfFJGo5EzRtHhlfrSYJw5JGOYcXkSUMudSQX7MMNdm8UMjIMOZhh4syUlMUehETxXzk2Mg0yF3ifMSIpX+D0pygmKGfUSSeJlmM8hvs0Sh8QofTKdAPNwvzJ7DlmvQgexflJMYrojFUnni1KhhbVxecIhCA8blCZKUmjE4uwLjlbGlwvw4pT9Wy8sPi1eMM7ZPXJwwHHulCE4wxThgj3LZ4+MU+rF3wqK4RIU2HAdRIAgEAxaQwJoJpoFcwO/sa+mDvxQtoYANRCAb8ICd0jIckSJvEcBrAigBf0LiAfFIXKC8lQeKof3LiFVxtQNZ8tZieUQeeAq5ANfDfXFvPApe/WF1wj1wz+E4ltrwU4khxGBiODGUaD2igwNV58MqAvy/275FEp4SugmPCNcJUsJtEAlbebDPMoWCkZ4lgyfyLMrfU/kLRT8oZ4FoIIVxocreZcLo3mEf3AKqdsUDcR+oH2rHmbgesMNdYE8CcD/YN1do/V6hZETFt7H88Xkyfd/3UWmn29BdlSoyR/QHjXj9mCXouzHiwnvkj57YUuwAdhY7gZ3H2rEWwMKOYa3YJeyIjEdmwhP5TBh+WrxcWx7Mwx/2cWh06HX4/Lens5UKRPL3DYp4M4pkCyJomnCmiJ+dU8QKgF9kHitCwLEfw3JycHQBQPZ9V3w+3jDl322EeeGbrfA4AJ5l0Jj9zcY2BeDwUwAY777ZTF/D5bUSgCNdHImoWGHDZRcC/NdQgytDFxgCU2AF++QE3IA38AchYDyIBYkgDUyBo54DCqDq6WA2WABKQTlYCdaCarAZbAM7wR6wH7SAdnACnAEXQRe4Du7CudEDXoB+8A4MIghCQmgIA9FFjBBzxBZxQjwQXyQEiULikTQkA8lGBIgEmY0sQsqRSqQa2Yo0IL8ih5ETyHmkG7mNPER6kdfIJxRDqagWaoBaoGNRDzQAjUQT0cloNlqIlqCL0eXoerQO3Y02oyfQi+h1VIq+QAcwgKliTMwYs8M8sCAsFkvHsjARNhcrw6qwOmwv1gbf9VVMivVhH3EizsBZuB2cn+F4Es7BC/G5eAVeje/Em/FT+FX8Id6PfyXQCPoEW4IXIYKQSsgmTCeUEqoIOwiHCKfhiuohvCMSiUyiJdEdrs00Yi5xFrGCuInYRDxO7CY+Jg6QSCRdki3JhxRLYpOKSKWkDaTdpGOkK6Qe0geyKtmI7EQOJaeTBeSF5CryLvJR8hXyM/KgirqKuYqXSqwKV2WmygqV7SptKpdVelQGKRoUS4oPJZGSS1lAWU/ZSzlNuUd5o6qqaqLqqTpBla86X3W96j7Vc6oPVT9SNak21CDqJKqEupxaTz1OvU19Q6PRLGj+tHRaEW05rYF2kvaA9oHOoNvTI+hc+jx6Db2ZfoX+Uk1FzVwtQG2KWolaldoBtctqfeoq6hbqQeps9bnqNeqH1W+qD2gwNBw1YjUKNCo0dmmc13iuSdK00AzR5Gou1tymeVLzMQNjmDKCGBzGIsZ2xmlGjxZRy1IrQitXq1xrj1anVr+2praLdrL2DO0a7SPaUibGtGBGMPOZK5j7mTeYn0YZjAoYxRu1bNTeUVdGvdcZreOvw9Mp02nSua7zSZelG6Kbp7tKt0X3vh6uZ6M3QW+6Xq3eab2+0VqjvUdzRpeN3j/6jj6qb6Mfrz9Lf5v+Jf0BA0ODMAOhwQaDkwZ9hkxDf8NcwzWGRw17jRhGvkZ8ozVGx4z+YGmzAlj5rPWsU6x+Y33jcGOJ8VbjTuNBE0uTJJOFJk0m900pph6mWaZrTDtM+82MzKLNZps1mt0xVzH3MM8xX2d+1vy9haVFisUSixaL55Y6lhGWJZaNlvesaFZ+VoVWdVbXrInWHtZ51pusu2xQG1ebHJsam8u2qK2bLd92k233GMIYzzGCMXVjbtpR7QLsiu0a7R7aM+2j7Bfat9i/HGs2Nn3sqrFnx351cHXId9jucNdR03G840LHNsfXTjZOHKcap2vONOdQ53nOrc6vXGxdeC61LrdcGa7RrktcO1y/uLm7idz2uvW6m7lnuG90v+mh5RHnUeFxzpPgGeg5z7Pd86OXm1eR136vv7ztvPO8d3k/H2c5jjdu+7jHPiY+bJ+tPlJflm+G7xZfqZ+xH9uvzu+Rv6k/13+H/7MA64DcgN0BLwMdAkWBhwLfB3kFzQk6HowFhwWXBXeGaIYkhVSHPAg1Cc0ObQztD3MNmxV2PJwQHhm+KvxmhEEEJ6Ihon+8+/g5409FUiMTIqsjH0XZRImi2qLR6PHRq6PvxZjHCGJaYkFsROzq2PtxlnGFcb9NIE6Im1Az4Wm8Y/zs+LMJjISpCbsS3iUGJq5IvJtklSRJ6khWS56U3JD8PiU4pTJFmjo2dU7qxTS9NH5aazopPTl9R/rAxJCJayf2THKdVDrpxmTLyTMmn5+iNyV/ypGpalPZUw9kEDJSMnZlfGbHsuvYA5kRmRsz+zlBnHWcF1x/7hpuL8+HV8l7luWTVZn1PNsne3V2b45fTlVOHz+IX81/lRueuzn3fV5sXn3eUH5KflMBuSCj4LBAU5AnODXNcNqMad1CW2GpUFroVbi2sF8UKdohRsSTxa1FWnCrc0liJflJ8rDYt7im+MP05OkHZmjMEMy4NNNm5rKZz0pCS36Zhc/izOqYbTx7weyHcwLmbJ2LzM2c2zHPdN7ieT3zw+bvXEBZkLfg94UOCysXvl2UsqhtscHi+Ysf/xT2U2MpvVRUenOJ95LNS/Gl/KWdy5yXbVj2tYxbdqHcobyq/HMFp+LCz44/r/95aHnW8s4VbitqVxJXClbeWOW3amelRmVJ5ePV0aub17DWlK15u3bq2vNVLlWb11HWSdZJ10etb91gtmHlhs/VOdXXawJrmjbqb1y28f0m7qYrtf61ezcbbC7f/GkLf8utrWFbm+ss6qq2EbcVb3u6PXn72V88fmnYobejfMeXekG9dGf8zlMN7g0Nu/R3rWhEGyWNvbsn7e7aE7ynda/d3q1NzKbyfWCfZN8fv2b8emN/5P6OAx4H9h40P7jxEONQWTPSPLO5vyWnRdqa1tp9ePzhjjbvtkO/2f9W327cXnNE+8iKo5Sji48OHSs5NnBceLzvRPaJxx1TO+6eTD157dSEU52nI0+fOxN65uTZgLPHzvmcaz/vdf7wBY8LLRfdLjZfcr106HfX3w91unU2X3a/3Nrl2dXWPa776BW/KyeuBl89cy3i2sXrMde7byTduHVz0k3pLe6t57fzb7+6U3xn8O78e4R7ZffV71c90H9Q9y/rfzVJ3aRHHgY/vPQo4dHdx5zHL56In3zuWfyU9rTqmdGzhudOz9t7Q3u7/pj4R88L4YvBvtI/Nf7c+NLq5cG//P+61J/a3/NK9GrodcUb3Tf1b13edgzEDTx4V/Bu8H3ZB90POz96fDz7KeXTs8Hpn0mf13+x/tL2NfLrvaGCoSEhW8SWbwUwWNGsLABe1wNAS4N7B3iOo9AV5y95QRRnRjmBf2LFGU1e3ACo9wcgaT4AUXCPUgurOWQqvMu234n+AHV2HqnKIs5ydlLkosJTDOHD0NAbAwBIbQB8EQ0NDW4aGvqyHYq9DcDxQsW5T1aIcI+/RU1G5zsr5oMfyr8BEcVsAvcnWQUAAAAJcEhZcwAAFiUAABYlAUlSJPAAAAGdaVRYdFhNTDpjb20uYWRvYmUueG1wAAAAAAA8eDp4bXBtZXRhIHhtbG5zOng9ImFkb2JlOm5zOm1ldGEvIiB4OnhtcHRrPSJYTVAgQ29yZSA1LjQuMCI+CiAgIDxyZGY6UkRGIHhtbG5zOnJkZj0iaHR0cDovL3d3dy53My5vcmcvMTk5OS8wMi8yMi1yZGYtc3ludGF4LW5zIyI+CiAgICAgIDxyZGY6RGVzY3JpcHRpb24gcmRmOmFib3V0PSIiCiAgICAgICAgICAgIHhtbG5zOmV4aWY9Imh0dHA6Ly9ucy5hZG9iZS5jb20vZXhpZi8xLjAvIj4KICAgICAgICAgPGV4aWY6UGl4ZWxYRGltZW5zaW9uPjE1MDwvZXhpZjpQaXhlbFhEaW1lbnNpb24+CiAgICAgICAgIDxleGlmOlBpeGVsWURpbWVuc2lvbj4xNTI8L2V4aWY6UGl4ZWxZRGltZW5zaW9uPgogICAgICA8L3JkZjpEZXNjcmlwdGlvbj4KICAgPC9yZGY6UkRGPgo8L3g6eG1wbWV0YT4KarKwSgAAP+ZJREFUeAHtnWd7JMlx57MdZtZ7T64j19NKNNK5F7qXum98OvG5506iSB4p2nXkmlk/a2f9DNDm/r+IjKys6m6gGkD3zFBIoKvSREZERkalN4N37/wfi3RmziRwyhIYnjK+M3RnEjAJnCnWmSJsRQJnirUVsZ4hPVOsMx3YigTOFGsrYj1DeqZYZzqwFQmcKdZWxHqG9EyxznRgKxI4U6ytiPUM6ZlinenAViRwplhbEesZ0jPFOtOBrUjgTLG2ItYzpGeKdaYDW5HAzhSLtTmnsT6ni6fr3oqUNkS6OEFKIz1HymqwIVM7Bh/vgp4JKQtiIUdLJoOWS9qXRRr+4VZmtYVdxZO1wVvHzwGHJbJDZ2DcQatLDXqDJX9QOyc8F2lu8YIH8wJEJqAcrovfYQCDhrgo6S4hbjE0K/BbOhQY8eQGU5jwDve23ztRrCIL0l2lqJ30VkDl6GmFSI3coi15ODKEPh6lNJmkwd4kJf0G43EaTEb2TgpbjFWYj4ZpwG8g+1A/y3RQZLzKrcFcdvtJpWbzNJ9OU9JvMJ2ldDBLi4NpWuwf6H0gt8IEY/DOycqnyWtlegL8kECL3AMuQLb03oliwbull/yQhZeyC2839edkX568az+DQg2XDX6OVraBbAv3WSyUgTLECpS4DS2Kc+P5NLzj1jS65440vOu2NLz95jS67aY04HfLjSndcj4NbjyXBuf20hDFk9KhaIuCTLRmUpx9Kc4VKQ6/r6+kxZf6ffZVWlzi92Waf/pFmn/0WZq9/1GaX/o8pa++Tou5eAs8MF8ZkmApItz/zVmXcJZCS2cV0VJauy2ae3RotKG249qtYikNpJHMXplWJLY6hIBiDCy7DJ8jlQ85oSwIoauUGVAqnd9LgxukKDdIUW7Yk9JIce642RRqfN8daXTX7VKym02phlIswgc33yDFkvIRd09iyiWYl1pUVqJD6aNSKUm55l/vZ8W6nNLnX6f5J1+mxadSLJTro0/T7KIU68NP5f4iLRS+uCwF/Iqf4K8oLiWdFLUxKyVkaSzJlSsUrpFohOa3XuHT4N6+bWeKRV6jEPxIaPys9xBfL76lpAJSJsKKv3s7Juxg4qW3RdHDiEh9Jyptbr8lDR+4Kw0ffSCNH7k3jb9xdxree7sUSwp00w1ppBJpcI4SSVXiROKgZNLbqkqUKVeBaQheIyD0ORsJm+inEnAoPCjkIleBI6q9qAqtRJPyfInCfZ7mH1xK0zc/SNM3LqbZaxfT/L2P0kAKlyjJsmQsVTlplj4jrYfJAUfmxV5S9Cwf/6YU0SxSOwdrxGPItv/YmWIhML7zxoTUsoAUED4OI1fJyPgus84YQBvaYGknqVQa3qQSR5k8vFNVHSXSN+9Jw8ceTONH700TKdbg7tukVOdcgYKhrPmOFU4bXvFrXBFBPniOgES53H8ZLuD1pr2lEmr2wadp9NYHaXThYpp+4900e/PDtHjvk7T4+FOVZirppIADqtWpqleiF2VCUTJnq5nqyJC4INi9Gexql87AGw9KZ4heb5dazjX85WFC1NuUymEIiaKeKPyiBaUsFeggzfUb3nKTSqX70+iJh9Lk2UfT8JH70kilE+2ngUqnwU253UTVpvZSolEeJrMDLTMlM7NTL2PJnY2ncVNiweh6QyM/2mVSMNpjc94qxabvf5Jmr19MB89fSPO/vJ2SlG7+udpnC7XjxAtovX2Hra1cyIZfIxdBRFG1nputhuyuxCLVMpHeYbjd2wRj4TyWctCBchTDQb7TkxtSQt18YxpR5T10V5p8+6E0fvqbaYxifUMllZQqUdU5iuYZyPDJgW2Ytgswo7nkveQBaGOCDmBUp0N6n/pJydM90m950/AfSrlm37w3DdSRmN97R1qoUzF756M0u6SG/xdfpqQSLM1UvQKfn4gpqGfVs5Br4bEzxSryzZZSMUo6/sUhDgVKUg7iIgvBzcNCIGCKZ0r1zfvSRIo0+eG30+hbD6qEujMN7rwlJXp3UjraTEQlWqCQtTErPRVc+VtcHjL5ZXbT/9rDfNsweEVp68EV4gxPe84+jL099VJvT4vvPpYWFz9J01feSVd++0pKL72Z5m+8l9IXavi38LnL0MiKcoGdjzc+4Fy2yWMFo5n+Nl47U6xWTuWUrE5qFo7BRAGPQ9LSFz8YSVHOq0pjqEAlkinVdx5Nez+QYj18rzXIFyoRuriXszMzccQr8ERGHQG+RBe2wbGevkJppw1VqqpkHd6pEvbBu9Li0fut05FUvQ/vuCXNVPLO33rfhiwWX6v6pAc5pxfpHHqJ5dyVURdzRgo8bFfPHSpWk6SSVJO2tw1c8OX7yiKRuKxYwCn7SFWfGuYj9fAmP3kqjb/zWBo//qAy4E6v8iihGGKAQM7JprSosrYKb2lCBQK9AHN+m8BiCwDjNj+yX4Ex74YLnB7mWJ2K/EoEWfh4bj6vdN6f9m67OY2ffCjNX30nTf/4Wjr45ctqi6nB/6XGydSLJH6LjYwoeokhh8zdzl67U6yQXGmIttPoYsYvxN6Ii7ZU0jjU6O7b00gN8slzj6bJT5+2ttTwflV9Gm8yY0h41N+vB7WeJRPli70hvhKsBilR18URQCerWzh7OaItdpuqyNv0Id1za1rce6s+Hg2RMC7Hm8b9R5fU+P/aRvopUZ03Mab/4NNqwHD0In46QLtTrE4d3y6bSIyyA5nk3mMjGgXdcEMaP6ZxqO8/nvb+03NW/dHItcFMxo/CrBXg6oCiGzm4DSVXAWhxE9TWvkkbyrWcxhqPUwuay58CxLPveWWTPqCxSuQB43DPPZwGP38hTX//WkqvvZPmn2lE36CRYWCCOtiFp0qHAe7gsTvF6iZGiaUQK2luuSUSBQ7OqcenqmCoIYTJ97+VJn/7RNpTFTh86G6r8qL+AEdkUJdM1YptBRW6Ld8NHWuJwk87sO2q6awJyfIwSKrGG9V/lGKN7tEY3K0qsTRUMjgvRdPMwOzCe2p7fabe5ZUyUOpYTyWVNbO97TtVrDqZ9k23PFwUPE2pJLjRHbel8U+fSpMfPZEm3/2WKdhQPb663RUpbcqHNRkVgHpD9mioNUDB8yoEEQatVeH4H2YUv0QrTYfi42FSspGGIwZ//0waq5E/e+SetP/rP6f9f3shpYsfWAeHoj/aWGXsq1NjHMbGaYTtVLGM4ZBTnQkKsOathLngS1TVN7rrDo1FPayq79k01lACjfSBSi8v4uoccDEE2iWhrA1YguzlEVV1t0RquvMieAyarSjFkXGFrCjFQa425UgT5ENmF/RmdcZCc5XT50fW7krqNdr0UK4Wrc0HzsDTK6UnA9qpYq1LG/5m+EqZd7v/rrT3X79n1d7ouUc00KmqLxroBlxiRMyN3sRGxodj6eaCoKtIlXUl7Yh9OI1O1HXA5t9gxGklNAqmqSoa9IlZhfvvSPv/5w9p/qbGvJjUtrlH/2ibAqsh4jZ/mvLBjpWUQUvvsB4hrU5KYoar670lt9JgJRNMkp5gGjsllYYShvffrUa62lMqqSbfezwNNJRgo9SnzBIkNzYWaV3M7L8ueGNih0cwMkya3zZOI32MiQa+BoPnX1xOUw25MLGdNCThY12H4+qG1klA4ZpmRhdyvXt3JZa4NaWKkUar9mBZRkqVmJ6RUu399x/aUMLkmUdcqepe3/p0bCGkFq+j5ztY9s2kFRDfCT5r4TL45q/1GBlYHWkFB4bpon018K/802803qVpIIoqlVzNXK3zSZVq6YmizEoqIchuD5UTsgI0WAj0NLtTLGOoaZlE0QvDQxXpw/tySfWTp9OeSqyhpjZsSgaATVPVJ/HgxKzPLw/PzwC377cZNCowEY6HoQyPnvgLok0sRkMPLe8ZTFQtqreMkmFYQWEDqCq5FpRca0ywWQfj17AtG45VgHWkjn3HitXwx3iLLQFRsT1UQ33vv30vTf7+ubSnkgqlWrBkWKZJYIfzXTpN0iFZ+BZfK5Sr8Bug2+TRaBhjToWSRjIbahB5LBme0+JDRu8PfvY7LULUEpwy/eMfd8i1sNoqubR2P4oq5UDAbpKcHSoWhatXfbzNzjjVnRpNf/YRTdFQUj1u0zOM12As0WTiJik6ArYI0rH3E1vmAZ7d6G1MHcGZgolxBNQRHFfBgczYCEdwJAUY0tbScISqxT0os0TnohYVssL140tatXrZ2+ZECUWq0C8zenzOd6dYOSGRObDM6s7JT5/x0XR6fzTUo02V4Zsxq1oCx7OTFZYnevIdwgMlZyNtx7tOnI0/tsblsapnDmroHQpdRTzcWgqRUNeKhcpq1SHKNXlOCwXVmGfZ0PTnf1KDXm0ujNJc8sEiaj2bhxBYUkaQycfCagoFeK1ld4pVsWDrkTT3x6K8yY+etCUvrJ1qen9RslWRTmh1hQokjZBQr1ZYOBqQiKT3Sk8LJySi4lHbDeA0H9HQXodTvcTBmDbXPWnvhxp2YJeQ1naxepWVEbZbqMWhf2jBM2/7oPPHvY7MYf47UywrHzQPaEwzofyolgprOGHvu4/74CcDfZhInXIqMn19dnqUTZ6BK97oCvaKrKMzRmvMJUbt2cDKRn4v4cF/OcaxfOpVG0FnJSILlPQ0tjXSwPJEmzZmTFprA8fstXe1FU3r61upllNxjE966+Z0j+B9Ux3bmWKZAFjSwrwXqxTUnpr87ZO2WsEmkw2AB8mK5Cw7gTiOAWMH89FoOhFqZ21fi0hARxUua+MeNwDGsrG9koxzaUXI+G++bY34+WfaIaTG/IDVqGXzxpKaBYpjv3enWOSs1lMNtIyYSWVbpfBjTShrw4ObkEhWKjnxOb2MqatXKz/bZDMXtU6bV7CVeQlno/ryMUenSiUy/pYIHCc1mY5ePv/X4CsLQvAqjkaOzK/uSda0reZvfpym7AhiufNcO4cMjcMiFd/J3aCxdp3h1cOBLcZRj50pFjwNqQJpVz2nBXpPP2wrQCnBWiYyQ56np1QtCi3HalnJl3+2cl1mv+C+v69ol42mSvAfsKfQEiV0bBOL/YtMrbB3kfEk0pbzt0X0mI7CK/VSFk7Ro4wzYApZWVgBwWrbsTbSjr/ziPY7apPGK2+rSlS6zBDLY/AMHB6WMbU9PeiQ584UCx7Y2MCyFxbpsWjPusertCen5RC+jxHUCC4iI6v4Iskgh5BFGWeDi9qGNXv3Y/Wm9HtX27O0o9k2oH5BdaJM0a4b25YvZWLD61BzdexdHGlTR9K2M1+AeDqJ8fLWOQej99ZkC/Swrb8oi0lbBKGEyBqZI3u2/R98rP2N2gXEaROk143H8njZL4IyRN/XbhTLdtNI+Hw1Wk7MOnVrV61Sqr6cnxSuSF2IbEczu5k1kPi5lvzqN5fyzNi5rN7U/B1XrsVHygx2N6NYl3UWA1Mlmp9j5oCt+SjWnC1n/B69z4dP+IC0h3Gg9mWUMidhvWYbVQrjtuVQ8zE5a/MJy5yf/oatm5/+8fWUtI8xfa1ReSas15jA2FBaA9jx3oliMTUz0m6a8VMPqwf4gGWATT3ANRzrHV9kJKQRWuPT4f3YzlpI1jLSxlDbofz2h+ngpbfS7C/vaJ5NGxe012/xhRSNbrqqROu2s+mUgUfOhhAiuuVzOiVjVX3aD3jw73+xmYOh1qsziX7uPz+nntn9TdV4TK5NCllWDQrvZVPshpQibY27kqyq5+F9WomqnuJICsZ+xplWQrBJtphSeoVPgyl8+ryPrViRAFeJIL6CpARvGyCkVBOVVrFGvUqu61BGsUJ2jvQQEiuoLnsVhmVRG8nOTaDkYeexqoXpu9rDd+H9NEWxXn1Xjdz3dbiHqgp2I1vvCQbENdWkrAUdlORQ2SWLfkrvQLiG7GwW/oG24O/t79vGiAF7HCk9+G1qIFhFw+oyrCQJ6g7e4iaMJUka32IgeqKdTaR7/olWnurjaarDDoJjOvsrFhyaNINVHP7jqW9WT7jPYGg+QtaPEXa2Z01+oMll2QmKto0iRUxHj4eZgkgucJ/AwCAojLAUQ1Xd7A0pkfbtzaRIU43tsDl0ocM7GKn2EkoDiTTUUSriYWCpUgpQ1o1na+MAqiXCc50uM/2d4n+qzLv4cTr/j3+XxjpohPVmoVgZK5jNrE1l8B+AGbrAVzy1QFZgpWwbazvZ4AdPpMHn2u7/ovYs6sASl4+/yIhcFi6j6+nTX7GgRgK60hAh72iXZBbSNo5y4w22Rn30rQds3x9HAxUUZuHhcVsYCpAnshT2DbjR6TjbflRXaj8tLqv9RJUmhUqffpWmaozPXn8vTVXlTV9+y0onn0vTlIdlUiYeChUpMmLBqxwGlrkODSMOY0RfiSalHSsLpExjLchjxzaL8cquosDL23DpXQkBL0Nb+QHaNocGtkGzy5om2oNJngy1vHnwjs6O+Fq7fTjI5JRML8WKNJP6mLtzOTaJchg9MzAhQxb7a3iBsxRo2DISvMhfbKzJLgpzSILARX4ZtUwyvqgSP9MFyOBhhE2dahvNVS3t//ntNHtZP6q6tz70NtVnHMAhhdOIdAi14DV6+mQyvUhXw6YTqufSDJTjIOAFhmmPSaHnKh33f/GSFGyc9v7uaSkWswzOOaCYIOMufyJj6K8Kq+F62WtCHCanDsXwPg1U60gCW2KjvYo2Ih8fUy4Fm/T1olKAeimWQcOYpbBY3CkGjOdgvKAWuA7iGOezFNj2zg7lWkpFKao4xQotw+liDae7ClQGyr40qjkySI3tGW0nxms+1BCBFOngz6ry/qytUlKwhfbj2Sl7lGauBU2VVqUDKzy6lz+DfgVWmAkeSxi9Rs3TcS4Wm02H7BF8Umv3+chsjMuxBc5aNoZUASWsUDmuJbgSRnqo2rvI4DTnXNixSnRU1KZcZYi5KR+9FAukhryisJZQDrBk3Hpj2ntW5yo883AaaMtS+fr0VRSlWouokxohDD5IfHzvzpcHLnSA2VxnHtB+2lfJdKBe2lxVHr07qsKkcamkBjW9O0oUVxmpljEL1sDrdp5VkHsawTYvBFij3iH8CbN8dMBL0afa/5e0snOss7GGl7V9XqU5JZglP+Oso5+6fUnOkqCGSM5pVUlifO4Pr6lkhxGl2QRd2fGTcwmFQa9+9FIsotZI4xvG18kHclz6aTCOg8zsfCrGdDR+lW7UaLQBr1aqwnhNKNDyXuWvJhTV3fzLy/bVzTWYOdNhZlP16g5U7dEon7/9gao7lV76I/NB02q3iKdVqCG5ibGkESEsuSrBw3qW2lTKOvSZeowjdRIG92iJkBSrwG9C7JRgOeXQRuSVR+QVS5bg1eYQ4T/Scgx6vRXLcYtSEIsqMBONzLFgTni5TccKafSZcZOBRqX5Oom8qqQiTsTP6Pq9GNjUCPhcinRZu1MOtDN4IUWyIxkZSlBJQQ/NDqAVAWh729BYcRqZsLVn8Da3c2l+VuQ07KCgJoOsOEUcAiGWhTfgpZQ2HvgAdMja/C0NR9zEaTj5aIAKPqw13vA72bsjYRGwUwvVS7fD6bTTenb7rWn2qXrGKvmzGOxjdLqd+Ecws6FigVyiK18j2DPBnGMIZMhxPGJ0xHlPYtwW74WkiFIZvDdjuYm8UEbRu2NQcv9fn0/TP0mxPkEw7Aj2/A/ozF5FzVWgOaAsGKy46SJR7HX81tWHYYB+oDLllIdG9qmq6UwkdWoiuLEEtzt609Y6p4a88mjIqYcXtAH2Mh+jzyEGfyGZTbiiD9PTZDItpWpHNaHrQXd69Jh6gxpxZt21GaLXPzkN3kN7PQMeNNhnqlL2/+X5dOWff6ve3hvq6alRzsSqMtIylVI12BZxL4ecFPExrl4Zs6UNu//MV8oVbFsEQuVhfgLI6C0K8I2Ri6o3e0KHI7kZlFx8rEYyXfsu4ibyYUEV1AmsQRv+mOtUfjFbwEIBkxP+mffjUNlAsYS+VqoO4ZoHq7tVb4/18671atZKphAcCe2CVogLPCWAelwLLf84eP517QB+XdXfxxo20NdG9dg1hrtCVKkToISEAkZUh+apyIVwhBKhsR8RbIAGQy9UVbcd293h03hoUG7dVtgneRr+GGtuc6QJdAoF/wQ9VQVuQ442qwqhAiOFiH/v7lQgGS7lswE4TkX5hgbfYmVoibOBJdNbigEdDUIyBmUN4g/VVeaAflP8WiBNiWFM5+IDtPzcRDnmPuFyiG7nJKddoKQcSgW+EUqFWwCUWgaX40I0w0KxikbIdk1OdJS4QcxWmiq/xqoO963dR6ocmGeOthGvm5VYwYneLiwXi6kXmc2Je5qM5cTiAYfKcjpx3sYVzFUoDreui5D9rfmj467nnJWuNpWdcFcwVjlnfooEfyai+k1gRlisOTzAckoJ7poSs9KOyurgxUMWBia1Nirx43DdygBWQCv/wnLtdxx7ZtY+iMK4I+Ice/LK9nJqdsC27HNGF2YtYx687rlZiQWdzFSMwNeIbdCPolSTrSP9GCC12xyIB2AkaKUEa0xuXwLHw+LqwYoCBlwllAXLnVEcmywmrpcSNRYXqOJl2n64ruLkdtXQ6kL203ksB9NTeI1s3QyAgimqSGaBhFwMlvACn9t54OGj06FpdoqzeM+swG7blIAmqPJqw27gMhkE1YrmwkbiNfVGR4t8U6m1+MqPosyp34CKg7Y/m77RkbdgK948poYUYG54l8ZEmBdDePQ8MDVwbffQpaflc84tAycjI/eARrG0L3Gg8ZfhrTGcQcA65F64mz7UINj5rcy5GhDcmA5gjl9D1naPIxJSNFaW0lseM/JOqYVZBewh/oRch2QdfFK7KVs+4oCCgJLLevLKOwvL6duUTn/F4gvUPxkOLSZDopkc6R5omGGoY6RHjF3Z/kAP4eny25TLHLMoVY5vvCij1JsZM5n6DTU6LaMQhf81ggCHfjlO4SC7A87SA5hDFzxgM+5NI4HG3ZiA590ywMdPAXxgXKMy0nlWw4frrW4ei+OR7Igk+3jaNFp4T+CwllOmE/Ss5olESIYj5g/VjOHyqqiVIngT0v0Vq2CtRVgJAG+rq3WaMVqf21YRLQ6lCPdR74aKxNE4IpsVXf7KqDFHcGvx4ECrKJwbxLfGGACh+hW7W3FG/DWxAyDDrYVaCrBZCB0ix9kKIzo1tD2tRHBQp7sUbeceg3O5rXW3apycf2tleQR3/dtY+Yt1BQly0XdwKjDD0dH8grGSG2RmRDuCqQhuwBtbjYROwuQpLbV9XztPfv+KoqFUoVjEoVRVtsnaDIQGdoIbVcLqMSKba5qRCoVFcIXmKKtVMU9p9azOb6dEt9KcJgLoCpng+yhsxw+n9O1SaSWHaTi1sWjO2L1CItUK34B0f8USUhO8KJlyIZEiFCiKZX2FI84M5eQ9TeucrmmIRVOLoQwOZRtq/IW5ruE5dRxYv814UQPuGWgcdliuGKzBK+/TsWqpkA0U681qi9m5i7aDxz4+dvScV7Vju3qoQMQJuXnKDLk8lpHiE8pj6/dZu88Zp2ovu/9ynD5C6a9Yqo+svSFq+UNvLKJNKHNPA61oGGh5iF3F1oeDDWBM3iEF4nEnzl2a69JitdGDd6eFVjUsdCfgYu5nFBi8wOK9AalTBbU7DTXaPtXE+EIbRkd0btR7Zr/f8AGVYGrXMK+a8pifVf31l3G8vO2dhoJeBQNKZfknO6WbtzF7oyqA/RWrRFlhsZwTeyziu1WXId2Sl+AaaGF7RcTjemVVYdxMDU56hmNNSSy07mrGyDbjWkJtUHpsg4ONOGcqR8tlZoy7icepNpcMY8vYg+ro8GFQ8jJpL6XjbFG72o7TY3ZlEBYFg/LOLgKV3eQnb96bmv6KVYqpTEK5ZfV1UCVcO50TSsXv1KtC0RMJ+5D9YYygNGTE+Em1tTS5O2W71qfaIJB7V7BnfGa2r8qLiy7VDkwfa92Txoxs3IixI3b2qCpk7IhVIJNnvqkd4s+kxIpbfSyL87lq3BXTFAy6WZYfY4NoVD0iuAkb/RWrD1ZOllNxzrLX7shyn+hHwpgyZ+WycsjVZph7hzNtKh1wqdFFhKK2loKvulKRKFa2cmWvrDGgag7CVO8N9lSC6Uo5NsTSzhir1GVxJDuavOQ6Rucd3JXpVWqTfypJbRqO3d0nMBspVmFOFgoo72UEdXnaoCUNUTVI6fVsyRQ+pDamWrRXNDM/0sZSX7AmHvY1ykaGbomHTdA6D95a8RF7lQNlDEWhWpGx+EyN+pdn6bI2xE70gQwlv6Ea9AP1sFOcGbYJ0U1hESrTTPlSgjKwHXx2a6wj8PdWrJKZxeKYS8ZlxuxibjWqG8EdwcEJgyHLWnoWE464rEnb20cXdOffR5qYlmJZ+AlpnEZ01CoUDHwhN1vSrMsu074+gksqZVk6LTNR24vrgEc6635wTx6lt5ATPgrhZTwD5geRJcd7h0Itg/Xy6a1YVComjmBsFXqKdXVT640Cq8CO4xdk4aJrQonpkY7VPmHFg1U9HDJmWbgqVhfLNt1wH60VlQpix9PD0+VqbrarTVm3/1G6/L//oO1j83SedfIMqJ4wo5dSJ4Kh6g1u5Z+1/dSIz/Scu6XYR3ocq75yoazADTMUp1SD2NcCroh7Ui/Ro0czekIj8doZZBPgsIBkYuDrpDROPT7MYbxKt4zWIbQLXXg5/Ys2g/zpgm0MYd1ZbE9z+JM/V2WNKROKlfPPuFsF2IN8b8WKorzQsQwLwYhS1MEoFL9TNkYO4oWBZQL0DifqHTIab11m7c8m08ycPkvLDKz1Me4V6uNCiCp8mJxG+fVZSP9pewmMtmFeazZl2xqn8GkZ9qkaY0A0RTB4cYtcVIl4mhGzkbfh1ePdW7F64Lo6BUOtbBrBpp1lt9ZzkZFuurCxNZg/RCH7pO3EMCWjakzh6e9w2fIfNejnGp6Yah/k9BXtNuKQ2hOYWkyggVah18VrAWtDu9Ar3f0Vi0/pEFqu96KBdh9Dw1dy1/Hky7aqreMfTmsfMM2jNgk32A8f0IH6WnFxtZUqMpU3IuTnfuHjKcAVxmoIDVHMpVQL/WxPZARu621M6VHy75AMP4KH/ooViA6jBUMziSQO0jgMNvCd9A2NoIPy03nQgCM7sLn61m63OCmNU4tfqU62UjkG+yQEb2trYdHxADOdqzB9S3sjtVJ264b8Yy+B8rBRruNR7a9YWYstH/XwgW2JQPYiDC2/5LQ429BQtP54jK2KZbRXBZgfXDgviZF4tbP4jVhwaCHXysOlBae26lVOZBktHcQWomMd/0yHo021RZ8jAbZuRHjBBD6n7GB3FT8W2f6KtRJ9rgBzznEYmQlANyEU6ayMtx1PzzLxpJWQnKg31mkqvhpSA42xhnstaSXiiOp+bdTeAaHilFJwW5sI4w0vetFD1M4jztmysyaiJqijbWrP6FdGQ6OVdwudtdos814JeaRnf8WCoazBLpLSqjIZWMlFMcq8mE5vae5uOZKHYwK4Gllks8KP8zRUI57pkCErS+/VtMhNWsbD3BeZWQRbxccTpYpAnIK1n3nzOL6x2At14wN/jUqB1jPMilaTo8SwDNZBcXMyXJPYCxblw/qJTZ1+RwZuO7mQDaso8QlMf8XKqfE0dQWdU8peOXbNsLVdg3s7MR0hG2dsrmD1gAYXRw+rEa+LNW19/CEMWYZ2wrup7ARv5HRcofxdanUi2lSLK+rHjag2wF2KTUhlU54tviT/1J5j1uIE43/9FYu06+dfnTNjX5Q8CTIeOA/KDofVtIQpVhFLxf1pWTuiqkhFE5jJ6clTD2lsywdMy86ZOh/hPf9anMmzbj92orRA+znq6k9StGpXbymM/QyJOJcg45M0WQtuMNKRQzajoVLPStZ+FDeG4vhxql2mlThOE8mYcHhsZvorVo1XUnZ1yqVySB1mPhdjKBeN+PCv4x7TDqqV6FammQzTj1UP39bVKprmGdziN7+7pOC+jbG4KRnsPyrDYzK8NprllEjEu06X0/Yk6cmpPWx5VzpYOBkj4hZ1Lf6+AU6/Ba08m1vBoPxDycw4N5vS7D9XCH7SbUWyfUuZrAJyWGIhmw6p5zdEsXZlctpNVwpNVyw2Wox0vBFnQVk7a65SlSLB89CaVrK6WapumnTW2R/gG73Fo9HJ8gtSToFSCqZw6c8Bbam3Lbm+V5tT2IVUlVbBcyR9I16IvCIivcGZTjmcaYUFeQkflNpmgmB2HvU6RokVlAI1bvezbqpO0VtkxgpTAXqCd5dqH1SsKR+oncWKh6GuWRvqaCWbJG9roKOKnMZlxDzLm9T1oXgUjOdOlPZA4xN5tlRGagnLUG1EbvPg4A7jSwwF/FHU1oavESa1zJxTEJV/dBQw0axYi2tNQH/FyqnJ31RJpA0rRKaIMSZMOT+cSVP4P7EQKsYD31qcAMQP2hpiWKhtkrTrZKJtYlxjNzivDBICB1PbRXBa0wm0/wgglDTZLwfhfRJj6EEebS2n1/DhknVfVE/um2/Seey6GkY/Vm5syzhNcUbP85KUqp70DjlsSLy/YtWITfh4wFJjTOM581O/pLNAMQW0AduJzZcmi7pm69kgwKoH2lv0Fhu1kjVL1fismK2sW+EX/A2NaHFlTxrqGtjlROPxUzpqUx8FHZGuaeIrJLSjC9THbQWDEHB+K4OxrGQ9YVNmc8XyBkAllMw59b9Gh2fva9MAh+dzErEx3CdlpwuTv3drksDuUBs8JrqJYaSR+IUybA6v8VtF2vgm21TiCUFZTrwKtq+f6BlJ4Sxlk8kSjdCwkTSj9AZVBY4e1PUwT0qpnvimXWhZT005ZxVhR1F5rLcCWsCzxfjCzn2Gyru58tAGuoMQ7w3N5oplBFrsmQ+0rcTS9isORFtwkCx7/E440NZKj8gemUZgqsadyUYbFobaHmb7D9mlTXXIDhiDyxiRLthJWmXCGe8q6BhWVCqnwegFioydtVDibXSfSqrvf0s3z37LVmrErpmAbr2Py1gdj0FXpnGUZ1ZiqSljx0KJkJelLYq9HP0Vy9Q6Z4L4iNKzUIFRDarNmZFXHU3PwgZKOweMFfjjWCAvOvnV1YG1GG2/oyamOVOCkmB0p7ZZsfxWGNAt2mI5uysclHsSK+nKNKvAjayOwvFldKCUgW42kq+dfXGXzr54+pG09w8/SBPdw0PnowYL8OO8obkqpbbBl2M3lW92p9BXOmGaNWHGpHO6KQ/9hxsMs4jUxLqps+kG1dMcms8+OtXXo/vVM6MBXcmwG21jNzxsgk8rIgc6a5MNohMNPyx0GdPMLg7ornESUjQpkpkZ24TUYWlptwzAasK0NeacPTFUSTV66mFdWvm0XfDELWJL9zl2CTRoDpWJU+pEzgmj0W4HAlMFcnsHh9jJ1Kgzqx0E6539FatIpWHRC3Znge/Rjdol2r40e+MD3Sz1ofb86bwl7aI5uWnwr8UVIDWACc8laPsP1c7ibpv5mxd1/YmuVaNlQ7yoPlVyuNVLq0hjk74aeT+7ZVCWH1WLFf5EzTQHN2jS/LGH0lh3DZ37L99Jk2cfteERxt16jbR78oyZEEHl5cmrWLVSWAABaxcucFuHfrSzWiaAWp5HO/or1hIuZYD8QvCtYM01TXWT1kh75caPPtAKOrEjS4xXnWartqIYq6VaEaSnxYqH2bsS4K9fTov31M7SCgK70FJwdVrATb4bqppQhW8Ta7BkvdWB6Gpz6FDtqQFnXXBeqw4MmfxQF1n9zRPWWC/7BjYhsgpWvBvtYCDD1ElifpDLyPnZLfcRoRQmqxAf7tdfsfjMyMrMUcNYtgXjYmauSWhuhJjp4oDFj7vVzeEMrQ8NAg1E5sj4MqVYBmmAsdGI59hpLakZ6MwHO7KRL5TlKVmt+Jr5ZOYZ10lKqhZxk59wk1m6as5OoNFHN/nRU6ZUTDsNdcwRxwX4Zt/MwFFpahFZ7yBNnlNNiYwHcmM9/fRVXVqlgsAuAxUaI8vDI61HvCakv2IFgiq9RrMQDosAdD+f3RLxpg7z55AOue1YR3Z/nLJxdjJTR+DmNJWkqR0a8WTi8PXb1RbU1nebF4P/Bg+2SFGNNvwayDq0Y89IrJ2kzoKdM8G8n9p6drIfY1Q/edrGquweR47W7JiN6HXimrNi1NnJGHmxzImlOHS2yCu2zeUz3kMNV6Hs49dfsfjSjEnnFE03Rs2Ze0+iaM0GpgakUNylPNOZBSPZ7cylvKPXMZxYZH3S14ERZf0PNSF9TuND6b1L6UAz+ZSwoUaUXILISgWPOd16GccEm0Xv2uQSqYzdASdAa0+xCfQ2HUinCxVGulvIVrdyzR5DICqhuGeIy8ktSo1zEzs8rUFQs5v7Jp5PfFAoFW1O7r3WpZg2RATfuf3n8tiEEYftr1gFd5v7tisDMXYlzZ/rsPyZiteZjnOkK20bGxShJYNI9UpEheipWfgcaMSPntDSZQlzqtvc08eXhL/6RjNPwZKH5A8JTgjowESq7KxRFImt6hz0qxJqeKfmK7Wxg2uLR8+plGI9Pmeq24qLjBB8/IIo3jIVKXNnsl2wVrwOCotXY/KUqMBSJ4sGO3m00I4gL62cQrDSpZ+RHfnaQLFEKqgpWSZsc2c2IzUq2fC2oSF1XWfPv5Fmd2nB3d0aO9I5BBR8dOn5EiLKkVyeMgAbW8dao0VpOvj582KWwVJ9veLNeZIFPrNHLdyGawMwsHLKoQCHOih2cKMUV3dgD6VIjJ7bMmlNhA84glFzfii2HbwRiHnzW2MCbFWwc9GEtNDkwChMayIGp7HG6fMX0sELutWDYQZ5Wv4IXRNHji6Rhtxa2waK5WwVGlhyKtyKA5tDoDhsc59xAeU9t6fFdx9PC819ecNUba0c1zir7R69HW5Ap/ig2tHJxdx8NWT/4QVdecdt7jY/5qkp6QhJd8nDs6RP+8lWUWgcihFylIYVq6PHpFSUTGzogM49UipO7yvGE201jmjEsIItSwJvgXML7pZoWo4GpkSL8OJRWViCrA4LNcr0pTfTTNfv2WA2VCtCjkJP8+PR3/RXLOE1QvmRq2BRilrY2QjSCGiusxMWb7xnlwlMdGfg8EutLuCYHI7ICfDN+A30J3qz/5ATXDjkzA5s05lasze0KZTZfcMc5WkwmdkVrw27sqFUGjLgXNGxqlZukrUt/ijSHTpATR0FlI15Puu8VLEhU7BLkXydmzxzUUFYQwvoyl0F2piUB7eekT9dHCBFqeyCK7Wt2Gk9u6Cb7LkuRsZU2hpiwV1FrEXhcEd/xarwBMnwapPOSSEBzD/pplMu8ub+ZdZEcb9OuvUQsiapJXEEqdN5k3mcXsf+QwZMuShT26x8U6hSs6KUsvy20klKgqLQdmIMimpeimRbzVAsraDgSlw7XxR4OO4KbLXXUtpMrm3hLsGs9DhEfKBjTTv3Os7YYc0l659rqVNOc0R1lv25ksYRnofkcCdmRcOJ81SRav7erjL/eOQvDwDWZ+3r6jfaNnZ9rc4ojXKu0aMg4Ng71E/BuYyfE4In333UrvjlfNCkO3li0rwRdOZHRYAdkKYLLJlqGemMCJbhYB9yvQslE0MJnGYYy4hdQrkQatIFJ43LgIrudUsgSp4a1lKBXzc5ckcYwqrj4K7N/BNdbvXvr9h1fJzZaktqA9+hMWssh9v7K9YqPJmZtYkgHMXS3OFMdfmBGu8c2sHumQVDD/qiMTZouAYJKNYEWdx+D2HJX6Qjy20YzgLVEMD42Uc0NyfFou3BuBtVuCbP2Yto7Sd6eJRQbN0HnrPlUSw1zjm1GWXKGFcy201DKz0Emmn5try68XOE1svXn+FV4elE5LwwtncxXjX94+uWJ3alsWEqjLTxZleFtRW+zrGBYmXU9pIYURhhdd8s1kJdFuPTmZ0zuq25uZkOR5vpNlS+8IH2/Q1udMWKJJXomdsG/zr2+/oLc0FeLBoB17QK1aF6bjf840/TRFvyr/z+1TR7+yO7tDIxbKD15ow/sdOH91BuO8deQwVDBjS5klilMyWcSSESA2tGqqIX7C7BRMAx3sKFUkHb0fLMNLuktZCPMavpq++o0a7euvKEkXY+ugJKUWgNtPBZwtqLyQ0Uy/FlFcqJKEloElPIwmB2qK01/+JLjZl8kA50m3uSgk1op1gvSQnIaQA8ivhuFVDQntASLEHSdr3QiOe0YubuxNdCDe4Zk7HsrWPN/P26AkTTQHtqnA854TiqOmPQGfdPjORm5QoeRYwWQdA075YjAF0Eq4Kg0PV3qh43wuLdYKxslNb6Zy07vUDyYPbW+xpiUNvKwJSrhjSwRDqkrEEsgiq0h1k3VqxuKpu9eqIcxI2ZzCyJkkHoM1UzV371UpqrDWIbHO7VvBhLWmzlOVB8dcArrr/wPCXjX3TgB2mhIQVasABQyn6OA2X5illHxhSUFM8uKlAbirlF79EqgVVGYI2ku3/loQBXrigVLCLkl0zg6UKEPxG6Ye6xBiJkyJueoJbFTH/xYpqSBxpld1lI/pS4+jMsufQKOhQkJW1LHK/32FyxalxG/XCyJckCs+EHTU7TG5s+p00CasTTVU+2rKZJSiEB6vAunie1ZI7Kpyh8DD+MpDRSnKEmp9sk265Gyoenu8tlpurpUVTD2kEdcdYlewm85dE4zFYhoV21UM93+uIb3rbiIDe1I5sYTjlSFFFrEQVvfd/9FcvLSn2aQR4SzfePZtdaAJRBWjzZ+BJYqkyVqCmEg395QTGGae/vn02jWK9FhEitRZb7FE1Us0ZEDivwRcdIZro2RxY8tGgHQxFYfckV396bFIz/Vxg8nkksyzIwBVBQCHe8K/TuJY/I9C4OA+hE4B7qfZVSVzTLMNXSmLkWOVIiE9fKKvB5bmVhqBDI7kUmtJJOMLji3V+xcmR4xjCN4fZOKjocRCjedm4WtzR8qCL596/bxdZjJmKpZphXU2PZcNtzOw/jo2hYcFfkWVkyfU9k499JX+RHeR+ZgC6C5XQeChH81NGaZKAhDa+sXGDMSsp08Ju/SOavaaWob5Qw3TZhgCgjNcLuWZM5lJ+aj8reX7EoqaBgVKRURjnaDRmjwkLdCq/V10lU243ytTZavPZOOlCbxpbfsixXN96n29QLq5g7dWvhz8Xmpex6KiFcL5uWOVv2IUbXt8FSh9T24GCVH2H4dzG3YGtHZUepWGe1/4fX0/7v1NuVzGk/WrqF0Dizj8wj5VaWUWzSHAgjHXB0tOmvWODqpq4rRJiFD71rdtyeAxS4mB6oR8LKh3fTgVZyci7BZG+kG1M0/MAtWLy3bIpSBaPr6Fn4IUCRLIsvxzrQnC/5O1tH7VB/E/86/HXmcIYGQwv0wjUwffD/XlappVH2zz43pSLtUQB0ioaK/lpCFcx662aKBR4T0DJRl5vYlMXtmaiKttptdbYBqey69Gk6+MXzNmjHNSlcPpA07TO4SYq1TGJ9KqqQoBXRu+6iUD0IBI4K/WrroYCdQBjqeLUEVId1mVfUJnoEBks5orxNqd79SMd5v5r2f/abdKBrYGyE3eJ34oVT0aO9FRj9HQBt36NcmyvWURgVXssmwJ09Qlz5eHNL1+y9D+zc0AMGTTUSD0OMZtsYEr212oCkkZ+FFFoKiwZtiVLBF792rLb3Nl2e9ELB5aHkhKVSGQMiPciKBHfS0XEWnDTI2Wg6Q6l+90ra/+VLWhbzujaP6AzTo/Z3Zj6KPBusx7JtRbFWcmJ1QCiVBJrd9KJmH11K+//3j+qtXE57uj52cp4rZKVoaoM1RmK2VK9IekvSZAZGT/5bYQ22q2LLrNcsub32aThrqqymnAUyVC4gM1pTKrZxMayw/08qqdRgt8Y6SuWN4oiy9ffOFMsbg5GeEIXeVJVqzE+1bIWNoyyGw0yeeSQNqBatzRVLhSN+9XZJm0dgrUKvOesqFSpJUAJKGrBYgPsUmPArgAJjiTFtKpVU0xcvpH0GQVX9sRSIFSa7ViqEvjPFanLYJeJykyJJUJx9OV9ok+S7amz+r9/YNu8Bp9UIiHv8/CAPYaiE2eDr2gRkwveKJBdcXaCr4oatVhKKRzSmW6EGbPLpcNuBatpUqv6u/M9fpxlK9d6H1km6GkoFuztULMttCQux5PIrvCi1dBra/EvNZb3uB6syJ7fQcZNs3uT2dzsfinGuSqqVtRF9xmmva6oebLHuyt9KAA64bnlauiIEh4nPfAXNilfGqdT72//Ta+nglyqpfvNnbcZ9Txc86UNlF47ha6rSHHXrr50plmr5jsiyBmR/ZgxpbyGQKV/bP/9Wyzu0yUFHTyZt5GSpL1NBLdOg6HjTHvMMaqrg5QxrRdqVI3gWO8tqRAnuvt2OSDcdQNkOZq0WYUjhys9+a+vXF1pTtpiptOdjtTTFc7fKtRPFsqTpgbAie80PN/4SAI15hEfvhSkHtulzhx/jWvR0Jl/t+zUmzOXFqogVyuDrkoLKCoCr6WWJttTmTG+YaTh2W+MWTHEgLMnoa7WnuAaYEXUt82EscPo7NdT1QVrVZ8oJ7hKxIbQj204Ui+QVmZIwaZN/P/5VlfDwBVgKNvvkUpr/25/SVI3SPZ0FwfbzvR8/aRdz2yLBul4wGoEXIm6sNsR69WTsjBQB6PMRL1FLm7dDOIvBZwSEGxgURteRsJT64FcvS6H+rGkatac00Gz3YEtmLtccKdMBVY0mk9vqayeKRQq6CWuKdk9fV9FUdNlqiMTNDNpQuq8SbMF0BNu0PtPRiQxHaO1U0mUBjH+hoo4j8Pl7mXL4X5136ItRl4NvI/xaClALjJWfnLbH+aAfaFD5xTfT/r9qQplFia++bbMYhk/Imk81I9DLP66gspt070yxWq1OE6UnPIZAvfRuVMMVJQuDM7deezsdsDBNC9Rmzz2axj/V1nTO5lSvMd1EC63Oid0IbyMqsGcNJ6Wp04CqOa+zP/y5gmSuk/YOtEhv/xcvaKGeBj3ZZEp7inlXGR8XzIoVVaGV6MJitIGqsePentmZYtUlkifH+yue6jqBRQrmacJlbvEzrlLRFiVOm+OAMM500nv0uHbFcCKyVn/a7hnW0dtu2YzTENT4r6LdeNFjVf5mPyvBVKUxim4HdGjjA+dgTGmkS6Gu/OpFVX2aTLZzrNQOLSYnNJS3+F8dy84Ui/ZByDWUyYptldMWkr+yLB4+wSyRJhfsHHIa9ir+Z1pjdPCn1+1E4cl3dASQzpYaaSs/wxKD4e6StUm2lZSQtOLoYlCAqj62os3feF89PjXOpVDTl7T/T8MKU82vskhvSM+voFFJVeSHr376h0S3d9ilti33TnPAZRnicFd52qfayNsX3GWlQ0SEs4tG67nmjN/ooHuW1845PlpfNSfRjThog5NkdJqLbRbVlNBCGyZsbfu2JHgMvEjATLbQEx6wWVZtyLnSxcK8qTY9sO9vqm1aMynVlI0PuivaPkYiS5Eaebq7fIzC62G8w2YUd/bYmWJZ8hBk/rI8hZFoVZS0MKU8EWwCIdiEn3NAL7flFhUZoZ3WB9psOnvhgh9frU2j46d18AYDq9pIamNfOibyWjA5FZ7r2UE6Gei0bWfaxLGvcxQOXtRF47psfK7dQgP2/Wn7XFIphXAKjspmaYsSHhmah2F2XQsx71AIO1EsS1cjkUoklefaRK+HsZFnVqSy3PmiMuEdnfHE2af6LT783A7jsM2kGljloDObGtLVvqz/snXuWziva20yCFCJa4fGUjpxOJ0m3dnqjlLNL2o3Nku2X3hTu8bVUdEHs/jsizQ0ZZKS5C/u8E5KKJXrbuEFEe5YuXaiWJaunLBGTRobAoiSqggjLAQYaBteHXCDsLIow/hmjXdNsWZahmv30LB9S/cWjtXI59SXEUtytCMnaf1XNPIPy6zIjzb1YK7zLsBhqcOFgWEDTcGg/FzHywl6i9d08uGb6ulyRpUO7mdzr91YbyUUUzKhE304EHQhXSw1Ezuz70SxSE0fsaxNNTKqEOA0seEnCy8KA06LmXPir+2Xk7roTC7OV5g/oM2yOil5/AaKpeqRS4+iFOPkGVZQsIeQDarMR3LyH6tYdXjJglKNakY/69IXPkQQmhBWG8kuqGQ9FCsNaAPmn1Vz3FjKOJQOeZsxFsUlCzpBj7XocykWO5PZGjffZ9mwTCmdZDePQpTQIwxM5WhHQG4zeGeKdeJEdEquRtRe/Efvx8dzyHMJmI2yXBql7U8DlQgHGqW2A9E4Z0GKZafNaLPqgD2FGq6gwc/1KLa5g23zKtUGHAVA1SlFcyWLlLhCcUuWXXfL1nW1+RZfaE+iOhLzT9QI1wZROhdzXahgpxvypqMhBRsIlnbTTFUiCx5RQB/IRCmUpkig60kQvW7e149iIVIJuQg8ixh3ZEhX6nZ98L5KEZUESWvsI48GY5VObODQbWBzzsfScUaDOxvFsqOHbtGwhbXHXLFKuywyHGy2YlPtJc1l2si45jOtzaRr9dIlKRdKRQmlKm6uQ944PnOmwV7OUR/lxvace7TFOMpUUFtCwhVcd1N3bbuvL8VClrmaCLH68da4PGOikevdIdVSyrbIIqAsmxgnYjQfhVDGDy6MNSwhUTA0QXVINchAK0uj2alNdcigq/W4qowWLwMuP2QYJA9qWoeC6tCqRLWpVBLZ9SHQolSinaU/Vyc4gnOM8GZlq8f16vHOOh0W5Rp+jCsxXcNstlmD5xAy9tpNiFWDOUoT3sRACWzsiPYYUyIKKvragBWi7uXPGrcByDtXxoakhGclMeYCU+DWm2VEhFnnA3v4YccAq3D4DzvW68VcNyVWaTsVDZCIlXm2fkmZQD6YMbuyOsMRr1SfyqWocFCAkmluy88GDzbP+FpZCyUnZ3TCj3fYa5uBuqJkhXNlbGAiWc4rZZbw8K8A+GywZlzX+Ou6UaxajibklqQbhylLNyPMM0JqTJWfUNBWq3yazMRT4flVI6jswUNgcNVx38bPIuApDaoh2pQrtLIG5rbvte26fhQrlwxe4ugrtrzKX7bs8aXjTUYAZ/knQHvXKuMenZyRp/+3/J2OvISYaMsK4L61v7FGBLdYLHt0QG2VayHg/DbAOX4nThN+bduuG8Uij5ovHGl3ci0yKGeEKVrOm24WBGj4r8jSHHR4rkZo4AmOjLtwRKABZ09eOXLw6empMEb8eAee6+R93ShW9JiW9Ck8ou0irbG8UL0W9+HgMdD56x5AeM4t2mg5o6ytJrs1qsOTsFAAg5ND+PGKX+Dq5n+OZrEChztgRv96eSmrz0VuV3bh9mCBBIag4LGvl2fplFzrDIeYi7wPYRgdi4zmTZWDOvibiALIimj2jCviZKderkQtN1E78MvxmhgF2DhaD+nqsz68wnhdWK+fEguZm8LIQub6516EHL3AUJjI/HjHd09JgF+ThQox3AGZUToZc1gIRYmM22WREx/zzVHt5WCALhsvluTvpRQAwVesTcxk7B7qsC8juvZ9rh/FOoYsc37nmJ7jMWzRQifAbtlEGecGLF5FmTsjJdQg2kQ8yqpnBuZlUbJlOXqBMPzL4auQX3t+149iZQlbeSPZx5cego82SSm5JOtow7jYAzIyITA0oUA02erwBSqqTgCy6WJ0TcuKk2FKIRWR9A4apUQyRI44noRhdzeRI4XYr31z3bSxioCLxYXbcbYl3gks+Sf/TpDFW+XXICT2kiplP/kvRV4H32B0W8RtysguxPXovn5KLH36S3mXJe7+a0IpMshjvWqIKBGaTGtCG1sTmrttlUe2riiSPP5KLK34LThzwGhjMtvm0Q5pYK5V2/WjWCeR4Jo8vhqZtSnNTeFPIqbTjHvdVIWnmegzXNuXwJlibV/G/yEpnCnWf8hs336itR5rTQNk+7TPKPwVS+CsxPorztyrmbQzxbqa0v8rpv3/AUMxqaF7oTtTAAAAAElFTkSuQmCC');
-        }
+        {{ stylesheet }}
         </style>
     </head>
     <body>
@@ -104,6 +273,7 @@ TEMPLATE = Template("""<!DOCTYPE html PUBLIC "-//W3C//DTD XHTML 1.0 Strict//EN"
    <table class="sortable-theme-finder" data-sortable>
     <thead>
         <tr>
+            {% if show_account %}<th>Account</th>{% endif %}
             <th>Service</th>
             <th>Hit Ratio</th>
             <th>Bandwidth</th>
@@ -113,12 +283,21 @@ TEMPLATE = Template("""<!DOCTYPE html PUBLIC "-//W3C//DTD XHTML 1.0 Strict//EN"
             <th>% 30x</th>
             <th>% 40x</th>
             <th>% 50x</th>
+            {% if show_history %}
+            <th>Requests Change %</th>
+            <th>Hit Ratio Change</th>
+            <th>% 50x Change</th>
+            <th>Requests Trend</th>
+            <th>Hit Ratio Trend</th>
+            <th>% 50x Trend</th>
+            {% endif %}
         </tr>
     </thead>
     <tbody>
         {% for service in services %}
             <tr>
-                <td>{{ service['name'] }}</td>
+                {% if show_account %}<td>{{ service['account'] }}</td>{% endif %}
+                <td class="service">{{ service['name'] }}</td>
                 <td>{{ service['hit_ratio'] }}</td>
                 <td>{{ service['bandwidth'] }}</td>
                 <td>{{ service['data'] }}</td>
@@ -127,6 +306,14 @@ TEMPLATE = Template("""<!DOCTYPE html PUBLIC "-//W3C//DTD XHTML 1.0 Strict//EN"
                 <td>{{ service['30x'] }}</td>
                 <td>{{ service['40x'] }}</td>
                 <td>{{ service['50x'] }}</td>
+                {% if show_history %}
+                <td>{{ service['requests_change'] if service['requests_change'] is not none else '-' }}</td>
+                <td>{{ service['hit_ratio_change'] if service['hit_ratio_change'] is not none else '-' }}</td>
+                <td>{{ service['50x_change'] if service['50x_change'] is not none else '-' }}</td>
+                <td>{{ service['requests_trend'] or '-' }}</td>
+                <td>{{ service['hit_ratio_trend'] or '-' }}</td>
+                <td>{{ service['50x_trend'] or '-' }}</td>
+                {% endif %}
             </tr>
         {% endfor %}
     </tbody>
@@ -135,50 +322,693 @@ TEMPLATE = Template("""<!DOCTYPE html PUBLIC "-//W3C//DTD XHTML 1.0 Strict//EN"
 </html>
 """)
 
+VIRTUAL_TEMPLATE = Template("""<!DOCTYPE html>
+<html lang="en">
+    <head>
+        <meta charset="utf-8"/>
+        <title>Fastly Service Statistics (Last 24 hours)</title>
+        <link href='http://fonts.googleapis.com/css?family=Open+Sans:400,600' rel='stylesheet' type='text/css' />
+        <link rel="stylesheet" href="http://cdnjs.cloudflare.com/ajax/libs/sortable/0.6.0/css/sortable-theme-finder.css" type='text/css'/>
+        <link rel="stylesheet" href="{{ assets['css'] }}" type="text/css"/>
+    </head>
+    <body>
+    <div class="header"><div id="logo"></div><h1>Fastly service summary (Last 24 hours)</h1>
+    <h3>Generated {{ generated }}</h3></div>
+    <input type="text" id="filter" placeholder="Service filter" />
+    <div id="viewport">
+    <table class="sortable-theme-finder">
+    <thead>
+        <tr>
+            {% if show_account %}<th data-field="account">Account</th>{% endif %}
+            <th data-field="name">Service</th>
+            <th data-field="hit_ratio">Hit Ratio</th>
+            <th data-field="bandwidth">Bandwidth</th>
+            <th data-field="data">Data</th>
+            <th data-field="requests">Requests</th>
+            <th data-field="20x">% 20x</th>
+            <th data-field="30x">% 30x</th>
+            <th data-field="40x">% 40x</th>
+            <th data-field="50x">% 50x</th>
+            {% if show_history %}
+            <th data-field="requests_change">Requests Change %</th>
+            <th data-field="hit_ratio_change">Hit Ratio Change</th>
+            <th data-field="50x_change">% 50x Change</th>
+            <th data-field="requests_trend">Requests Trend</th>
+            <th data-field="hit_ratio_trend">Hit Ratio Trend</th>
+            <th data-field="50x_trend">% 50x Trend</th>
+            {% endif %}
+        </tr>
+    </thead>
+    <tbody id="rows"></tbody>
+    </table>
+    </div>
+    <script type="application/json" id="services-data">{{ data }}</script>
+    <script src="{{ assets['js'] }}" type="text/javascript"></script>
+    </body>
+</html>
+""")
+
+
+FASTLY_ROOT = "https://api.fastly.com/"
+
+# Seconds to wait for a connection / response from the Fastly API
+REQUEST_TIMEOUT = (5, 60)
+
+# Number of attempts made for a request that is rate limited or fails
+# with a server error before giving up
+MAX_ATTEMPTS = 5
+
+# Longest wait in seconds before retrying a request, however long the API
+# asks us to wait
+MAX_RETRY_DELAY = 30
+
+# Number of keep-alive connections kept open to the Fastly API
+MAX_WORKERS = 8
+
+# Number of services requested per page when listing services
+SERVICES_PER_PAGE = 100
+
+RETRY_STATUSES = (429, 500, 502, 503, 504)
+
+# Statistics fields totalled for the per-service summary
+SUMMARY_FIELDS = ('hits', 'miss', 'requests', 'bandwidth', 'status_2xx', 'status_3xx', 'status_4xx', 'status_5xx')
+SUMMARY_COLUMNS = operator.itemgetter(*SUMMARY_FIELDS)
+
+# Number of hours of statistics summarised on the dashboard
+SUMMARY_HOURS = 24
+
+# Number of hours of statistics kept in the local stats cache
+CACHE_RETENTION_HOURS = 7 * 24
+
+# Number of seconds between refreshes of the dashboard in serve mode
+REFRESH_INTERVAL = 300
+
+# Number of seconds allowed to collect the statistics of a single account
+ACCOUNT_TIMEOUT = 300
+
+S3_REGION = 'eu-west-1'
+
+S3_CACHE_CONTROL = 'public, max-age=300'
+
+# Cache-Control of static assets, which are named after a digest of their content
+ASSET_CACHE_CONTROL = 'public, max-age=31536000, immutable'
+
+# Fields of each service written to the data file published alongside the HTML
+DATA_FIELDS = ('account', 'name', 'hit_ratio', 'bandwidth', 'requests', '20x', '30x', '40x', '50x')
+
+# Fields of each service added to the data file when history is recorded
+HISTORY_DATA_FIELDS = ('requests_change', 'hit_ratio_change', '50x_change', 'requests_trend', 'hit_ratio_trend', '50x_trend')
+
+# A service history record: timestamp, then the requests, hits, misses,
+# 5xx responses and bandwidth of the 24 hours before it
+HISTORY_RECORD = struct.Struct('<Iddddd')
+
+# (source, target, period, retention) - records in the source tier older
+# than the retention period are averaged in to one record per period in
+# the target tier
+HISTORY_ROLLUPS = (('raw', 'hour', 3600, 2 * 24 * 3600),
+                   ('hour', 'day', 24 * 3600, 60 * 24 * 3600))
+
+HISTORY_TIERS = ('day', 'hour', 'raw')
+
+# Number of days shown by the trend sparklines, and points per sparkline
+TREND_DAYS = 7
+TREND_POINTS = 14
+
+SPARKLINE_CHARS = u'\u2581\u2582\u2583\u2584\u2585\u2586\u2587\u2588'
+
+_S3_BUCKETS = {}
+
+_ASSETS = None
+
+# Digests of the objects published by this process { (bucket, key): digest }
+_PUBLISHED_DIGESTS = {}
 
-def make_api_request(api_key, endpoint, fastly_root="https://api.fastly.com/"):
+_SESSION = None
+_SESSION_LOCK = threading.Lock()
+
+
+class RunMetrics(object):
+    """
+    The time spent in, and bytes handled by, each stage of a run
+    """
+
+    def __init__(self):
+        self.started = time.time()
+        self.stages = {}
+        self.lock = threading.Lock()
+
+    def record(self, name, seconds=0.0, byte_count=0):
+        """
+        Add a call of a stage to its totals
+        """
+        with self.lock:
+            totals = self.stages.setdefault(name, {'calls': 0, 'seconds': 0.0, 'bytes': 0})
+            totals['calls'] += 1
+            totals['seconds'] += seconds
+            totals['bytes'] += byte_count
+
+    @contextlib.contextmanager
+    def stage(self, name):
+        """
+        Time the enclosed block as a call of a stage. The block may set the
+        number of bytes it handled on the yielded dict e.g. stage['bytes'] = 10
+        """
+        counts = {'bytes': 0}
+        started = time.time()
+        try:
+            yield counts
+        finally:
+            self.record(name, time.time() - started, counts['bytes'])
+
+    def as_dict(self):
+        """
+        Return the metrics as a JSON serialisable dictionary
+        """
+        with self.lock:
+            return {'started': self.started,
+                    'seconds': time.time() - self.started,
+                    'stages': dict((name, dict(totals)) for name, totals in self.stages.items())}
+
+    def as_prometheus(self):
+        """
+        Return the metrics in the Prometheus text exposition format
+        """
+        metrics = self.as_dict()
+        lines = ["# HELP fastlydash_run_seconds Duration of the last run",
+                 "# TYPE fastlydash_run_seconds gauge",
+                 "fastlydash_run_seconds {0:.6f}".format(metrics['seconds']),
+                 "# HELP fastlydash_run_timestamp_seconds Start time of the last run",
+                 "# TYPE fastlydash_run_timestamp_seconds gauge",
+                 "fastlydash_run_timestamp_seconds {0:.3f}".format(metrics['started'])]
+        for metric, field, description in (('stage_seconds', 'seconds', 'Time spent in each stage of the last run'),
+                                           ('stage_bytes', 'bytes', 'Bytes handled by each stage of the last run'),
+                                           ('stage_calls', 'calls', 'Calls of each stage in the last run')):
+            lines.append("# HELP fastlydash_{0} {1}".format(metric, description))
+            lines.append("# TYPE fastlydash_{0} gauge".format(metric))
+            for name, totals in sorted(metrics['stages'].items()):
+                lines.append('fastlydash_{0}{{stage="{1}"}} {2}'.format(metric, name, totals[field]))
+        return "\n".join(lines) + "\n"
+
+# Metrics of the current run, replaced at the start of each run
+METRICS = RunMetrics()
+
+class CountingReader(object):
+    """
+    Wrap a file, counting the bytes read from it
+    """
+
+    def __init__(self, raw):
+        self.raw = raw
+        self.bytes = 0
+
+    def read(self, size=-1):
+        data = self.raw.read(size)
+        self.bytes += len(data)
+        return data
+
+def get_session():
+    """
+    Return the shared keep-alive session used for all Fastly API requests
+    """
+    global _SESSION
+    with _SESSION_LOCK:
+        if _SESSION is None:
+            _SESSION = requests.Session()
+            adapter = requests.adapters.HTTPAdapter(pool_connections=MAX_WORKERS,
+                                                    pool_maxsize=MAX_WORKERS)
+            _SESSION.mount("https://", adapter)
+            _SESSION.mount("http://", adapter)
+        return _SESSION
+
+
+def retry_delay(resp, attempt):
+    """
+    Return the number of seconds to wait before retrying a failed request,
+    honouring Fastly's rate limit headers when they are present, up to
+    MAX_RETRY_DELAY
+    """
+    if resp is not None:
+        if resp.headers.get("Retry-After"):
+            try:
+                return min(max(float(resp.headers["Retry-After"]), 0), MAX_RETRY_DELAY)
+            except ValueError:
+                pass
+        if resp.headers.get("Fastly-RateLimit-Remaining") == "0" and resp.headers.get("Fastly-RateLimit-Reset"):
+            try:
+                return min(max(float(resp.headers["Fastly-RateLimit-Reset"]) - time.time(), 0), MAX_RETRY_DELAY)
+            except ValueError:
+                pass
+    return min(2 ** attempt, MAX_RETRY_DELAY)
+
+
+def check_deadline(deadline, doing):
+    """
+    Raise requests.Timeout if a deadline has passed
+    """
+    if deadline is not None and time.time() >= deadline:
+        raise requests.Timeout("Deadline passed while {0}".format(doing))
+
+
+def make_api_request(api_key, endpoint, fastly_root=FASTLY_ROOT, stream=False, deadline=None):
     """
     Make api request, check api response, return response if
     appropriate.
 
-    :param endpoint: str. API endpoint e.g.
-    :return:
+    Requests are made over a shared keep-alive session, and retried with
+    backoff when rate limited or on server errors.
+
+    :param endpoint: str. API endpoint e.g. "service"
+    :param stream: bool. Leave the response body unread so it can be
+                   consumed incrementally from resp.raw
+    :param deadline: float. Unix time by which the request, including any
+                     retries, must complete or raise requests.Timeout
+    :return: requests.Response
 
     """
     url = fastly_root + endpoint
     headers = {"Fastly-Key": api_key,
                "Accept": "application/json"}
 
-    LOGGER.info("Making {0} request to {1}".format("GET", endpoint))
-    resp = requests.get(url, headers=headers)
-    return resp
+    with METRICS.stage("api_" + endpoint.split('?', 1)[0].replace('/', '_')) as stage:
+        for attempt in range(MAX_ATTEMPTS):
+            LOGGER.info("Making {0} request to {1}".format("GET", endpoint))
+            start = time.time()
+            timeout = REQUEST_TIMEOUT
+            if deadline is not None:
+                check_deadline(deadline, endpoint)
+                timeout = tuple(min(seconds, deadline - start) for seconds in REQUEST_TIMEOUT)
+            try:
+                resp = get_session().get(url, headers=headers, timeout=timeout, stream=stream)
+            except (requests.ConnectionError, requests.Timeout) as err:
+                LOGGER.warning("Request to {0} failed: {1}".format(endpoint, err))
+                resp = None
+                if attempt == MAX_ATTEMPTS - 1:
+                    raise
+            else:
+                LOGGER.info("GET {0} returned {1} in {2:.0f}ms".format(endpoint, resp.status_code,
+                                                                     (time.time() - start) * 1000))
+                if resp.status_code not in RETRY_STATUSES or attempt == MAX_ATTEMPTS - 1:
+                    resp.raise_for_status()
+                    stage['bytes'] = int(resp.headers.get('Content-Length') or (0 if stream else len(resp.content)))
+                    return resp
+                resp.close()
+
+            delay = retry_delay(resp, attempt)
+            if deadline is not None:
+                delay = min(delay, max(deadline - time.time(), 0))
+            LOGGER.warning("Retrying {0} in {1:.1f}s".format(endpoint, delay))
+            time.sleep(delay)
+
 
-def get_all_services(api_key):
+def iter_services(api_key, per_page=SERVICES_PER_PAGE, deadline=None):
     """
-    Return a dictionary of configured services { 'name': 'id' }
+    Yield a (name, id) tuple for each configured service, following
+    pagination so only one page of services is held in memory at a time
     """
-    LOGGER.debug("In function get_all_services")
-    endpoint = "service"
+    LOGGER.debug("In function iter_services")
+    endpoint = "service?page=1&per_page={0}".format(per_page)
+    page = 1
+    seen = set()
+
+    while endpoint:
+        LOGGER.info("Getting services page {0}".format(page))
+        resp = make_api_request(api_key, endpoint, deadline=deadline)
+        with METRICS.stage('decode'):
+            services = resp.json()
+
+        new_services = [service for service in services if service['id'] not in seen]
+        for service in new_services:
+            seen.add(service['id'])
+            yield service['name'], service['id']
+
+        next_link = resp.links.get('next', {}).get('url')
+        if next_link and next_link.startswith(FASTLY_ROOT):
+            endpoint = next_link[len(FASTLY_ROOT):]
+        elif len(services) >= per_page and new_services:
+            endpoint = "service?page={0}&per_page={1}".format(page + 1, per_page)
+        else:
+            endpoint = None
+        page += 1
 
+    LOGGER.debug("Exiting function iter_services")
+
+def get_all_services(api_key, deadline=None):
+    """
+    Return a dictionary of configured services { 'name': 'id' }
+    """
     LOGGER.info("Getting all services")
-    resp = make_api_request(api_key, endpoint)
+    return dict(iter_services(api_key, deadline=deadline))
 
-    LOGGER.debug("Exiting function get_all_services")
-    services = {service['name'] : service['id'] for service in resp.json()}
-    return services
+def _iter_statistics_response(resp, deadline=None):
+    """
+    Yield a (service id, [ {...} ]) tuple for each service in a stats
+    response, parsing it as it is downloaded, until the deadline
+    """
+    # The response is downloaded and parsed while it is iterated, so only
+    # the time spent fetching each service is recorded as decoding
+    resp.raw.decode_content = True
+    reader = CountingReader(resp.raw)
+    seconds = 0.0
+    try:
+        started = time.time()
+        for service_id, buckets in ijson.kvitems(reader, 'data', use_float=True):
+            seconds += time.time() - started
+            check_deadline(deadline, "reading statistics")
+            yield service_id, buckets
+            started = time.time()
+        seconds += time.time() - started
+    finally:
+        METRICS.record('decode', seconds, reader.bytes)
+        resp.close()
+
+def request_statistics(api_key, from_hours_ago=24, from_time=None, by=None, deadline=None):
+    """
+    Request statistics for all services, returning the response with its
+    body left unread.
+
+    :param from_time: int. Unix timestamp to fetch statistics from, instead
+                      of from_hours_ago
+    :param by: str. Bucket size e.g. "hour"
+    """
+    LOGGER.debug("In function request_statistics")
+    if from_time is None:
+        endpoint = "stats?from={0}+hours+ago".format(from_hours_ago)
+        LOGGER.info("Getting all service statistics for the last {0} hours".format(from_hours_ago))
+    else:
+        endpoint = "stats?from={0}".format(int(from_time))
+        LOGGER.info("Getting all service statistics since {0}".format(
+            time.strftime('%H:%M %Z on %A %d %b %Y', time.localtime(from_time))))
+    if by:
+        endpoint += "&by={0}".format(by)
+
+    resp = make_api_request(api_key, endpoint, stream=True, deadline=deadline)
+
+    LOGGER.debug("Exiting function request_statistics")
+    return resp
+
+def iter_statistics(api_key, from_hours_ago=24, from_time=None, by=None, deadline=None):
+    """
+    Request statistics for all services, returning an iterator of
+    (service id, [ {...} ]) tuples parsed as the response is downloaded
+    """
+    return _iter_statistics_response(request_statistics(api_key, from_hours_ago, from_time, by, deadline), deadline)
 
 def get_statistics(api_key, from_hours_ago=24):
     """
-    Return a dictionary of configured services { 'name': 'id' }
+    Return the statistics for all services { 'data': { 'id': [ {...} ] } }
+    """
+    return {'data': dict(iter_statistics(api_key, from_hours_ago))}
+
+def open_stats_cache(path):
+    """
+    Open (creating if needed) the SQLite stats cache at path
+    """
+    conn = sqlite3.connect(path)
+    columns = [column[1] for column in conn.execute("PRAGMA table_info(stats)")]
+    if columns and 'account' not in columns:
+        LOGGER.info("Discarding stats cache created by an earlier version")
+        conn.execute("DROP TABLE stats")
+    conn.execute("CREATE TABLE IF NOT EXISTS stats ("
+                 "account TEXT NOT NULL, "
+                 "service_id TEXT NOT NULL, "
+                 "start_time INTEGER NOT NULL, "
+                 "data TEXT NOT NULL, "
+                 "PRIMARY KEY (account, service_id, start_time))")
+    conn.execute("CREATE INDEX IF NOT EXISTS stats_start_time ON stats (start_time)")
+    return conn
+
+def cache_account(api_key):
+    """
+    Return the identifier used for an account's buckets in the stats cache,
+    so API keys aren't written to disk
+    """
+    return hashlib.sha1(api_key).hexdigest()[:16]
+
+def update_stats_cache(conn, api_key, from_hours_ago=24, retention_hours=CACHE_RETENTION_HOURS, deadline=None):
+    """
+    Fetch the hourly statistics buckets newer than those already in the
+    cache, and evict buckets older than the retention period.
+
+    The most recent cached bucket is fetched again, as it will have been
+    incomplete when it was stored.
+    """
+    now = int(time.time())
+    window_start = now - now % 3600 - from_hours_ago * 3600
+
+    account = cache_account(api_key)
+    last_cached = conn.execute("SELECT MAX(start_time) FROM stats WHERE account = ?", (account,)).fetchone()[0]
+    from_time = max(last_cached or 0, window_start)
+
+    rows = []
+    for service_id, buckets in iter_statistics(api_key, from_time=from_time, by="hour", deadline=deadline):
+        for bucket in buckets:
+            rows.append((account, service_id, int(bucket['start_time']), json.dumps(bucket)))
+
+    with METRICS.stage('cache'), conn:
+        conn.executemany("INSERT OR REPLACE INTO stats (account, service_id, start_time, data) VALUES (?, ?, ?, ?)", rows)
+        evicted = conn.execute("DELETE FROM stats WHERE start_time < ?",
+                               (now - retention_hours * 3600,)).rowcount
+
+    LOGGER.info("Cached {0} stats buckets, evicted {1}".format(len(rows), evicted))
+
+def merge_buckets(buckets):
+    """
+    Total the SUMMARY_FIELDS of a list of statistics buckets, returning a
+    tuple in SUMMARY_FIELDS order
+    """
+    try:
+        if len(buckets) == 1:
+            totals = SUMMARY_COLUMNS(buckets[0])
+            if None not in totals:
+                return totals
+        return tuple(map(sum, zip(*map(SUMMARY_COLUMNS, buckets))))
+    except (KeyError, TypeError):
+        # Buckets with missing or null fields count them as zero
+        rows = [tuple(bucket.get(field) or 0 for field in SUMMARY_FIELDS) for bucket in buckets]
+        return tuple(map(sum, zip(*rows)))
+
+def rollup_buckets(buckets, field, how='sum', from_time=None, to_time=None):
+    """
+    Roll up a field across the buckets starting within [from_time, to_time).
+
+    :param how: str. 'sum', 'mean' or a percentile e.g. 'p95'
+    :return: float, or None if no buckets fall within the window
+    """
+    values = sorted(float(bucket.get(field) or 0) for bucket in buckets
+                    if (from_time is None or bucket.get('start_time', 0) >= from_time) and
+                    (to_time is None or bucket.get('start_time', 0) < to_time))
+    if not values:
+        return None
+
+    if how == 'sum':
+        return sum(values)
+    if how == 'mean':
+        return sum(values) / len(values)
+    if how.startswith('p'):
+        rank = int(math.ceil(float(how[1:]) / 100 * len(values)))
+        return values[min(max(rank, 1), len(values)) - 1]
+    raise ValueError("Unknown rollup {0}".format(how))
+
+def iter_cached_statistics(conn, api_key, from_hours_ago=24, retention_hours=CACHE_RETENTION_HOURS, deadline=None):
+    """
+    Refresh the stats cache, returning an iterator of (service id, [ {...} ])
+    tuples of the cached statistics buckets for the last from_hours_ago hours
+    """
+    update_stats_cache(conn, api_key, from_hours_ago, retention_hours, deadline)
+
+    now = int(time.time())
+    cursor = conn.execute("SELECT service_id, data FROM stats WHERE account = ? AND start_time >= ? ORDER BY service_id",
+                          (cache_account(api_key), now - now % 3600 - from_hours_ago * 3600))
+    return _iter_cached_statistics_rows(cursor)
+
+def _iter_cached_statistics_rows(cursor):
+    """
+    Yield a (service id, [ {...} ]) tuple for each service in a stats cache
+    query ordered by service id
+    """
+    service_id, buckets = None, []
+    for row_service_id, data in cursor:
+        if row_service_id != service_id and buckets:
+            yield service_id, buckets
+            buckets = []
+        service_id = row_service_id
+        buckets.append(json.loads(data))
+
+    if buckets:
+        yield service_id, buckets
+
+def history_path(directory, service_id, tier):
+    """
+    Return the path of a service's history file for a tier
+    """
+    return os.path.join(directory, "{0}.{1}".format(service_id, tier))
+
+def read_history(path, since=0):
+    """
+    Return the history records in a file with a timestamp of at least since.
+
+    Records are fixed width and in timestamp order, so the first record is
+    found with a binary search and only the records after it are read.
+    """
+    try:
+        history_file = open(path, 'rb')
+    except IOError:
+        return []
+
+    with history_file:
+        history_file.seek(0, os.SEEK_END)
+        count = history_file.tell() // HISTORY_RECORD.size
+
+        low, high = 0, count
+        while low < high:
+            middle = (low + high) // 2
+            history_file.seek(middle * HISTORY_RECORD.size)
+            if HISTORY_RECORD.unpack(history_file.read(HISTORY_RECORD.size))[0] < since:
+                low = middle + 1
+            else:
+                high = middle
+
+        history_file.seek(low * HISTORY_RECORD.size)
+        data = history_file.read((count - low) * HISTORY_RECORD.size)
+
+    return [HISTORY_RECORD.unpack_from(data, offset) for offset in range(0, len(data), HISTORY_RECORD.size)]
+
+def read_service_history(directory, service_id, since=0):
+    """
+    Return a service's history records since a timestamp, across all tiers
+    """
+    records = []
+    for tier in HISTORY_TIERS:
+        records.extend(read_history(history_path(directory, service_id, tier), since))
+    return records
+
+def append_history(path, records):
     """
-    LOGGER.debug("In function get_statistics")
-    endpoint = "stats?from={0}+hours+ago".format(from_hours_ago)
+    Append records to a history file, first dropping any partially written
+    record left by an interrupted write
+    """
+    if os.path.exists(path):
+        size = os.path.getsize(path)
+        if size % HISTORY_RECORD.size:
+            with open(path, 'r+b') as history_file:
+                history_file.truncate(size - size % HISTORY_RECORD.size)
+
+    with open(path, 'ab') as history_file:
+        history_file.write(b''.join(HISTORY_RECORD.pack(*record) for record in records))
+
+def rollup_history(directory, service_id, now):
+    """
+    Downsample records which have passed the retention period of their tier
+    in to averages over the period of the next tier.
+
+    Only the first record of a tier is read unless it has expired, so runs
+    with nothing to roll up don't read the whole file. Periods already in
+    the next tier are skipped, so a run interrupted before the source file
+    was rewritten doesn't roll its records up twice.
+    """
+    for source, target, period, retention in HISTORY_ROLLUPS:
+        cutoff = now - retention
+        cutoff -= cutoff % period
+
+        source_path = history_path(directory, service_id, source)
+        try:
+            with open(source_path, 'rb') as history_file:
+                first = history_file.read(HISTORY_RECORD.size)
+        except IOError:
+            continue
+        if len(first) < HISTORY_RECORD.size or HISTORY_RECORD.unpack(first)[0] >= cutoff:
+            continue
+
+        records = read_history(source_path)
+        expired = [record for record in records if record[0] < cutoff]
+        if not expired:
+            continue
+
+        groups = {}
+        for record in expired:
+            groups.setdefault(record[0] - record[0] % period, []).append(record)
+        target_path = history_path(directory, service_id, target)
+        rolled_up = set(record[0] for record in read_history(target_path, min(groups)))
+        append_history(target_path,
+                       [(start,) + tuple(sum(values) / len(values) for values in list(zip(*group))[1:])
+                        for start, group in sorted(groups.items()) if start not in rolled_up])
+
+        with open(source_path + '.tmp', 'wb') as history_file:
+            history_file.write(b''.join(HISTORY_RECORD.pack(*record) for record in records[len(expired):]))
+        os.rename(source_path + '.tmp', source_path)
+
+def sparkline(values):
+    """
+    Return a line of block characters charting a list of values
+    """
+    values = [value for value in values if value is not None]
+    if not values:
+        return '-'
+    low, high = min(values), max(values)
+    scale = (len(SPARKLINE_CHARS) - 1) / float(high - low) if high > low else 0
+    return u''.join(SPARKLINE_CHARS[int(round((value - low) * scale))] for value in values)
+
+def history_metrics(record):
+    """
+    Return the (requests, hit ratio %, 5xx rate %) of a history record
+    """
+    _, requests_total, hits, miss, status_5xx, _ = record
+    hit_ratio = 100 * hits / (hits + miss) if hits + miss else None
+    error_rate = 100 * status_5xx / requests_total if requests_total else None
+    return requests_total, hit_ratio, error_rate
+
+def change(current, previous):
+    """
+    Return the difference between two values, or None if either is unknown
+    """
+    if current is None or previous is None:
+        return None
+    return round(current - previous, 1)
+
+def add_history(directory, services_data, now=None):
+    """
+    Record the statistics of each service in its history, then add the
+    change since the previous 24 hours and trend sparklines to its row
+    """
+    now = int(now or time.time())
+    if not os.path.isdir(directory):
+        os.makedirs(directory)
+
+    for service_data in services_data:
+        service_data.update((field, None) for field in HISTORY_DATA_FIELDS)
+        if 'totals' not in service_data:
+            continue
+
+        totals = dict(zip(SUMMARY_FIELDS, service_data['totals']))
+        record = (now,) + tuple(float(totals[field]) for field in ('requests', 'hits', 'miss', 'status_5xx', 'bandwidth'))
+        append_history(history_path(directory, service_data['id'], 'raw'), [record])
+        rollup_history(directory, service_data['id'], now)
+
+        records = read_service_history(directory, service_data['id'], now - TREND_DAYS * 24 * 3600)
+        current = history_metrics(record)
+
+        previous = [history_record for history_record in records if history_record[0] <= now - 24 * 3600]
+        if previous:
+            previous = history_metrics(previous[-1])
+            if previous[0]:
+                service_data['requests_change'] = round(100 * (current[0] - previous[0]) / previous[0], 1)
+            service_data['hit_ratio_change'] = change(current[1], previous[1])
+            service_data['50x_change'] = change(current[2], previous[2])
 
-    LOGGER.info("Getting all service statistics for the last {0} hours".format(from_hours_ago))
-    resp = make_api_request(api_key, endpoint)
+        points = [[] for _ in range(TREND_POINTS)]
+        point_length = TREND_DAYS * 24 * 3600 / float(TREND_POINTS)
+        for history_record in records:
+            point = int((history_record[0] - (now - TREND_DAYS * 24 * 3600)) / point_length)
+            points[min(point, TREND_POINTS - 1)].append(history_metrics(history_record))
 
-    LOGGER.debug("Exiting function get_statistics")
-    return resp.json()
+        for index, field in enumerate(('requests_trend', 'hit_ratio_trend', '50x_trend')):
+            series = []
+            for point in points:
+                values = [metrics[index] for metrics in point if metrics[index] is not None]
+                if values:
+                    series.append(sum(values) / len(values))
+            service_data[field] = sparkline(series)
 
 def sizeof_fmt(num, suffix='b'):
     """
@@ -190,70 +1020,546 @@ def sizeof_fmt(num, suffix='b'):
         num /= 1024.0
     return "%.1f%s%s" % (num, 'Yi', suffix)
 
-@argh.arg('fastly_api_key', help='The Fastly API key used to query Fastly')
-@argh.arg('--s3bucket', help='The name of the S3 bucket to write to')
-@argh.arg('--filename', default='fastly-stats.html', help='The name of the HTML file to write')
-@argh.arg('--s3acl', choices=('private', 'public-read', 'project-private', 'public-read-write', 'authenticated-read', 'bucket-owner-read', 'bucket-owner-full-control'), default='public-read', help='The canned ACL string to set on the object written to S3')
-def write_fastly_summary(**kwargs):
+def empty_service_row(name):
     """
-    Output a summary of all fastly distributions on stdout, and optionally write
-    it as an HTML file to S3
+    Return the summary row for a service without statistics
     """
+    return {'name': name, 'hit_ratio': '-', 'bandwidth': '-', 'data': '-', 'requests': '-', '20x': '-', '30x': '-', '40x': '-', '50x': '-'}
 
-    services = get_all_services(kwargs['fastly_api_key'])
-    stats = get_statistics(kwargs['fastly_api_key'])
+def summarise_services(names, totals):
+    """
+    Return the summary rows for services from their names and the totals of
+    their statistics buckets, as returned by merge_buckets.
 
-    table = PrettyTable(["Service", "Hit Ratio", "Bandwidth", "Data", "Requests", "% 20x", "% 30x", "% 40x", "% 50x"])
+    Each column of the summary is computed across all of the services at
+    once, rather than a row at a time. Percentages are whole numbers rounded
+    down, computed with integer division so e.g. 29 of 100 is 29 rather than
+    the 28 of int(100 * 0.29).
+    """
+    if not totals:
+        return []
 
-    services_data = []
+    hits, miss, requests_total, bandwidth, status_2xx, status_3xx, status_4xx, status_5xx = zip(*totals)
 
-    for service in services:
-        service_data = {'name': service, 'hit_ratio': '-', 'bandwidth': '-', 'data': '-', 'requests': '-', '20x': '-', '30x': '-', '40x': '-', '50x': '-'}
+    hit_ratios = [100 * hit // (hit + missed) if hit else None for hit, missed in zip(hits, miss)]
+    percent_2xx, percent_3xx, percent_4xx, percent_5xx = [
+        [100 * count // total if total else '-' for count, total in zip(counts, requests_total)]
+        for counts in (status_2xx, status_3xx, status_4xx, status_5xx)]
+    data = [sizeof_fmt(size) for size in bandwidth]
 
-        if services[service] in stats['data']:
-            if stats['data'][services[service]][0]['hit_ratio']:
-                hitrate = int(float(stats['data'][services[service]][0]['hit_ratio']) * 100)
-            else:
-                hitrate = None
+    columns = zip(names, hit_ratios, bandwidth, data, requests_total, percent_2xx, percent_3xx, percent_4xx, percent_5xx, totals)
+    return [{'name': column[0], 'hit_ratio': column[1], 'bandwidth': column[2], 'data': column[3], 'requests': column[4],
+             '20x': column[5], '30x': column[6], '40x': column[7], '50x': column[8], 'totals': column[9]}
+            for column in columns]
+
+def get_service_rows(api_key, from_hours_ago=24, cache=None, cache_retention=CACHE_RETENTION_HOURS, deadline=None):
+    """
+    Return a summary row for every service.
 
-            service_data['hit_ratio'] = hitrate
-            service_data['bandwidth'] = stats['data'][services[service]][0]['bandwidth']
-            service_data['data'] = sizeof_fmt(stats['data'][services[service]][0]['bandwidth'])
-            service_data['requests'] = stats['data'][services[service]][0]['requests']
-            service_data['20x'] = int(100 * (stats['data'][services[service]][0]['status_2xx'] / float(stats['data'][services[service]][0]['requests'])))
-            service_data['30x'] = int(100 * (stats['data'][services[service]][0]['status_3xx'] / float(stats['data'][services[service]][0]['requests'])))
-            service_data['40x'] = int(100 * (stats['data'][services[service]][0]['status_4xx'] / float(stats['data'][services[service]][0]['requests'])))
-            service_data['50x'] = int(100 * (stats['data'][services[service]][0]['status_5xx'] / float(stats['data'][services[service]][0]['requests'])))
+    The service list is fetched while the stats request is in flight, then
+    each service's buckets are totalled while the stats response is still
+    being read, so only the totals are held in memory. The summary rows
+    are then computed for all services at once. Services without
+    statistics are last.
 
+    :param cache: sqlite3.Connection. Stats cache to refresh and summarise
+                  from, rather than fetching the whole period
+    :param deadline: float. Unix time by which the statistics must have been
+                     fetched or raise requests.Timeout
+    """
+    pool = ThreadPool(1)
+    resp = None
+    try:
+        services = pool.apply_async(get_all_services, (api_key, deadline))
+        if cache is None:
+            resp = request_statistics(api_key, from_hours_ago, by="hour", deadline=deadline)
+            stats = _iter_statistics_response(resp, deadline)
         else:
+            stats = iter_cached_statistics(cache, api_key, from_hours_ago, cache_retention, deadline)
+        names = {service_id: name for name, service_id in services.get().items()}
+    except Exception:
+        # The stats response is only closed once it has been read, so
+        # release its connection here if the service list can't be fetched
+        if resp is not None:
+            resp.close()
+        raise
+    finally:
+        pool.close()
+
+    service_ids, service_names, totals = [], [], []
+    seconds = 0.0
+    for service_id, buckets in stats:
+        if service_id in names:
+            started = time.time()
+            service_ids.append(service_id)
+            service_names.append(names.pop(service_id))
+            totals.append(merge_buckets(buckets))
+            seconds += time.time() - started
+
+    started = time.time()
+    rows = summarise_services(service_names, totals)
+    METRICS.record('aggregate', seconds + time.time() - started)
+
+    for service_id, name in names.items():
+        LOGGER.info("No stats for service ID {0}".format(name))
+        rows.append(empty_service_row(name))
+        service_ids.append(service_id)
+
+    for service_data, service_id in zip(rows, service_ids):
+        service_data['id'] = service_id
+    return rows
+
+def get_account_name(api_key, deadline=None):
+    """
+    Return the name of the Fastly customer an API key belongs to
+    """
+    return make_api_request(api_key, "current_customer", deadline=deadline).json()['name']
+
+def load_accounts(api_keys, accounts_file=None):
+    """
+    Return a list of (name, api_key) tuples for the given API keys, and the
+    accounts in a JSON accounts file { 'name': 'api key' }.
+
+    Accounts given only by API key have a name of None.
+    """
+    accounts = [(None, api_key) for api_key in api_keys]
+    if accounts_file:
+        with open(accounts_file) as accounts_fp:
+            accounts.extend(sorted(json.load(accounts_fp).items()))
+    return accounts
+
+def collect_account_rows(name, api_key, kwargs, lookup_name=True, deadline=None):
+    """
+    Return the summary rows for every service in an account, labelled with
+    the account name, raising requests.Timeout if they can't be collected
+    by the deadline
+    """
+    if name is None and lookup_name:
+        try:
+            name = get_account_name(api_key, deadline)
+        except Exception:
+            LOGGER.warning("Unable to look up the account name for API key ...{0}".format(api_key[-4:]))
+            name = "...{0}".format(api_key[-4:])
+
+    cache = open_stats_cache(kwargs['cache']) if kwargs['cache'] else None
+
+    try:
+        rows = get_service_rows(api_key, cache=cache, cache_retention=kwargs['cache_retention'], deadline=deadline)
+    finally:
+        if cache is not None:
+            cache.close()
+
+    for row in rows:
+        row['account'] = name
+    LOGGER.info("Collected {0} services for account {1}".format(len(rows), name))
+    return rows
+
+def collect_rows(accounts, kwargs):
+    """
+    Collect the summary rows for all accounts in parallel.
+
+    An account that fails, or takes longer than account_timeout seconds, is
+    logged and left out rather than failing the whole summary. Each account
+    is given the same deadline, so its worker stops making requests once it
+    has been left out.
+
+    :return: (services_data, [ 'account' ]) the rows collected and the names
+             of the accounts left out
+    :raises RuntimeError: if no account could be collected
+    """
+    pool = ThreadPool(len(accounts))
+    try:
+        deadline = time.time() + kwargs['account_timeout']
+        results = [pool.apply_async(collect_account_rows, (name, api_key, kwargs, len(accounts) > 1, deadline))
+                   for name, api_key in accounts]
+
+        services_data = []
+        missing = []
+        for (name, api_key), result in zip(accounts, results):
+            try:
+                services_data.extend(result.get(max(deadline - time.time(), 0)))
+            except Exception as err:
+                missing.append(name or "...{0}".format(api_key[-4:]))
+                LOGGER.error("Failed to collect account {0}: {1!r}".format(missing[-1], err))
+
+        if len(missing) == len(accounts):
+            raise RuntimeError("Failed to collect any account")
+        return services_data, missing
+    finally:
+        pool.close()
+
+def format_data(services_data, data_format):
+    """
+    Serialise the summary rows as compact JSON or CSV
+    """
+    fields = DATA_FIELDS
+    if services_data and 'requests_trend' in services_data[0]:
+        fields += HISTORY_DATA_FIELDS
+    rows = []
+    for service_data in services_data:
+        row = [service_data.get(field) for field in fields]
+        # The '-' placeholders after the account and name are written as null
+        rows.append(row[:2] + [None if value == '-' else value for value in row[2:]])
+
+    if data_format == 'csv':
+        output = io.BytesIO()
+        writer = csv.writer(output)
+        writer.writerow(fields)
+        writer.writerows([[unicode(cell).encode('utf-8') if cell is not None else '' for cell in data_row] for data_row in rows])
+        return output.getvalue()
+
+    return json.dumps({'fields': fields, 'services': rows}, separators=(',', ':'), sort_keys=True)
+
+def fingerprint(name, body, extension):
+    """
+    Return a filename for body which changes whenever its content does
+    """
+    return "{0}-{1}.{2}".format(name, hashlib.md5(body).hexdigest()[:12], extension)
+
+def get_assets():
+    """
+    Return the static assets of the virtual dashboard as
+    ({ 'css': filename, 'js': filename }, { filename: (body, content_type) }),
+    named after their content so they can be cached indefinitely
+    """
+    global _ASSETS
+    if _ASSETS is None:
+        logo = base64.b64decode(LOGO_PNG_BASE64)
+        logo_name = fingerprint('fastlydash-logo', logo, 'png')
+        stylesheet = STYLESHEET.render(logo_url=logo_name).encode('utf-8')
+        stylesheet_name = fingerprint('fastlydash', stylesheet, 'css')
+        script_name = fingerprint('fastlydash', VIRTUAL_SCRIPT, 'js')
+
+        _ASSETS = ({'css': stylesheet_name, 'js': script_name},
+                   {logo_name: (logo, 'image/png'),
+                    stylesheet_name: (stylesheet, 'text/css'),
+                    script_name: (VIRTUAL_SCRIPT, 'application/javascript')})
+    return _ASSETS
+
+def render_dashboard(services_data, show_account, render_mode='table', show_history=False):
+    """
+    Render the HTML dashboard.
+
+    In 'table' mode every service is rendered as a table row, with styles and
+    the logo inlined. In 'virtual' mode the services are embedded as JSON and
+    only the visible rows are rendered by the browser, with styles and scripts
+    in separate static assets.
+
+    :return: (rendered_template, { filename: (body, content_type) }) of the
+             static assets the page refers to
+    """
+    generated = time.strftime('%H:%M %Z on %A %d %b %Y')
 
-            LOGGER.info("No stats for service ID {0}".format(service))
+    if render_mode == 'virtual':
+        asset_names, assets = get_assets()
+        data = format_data(services_data, 'json').replace('</', '<\\/')
+        return VIRTUAL_TEMPLATE.render(data=data, assets=asset_names, show_account=show_account,
+                                       show_history=show_history, generated=generated), assets
 
-        table.add_row([service_data['name'],
-                       service_data['hit_ratio'],
-                       service_data['bandwidth'],
-                       service_data['data'],
-                       service_data['requests'],
-                       service_data['20x'],
-                       service_data['30x'],
-                       service_data['40x'],
-                       service_data['50x']
-                      ])
+    stylesheet = STYLESHEET.render(logo_url='data:image/png;base64,' + LOGO_PNG_BASE64)
+    return TEMPLATE.render(services=services_data, show_account=show_account, show_history=show_history,
+                           stylesheet=stylesheet, generated=generated), {}
 
-        services_data.append(service_data)
+def get_s3_bucket(region, bucket_name):
+    """
+    Return the named S3 bucket, reusing the connection across calls
+    """
+    if (region, bucket_name) not in _S3_BUCKETS:
+        conn = s3.connect_to_region(region)
+        _S3_BUCKETS[(region, bucket_name)] = conn.get_bucket(bucket_name, validate=False)
+    return _S3_BUCKETS[(region, bucket_name)]
+
+def publish_s3(bucket, key_name, body, digest, content_type, acl, cache_control=S3_CACHE_CONTROL):
+    """
+    Write body gzip compressed to S3, unless the object already there was
+    published with the same digest.
+
+    :return: bool. Whether the object was written
+    """
+    published = (bucket.name, key_name)
+    if _PUBLISHED_DIGESTS.get(published) != digest:
+        with METRICS.stage('s3_head'):
+            existing = bucket.get_key(key_name)
+        if existing is not None and existing.get_metadata('digest') == digest:
+            _PUBLISHED_DIGESTS[published] = digest
 
-    rendered_template = TEMPLATE.render(services=services_data, generated=time.strftime('%H:%M %Z on %A %d %b %Y'))
+    if _PUBLISHED_DIGESTS.get(published) == digest:
+        LOGGER.info("s3://{0}/{1} is unchanged, not writing".format(bucket.name, key_name))
+        return False
 
-    if kwargs['s3bucket']:
-        LOGGER.info("Writing s3://{0}/{1}".format(kwargs['s3bucket'], kwargs['filename']))
-        conn = s3.connect_to_region('eu-west-1')
-        bucket = conn.get_bucket(kwargs['s3bucket'])
+    if isinstance(body, unicode):
+        body = body.encode('utf-8')
+    compressed = io.BytesIO()
+    gzip_file = gzip.GzipFile(fileobj=compressed, mode='wb', mtime=0)
+    gzip_file.write(body)
+    gzip_file.close()
+
+    LOGGER.info("Writing s3://{0}/{1} ({2} compressed to {3})".format(
+        bucket.name, key_name, sizeof_fmt(len(body)), sizeof_fmt(len(compressed.getvalue()))))
+    with METRICS.stage('s3_put') as stage:
         k = Key(bucket)
-        k.key = kwargs['filename']
-        k.set_contents_from_string(rendered_template, policy=kwargs['s3acl'], headers={'Content-Type' : 'text/html'})
+        k.key = key_name
+        k.set_metadata('digest', digest)
+        k.set_contents_from_string(compressed.getvalue(), policy=acl,
+                                   headers={'Content-Type': content_type,
+                                            'Content-Encoding': 'gzip',
+                                            'Cache-Control': cache_control})
+        stage['bytes'] = len(compressed.getvalue())
+    _PUBLISHED_DIGESTS[published] = digest
+    return True
+
+def publish_summary(kwargs, services_data, rendered_template, assets):
+    """
+    Write the HTML summary, its data file and static assets to S3, skipping
+    any which haven't changed since they were last written.
+
+    The digest is taken of the summary data rather than the HTML, as the
+    HTML includes the time it was generated. The HTML digest also covers the
+    render mode and asset names, so the page is rewritten when either changes.
+    """
+    bucket = get_s3_bucket(kwargs['s3region'], kwargs['s3bucket'])
+
+    for asset_name, (body, content_type) in sorted(assets.items()):
+        publish_s3(bucket, posixpath.join(posixpath.dirname(kwargs['filename']), asset_name), body,
+                   asset_name, content_type, kwargs['s3acl'], cache_control=ASSET_CACHE_CONTROL)
+
+    data = format_data(services_data, kwargs['data_format'])
+    digest = hashlib.sha256(data).hexdigest()
+    data_filename = os.path.splitext(kwargs['filename'])[0] + '.' + kwargs['data_format']
+    data_content_type = 'text/csv' if kwargs['data_format'] == 'csv' else 'application/json'
+
+    html_digest = hashlib.sha256("\n".join([digest, kwargs['render_mode']] + sorted(assets))).hexdigest()
+
+    publish_s3(bucket, kwargs['filename'], rendered_template, html_digest, 'text/html; charset=utf-8', kwargs['s3acl'])
+    publish_s3(bucket, data_filename, data, digest, data_content_type, kwargs['s3acl'])
+
+def write_metrics(kwargs, metrics):
+    """
+    Write the metrics of a run as JSON and in the Prometheus text format, to
+    the files given by the metrics and prometheus arguments
+    """
+    for path, content in ((kwargs['metrics'], lambda: json.dumps(metrics.as_dict(), indent=2, sort_keys=True)),
+                          (kwargs['prometheus'], metrics.as_prometheus)):
+        if path:
+            with open(path + '.tmp', 'w') as metrics_file:
+                metrics_file.write(content())
+            os.rename(path + '.tmp', path)
+
+def generate_summary(kwargs):
+    """
+    Fetch the statistics for all services, and render them as a PrettyTable
+    and HTML page, optionally written to S3.
+
+    :return: (services_data, table, rendered_template, assets)
+    """
+    global METRICS
+    METRICS = RunMetrics()
+
+    accounts = load_accounts(kwargs['fastly_api_key'], kwargs['accounts'])
+    if not accounts:
+        raise ValueError("No Fastly API keys or accounts file given")
+    if kwargs['cache'] and kwargs['cache_retention'] < SUMMARY_HOURS:
+        raise ValueError("The cache retention must be at least the {0} hours summarised".format(SUMMARY_HOURS))
+    show_account = len(accounts) > 1
+
+    columns = ["Service", "Hit Ratio", "Bandwidth", "Data", "Requests", "% 20x", "% 30x", "% 40x", "% 50x"]
+    if kwargs['history']:
+        columns += ["Requests Change %", "Hit Ratio Change", "% 50x Change", "Requests Trend", "Hit Ratio Trend", "% 50x Trend"]
+    table = PrettyTable(["Account"] + columns if show_account else columns)
+
+    services_data, missing = collect_rows(accounts, kwargs)
+
+    if kwargs['history']:
+        with METRICS.stage('history'):
+            add_history(kwargs['history'], services_data)
+
+    with METRICS.stage('table'):
+        for service_data in services_data:
+            row = [service_data['name'],
+                   service_data['hit_ratio'],
+                   service_data['bandwidth'],
+                   service_data['data'],
+                   service_data['requests'],
+                   service_data['20x'],
+                   service_data['30x'],
+                   service_data['40x'],
+                   service_data['50x']
+                  ]
+            if kwargs['history']:
+                row += [service_data[field] if service_data[field] is not None else '-' for field in HISTORY_DATA_FIELDS]
+            table.add_row([service_data['account']] + row if show_account else row)
+
+    with METRICS.stage('render') as stage:
+        rendered_template, assets = render_dashboard(services_data, show_account, kwargs['render_mode'], bool(kwargs['history']))
+        stage['bytes'] = len(rendered_template.encode('utf-8'))
+
+    if kwargs['s3bucket'] and missing:
+        LOGGER.error("Not publishing to S3, accounts missing from the summary: {0}".format(", ".join(missing)))
+    elif kwargs['s3bucket']:
+        # Includes the time of the s3_head and s3_put stages within it
+        with METRICS.stage('publish'):
+            publish_summary(kwargs, services_data, rendered_template, assets)
+
+    return services_data, table, rendered_template, assets
+
+class Dashboard(object):
+    """
+    The most recently generated dashboard, held in memory and served over HTTP.
+
+    Each refresh replaces the whole set of documents at once, so request
+    handlers never see a partially updated dashboard.
+    """
+
+    def __init__(self, filename):
+        self.filename = filename
+        self.documents = {}
+
+    def update(self, services_data, rendered_template, assets):
+        """
+        Replace the served documents with a newly generated dashboard
+        """
+        if isinstance(rendered_template, unicode):
+            rendered_template = rendered_template.encode('utf-8')
+        data = json.dumps({'generated': int(time.time()), 'services': services_data})
+
+        html = (rendered_template, hashlib.md5(rendered_template).hexdigest(), 'text/html; charset=utf-8', 'no-cache')
+        documents = {'/': html,
+                     '/' + self.filename: html,
+                     '/services.json': (data, hashlib.md5(data).hexdigest(), 'application/json', 'no-cache')}
+
+        metrics = METRICS.as_prometheus()
+        documents['/metrics'] = (metrics, hashlib.md5(metrics).hexdigest(), 'text/plain; version=0.0.4', 'no-cache')
+
+        for asset_name, (body, content_type) in assets.items():
+            asset = (body, asset_name, content_type, ASSET_CACHE_CONTROL)
+            documents['/' + asset_name] = asset
+            documents['/' + posixpath.join(posixpath.dirname(self.filename), asset_name)] = asset
+
+        self.documents = documents
+
+    def refresh(self, kwargs):
+        """
+        Regenerate the dashboard, logging rather than raising any failure so
+        the previous dashboard continues to be served
+        """
+        try:
+            services_data, _, rendered_template, assets = generate_summary(kwargs)
+            self.update(services_data, rendered_template, assets)
+            write_metrics(kwargs, METRICS)
+        except Exception:
+            LOGGER.exception("Failed to refresh dashboard")
+        else:
+            LOGGER.info("Refreshed dashboard with {0} services".format(len(services_data)))
+
+    def refresh_forever(self, kwargs, interval):
+        """
+        Refresh the dashboard every interval seconds
+        """
+        while True:
+            started = time.time()
+            self.refresh(kwargs)
+            time.sleep(max(interval - (time.time() - started), 0))
+
+class DashboardRequestHandler(BaseHTTPRequestHandler):
+    """
+    Serve the documents of the server's Dashboard, answering conditional
+    requests with 304 Not Modified
+    """
+
+    def do_GET(self):
+        path = self.path.split('?', 1)[0]
+        documents = self.server.dashboard.documents
+
+        if path not in documents:
+            if documents:
+                self.send_error(404)
+            else:
+                self.send_response(503)
+                self.send_header('Retry-After', '5')
+                self.send_header('Content-Length', '0')
+                self.end_headers()
+            return
+
+        body, digest, content_type, cache_control = documents[path]
+        etag = '"{0}"'.format(digest)
+
+        if etag in [tag.strip() for tag in self.headers.get('If-None-Match', '').split(',')]:
+            self.send_response(304)
+            self.send_header('ETag', etag)
+            self.end_headers()
+            return
+
+        self.send_response(200)
+        self.send_header('Content-Type', content_type)
+        self.send_header('Content-Length', str(len(body)))
+        self.send_header('ETag', etag)
+        self.send_header('Cache-Control', cache_control)
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        LOGGER.debug("{0} - {1}".format(self.client_address[0], format % args))
+
+class DashboardServer(ThreadingMixIn, HTTPServer):
+    """
+    Threaded HTTP server for a Dashboard
+    """
+    daemon_threads = True
+
+    def __init__(self, address, dashboard):
+        HTTPServer.__init__(self, address, DashboardRequestHandler)
+        self.dashboard = dashboard
+
+def serve_dashboard(kwargs):
+    """
+    Serve the dashboard over HTTP, refreshing it in the background every
+    refresh_interval seconds
+    """
+    dashboard = Dashboard(kwargs['filename'])
+
+    refresher = threading.Thread(target=dashboard.refresh_forever, args=(kwargs, kwargs['refresh_interval']))
+    refresher.daemon = True
+    refresher.start()
+
+    server = DashboardServer((kwargs['bind'], kwargs['serve']), dashboard)
+    LOGGER.info("Serving dashboard on http://{0}:{1}/".format(kwargs['bind'], kwargs['serve']))
+    server.serve_forever()
+
+@argh.arg('fastly_api_key', nargs='*', help='The Fastly API keys used to query Fastly')
+@argh.arg('--accounts', help='Path to a JSON file of {"account name": "API key"} to query')
+@argh.arg('--account-timeout', type=int, default=ACCOUNT_TIMEOUT, help='The number of seconds allowed to collect the statistics of each account')
+@argh.arg('--s3bucket', help='The name of the S3 bucket to write to')
+@argh.arg('--filename', default='fastly-stats.html', help='The name of the HTML file to write')
+@argh.arg('--s3acl', choices=('private', 'public-read', 'project-private', 'public-read-write', 'authenticated-read', 'bucket-owner-read', 'bucket-owner-full-control'), default='public-read', help='The canned ACL string to set on the object written to S3')
+@argh.arg('--s3region', default=S3_REGION, help='The AWS region of the S3 bucket')
+@argh.arg('--data-format', choices=('json', 'csv'), default='json', help='The format of the data file written to S3 alongside the HTML file')
+@argh.arg('--render-mode', choices=('table', 'virtual'), default='table', help='Render every service as a table row, or only the visible rows from embedded JSON data (for accounts with thousands of services)')
+@argh.arg('--cache', help='Path to a SQLite file used to cache statistics between runs')
+@argh.arg('--cache-retention', type=int, default=CACHE_RETENTION_HOURS, help='The number of hours of statistics to keep in the cache, at least 24')
+@argh.arg('--history', help='Path to a directory in which to record the statistics of each service, to show their change and trend')
+@argh.arg('--metrics', help='Path to write the time and bytes of each stage of the run to as JSON')
+@argh.arg('--prometheus', help='Path to write the time and bytes of each stage of the run to in the Prometheus text format')
+@argh.arg('--serve', type=int, metavar='PORT', help='Keep running, serving the dashboard over HTTP on this port')
+@argh.arg('--bind', default='127.0.0.1', help='The address to serve the dashboard on')
+@argh.arg('--refresh-interval', type=int, default=REFRESH_INTERVAL, help='The number of seconds between refreshes of the served dashboard')
+def write_fastly_summary(**kwargs):
+    """
+    Output a summary of all fastly distributions on stdout, and optionally write
+    it as an HTML file to S3
+    """
+    if kwargs['serve']:
+        serve_dashboard(kwargs)
+        return
+
+    services_data, table, _, _ = generate_summary(kwargs)
+
+    with METRICS.stage('sort'):
+        table_string = table.get_string(sortby="Hit Ratio")
+
+    print table_string.encode('utf-8')
+    print "Showing {0} services".format(len(services_data))
 
-    print table.get_string(sortby="Hit Ratio")
-    print "Showing {0} services".format(len(services))
+    write_metrics(kwargs, METRICS)
 
 if __name__ == "__main__":
     # Configure LOGGER
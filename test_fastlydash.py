@@ -0,0 +1,641 @@
+"""
+test_fastlydash.py
+
+Tests for fastlydash, run with: python -m unittest test_fastlydash
+
+"""
+import gzip
+import io
+import json
+import os
+import shutil
+import socket
+import tempfile
+import threading
+import time
+import unittest
+from BaseHTTPServer import HTTPServer, BaseHTTPRequestHandler
+from SocketServer import ThreadingMixIn
+
+import requests
+
+import fastlydash
+
+
+class StubFastlyHandler(BaseHTTPRequestHandler):
+    """
+    Answer each request with the next canned (status, headers, body)
+    response of the server
+    """
+    protocol_version = 'HTTP/1.1'
+
+    def do_GET(self):
+        self.server.requests.append(self.path)
+        status, headers, body = self.server.responses.pop(0)
+        self.send_response(status)
+        for name, value in headers.items():
+            self.send_header(name, value)
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        pass
+
+class StubFastlyServer(ThreadingMixIn, HTTPServer):
+    """
+    Local stand-in for the Fastly API
+    """
+    daemon_threads = True
+
+    def __init__(self, responses):
+        HTTPServer.__init__(self, ('127.0.0.1', 0), StubFastlyHandler)
+        self.responses = list(responses)
+        self.requests = []
+
+def serve_stub_fastly(test, responses):
+    """
+    Start a stub Fastly API in a thread, stopped when the test is cleaned up
+
+    :return: (server, root URL)
+    """
+    server = StubFastlyServer(responses)
+    thread = threading.Thread(target=server.serve_forever)
+    thread.daemon = True
+    thread.start()
+    test.addCleanup(server.server_close)
+    test.addCleanup(server.shutdown)
+    return server, "http://127.0.0.1:{0}/".format(server.server_address[1])
+
+class MakeApiRequestTest(unittest.TestCase):
+
+    def setUp(self):
+        self.delays = []
+        self.sleep = time.sleep
+        time.sleep = self.delays.append
+
+    def tearDown(self):
+        time.sleep = self.sleep
+
+    def test_retries_after_retry_after(self):
+        server, root = serve_stub_fastly(self, [(429, {'Retry-After': '3'}, b''),
+                                   (200, {}, b'[{"name": "a", "id": "1"}]')])
+
+        resp = fastlydash.make_api_request('key', 'service', root)
+
+        self.assertEqual(resp.json(), [{'name': 'a', 'id': '1'}])
+        self.assertEqual(server.requests, ['/service', '/service'])
+        self.assertEqual(self.delays, [3.0])
+
+    def test_retry_after_is_capped(self):
+        server, root = serve_stub_fastly(self, [(429, {'Retry-After': '3600'}, b''), (200, {}, b'{}')])
+
+        fastlydash.make_api_request('key', 'service', root)
+
+        self.assertEqual(self.delays, [fastlydash.MAX_RETRY_DELAY])
+
+    def test_retry_wait_is_cut_short_by_the_deadline(self):
+        server, root = serve_stub_fastly(self, [(429, {'Retry-After': '20'}, b''), (200, {}, b'{}')])
+
+        fastlydash.make_api_request('key', 'service', root, deadline=time.time() + 2)
+
+        self.assertEqual(len(self.delays), 1)
+        self.assertTrue(0 < self.delays[0] <= 2, self.delays)
+
+    def test_request_after_the_deadline_raises(self):
+        server, root = serve_stub_fastly(self, [])
+
+        self.assertRaises(requests.Timeout, fastlydash.make_api_request, 'key', 'service', root, deadline=time.time())
+        self.assertEqual(server.requests, [])
+
+    def test_retries_after_rate_limit_reset(self):
+        reset = str(int(time.time()) + 10)
+        server, root = serve_stub_fastly(self, [(429, {'Fastly-RateLimit-Remaining': '0', 'Fastly-RateLimit-Reset': reset}, b''),
+                                   (200, {}, b'{}')])
+
+        fastlydash.make_api_request('key', 'service', root)
+
+        self.assertEqual(len(server.requests), 2)
+        self.assertEqual(len(self.delays), 1)
+        self.assertTrue(8 <= self.delays[0] <= 10, self.delays)
+
+    def test_server_error_on_last_attempt_raises(self):
+        server, root = serve_stub_fastly(self, [(503, {}, b'not json')] * fastlydash.MAX_ATTEMPTS)
+
+        self.assertRaises(requests.HTTPError, fastlydash.make_api_request, 'key', 'service', root)
+        self.assertEqual(len(server.requests), fastlydash.MAX_ATTEMPTS)
+
+    def test_connection_errors_are_retried_then_raised(self):
+        listener = socket.socket()
+        listener.bind(('127.0.0.1', 0))
+        root = "http://127.0.0.1:{0}/".format(listener.getsockname()[1])
+        listener.close()
+
+        self.assertRaises(requests.ConnectionError, fastlydash.make_api_request, 'key', 'service', root)
+        self.assertEqual(len(self.delays), fastlydash.MAX_ATTEMPTS - 1)
+
+class RunMetricsTest(unittest.TestCase):
+
+    def setUp(self):
+        self.metrics = fastlydash.METRICS
+        self.collect_rows = fastlydash.collect_rows
+        fastlydash.METRICS = fastlydash.RunMetrics()
+
+    def tearDown(self):
+        fastlydash.METRICS = self.metrics
+        fastlydash.collect_rows = self.collect_rows
+
+    def test_statistics_decode_is_measured(self):
+        body = b'{"data": {"1": [{"requests": 10}], "2": [{"requests": 20}]}}'
+        server, root = serve_stub_fastly(self, [(200, {}, body)])
+
+        resp = fastlydash.make_api_request('key', 'stats?by=hour', root, stream=True)
+        stats = dict(fastlydash._iter_statistics_response(resp))
+
+        self.assertEqual(stats, {'1': [{'requests': 10}], '2': [{'requests': 20}]})
+        self.assertEqual(server.requests, ['/stats?by=hour'])
+        self.assertEqual(fastlydash.METRICS.stages['api_stats']['bytes'], len(body))
+        self.assertEqual(fastlydash.METRICS.stages['decode']['calls'], 1)
+        self.assertEqual(fastlydash.METRICS.stages['decode']['bytes'], len(body))
+
+    def test_render_bytes_are_encoded_length(self):
+        fastlydash.collect_rows = lambda accounts, kwargs: ([fastlydash.empty_service_row(u'caf\xe9')], [])
+        kwargs = {'fastly_api_key': ['key'], 'accounts': None, 'cache': None, 'history': None,
+                  'render_mode': 'table', 's3bucket': None}
+
+        _, _, rendered_template, _ = fastlydash.generate_summary(kwargs)
+
+        self.assertEqual(fastlydash.METRICS.stages['render']['bytes'], len(rendered_template.encode('utf-8')))
+        self.assertGreater(fastlydash.METRICS.stages['render']['bytes'], len(rendered_template))
+
+class ServiceRowsTest(unittest.TestCase):
+
+    def setUp(self):
+        self.closed = []
+        self.get_all_services = fastlydash.get_all_services
+        self.request_statistics = fastlydash.request_statistics
+        fastlydash.request_statistics = self.fake_request_statistics
+
+    def tearDown(self):
+        fastlydash.get_all_services = self.get_all_services
+        fastlydash.request_statistics = self.request_statistics
+
+    def fake_request_statistics(self, api_key, from_hours_ago=24, from_time=None, by=None, deadline=None):
+        resp = requests.Response()
+        resp.raw = io.BytesIO(b'{"data": {"1": [{"requests": 10}]}}')
+        resp.close = lambda: self.closed.append(True)
+        return resp
+
+    def fail_get_all_services(self, api_key, deadline=None):
+        raise requests.HTTPError("401 Client Error")
+
+    def test_stats_response_closed_when_services_fail(self):
+        fastlydash.get_all_services = self.fail_get_all_services
+
+        self.assertRaises(requests.HTTPError, fastlydash.get_service_rows, 'key')
+        self.assertEqual(self.closed, [True])
+
+    def test_stats_stop_being_read_after_the_deadline(self):
+        stats = fastlydash._iter_statistics_response(self.fake_request_statistics('key'), time.time() - 1)
+
+        self.assertRaises(requests.Timeout, list, stats)
+        self.assertEqual(self.closed, [True])
+
+class StatsCacheTest(unittest.TestCase):
+
+    def setUp(self):
+        self.now = 1400000000 - 1400000000 % 3600 + 600
+        self.time = time.time
+        time.time = lambda: self.now
+        self.iter_statistics = fastlydash.iter_statistics
+        fastlydash.iter_statistics = self.fake_iter_statistics
+        self.requests = []
+        self.stats = {}
+        self.conn = fastlydash.open_stats_cache(':memory:')
+        self.addCleanup(self.conn.close)
+
+    def tearDown(self):
+        time.time = self.time
+        fastlydash.iter_statistics = self.iter_statistics
+
+    def fake_iter_statistics(self, api_key, from_hours_ago=24, from_time=None, by=None, deadline=None):
+        self.requests.append((from_time, by))
+        return iter([(service_id, [bucket for bucket in buckets if bucket['start_time'] >= from_time])
+                     for service_id, buckets in self.stats.items()])
+
+    def hour(self, hours_ago):
+        return self.now - self.now % 3600 - hours_ago * 3600
+
+    def cached(self):
+        return [(service_id, start_time, json.loads(data)['requests']) for service_id, start_time, data in
+                self.conn.execute("SELECT service_id, start_time, data FROM stats ORDER BY service_id, start_time")]
+
+    def test_empty_cache_fetches_the_summary_window(self):
+        self.stats = {'1': [{'start_time': self.hour(24), 'requests': 10}, {'start_time': self.hour(0), 'requests': 20}]}
+
+        fastlydash.update_stats_cache(self.conn, 'key')
+
+        self.assertEqual(self.requests, [(self.hour(24), 'hour')])
+        self.assertEqual(self.cached(), [('1', self.hour(24), 10), ('1', self.hour(0), 20)])
+
+    def test_only_buckets_from_the_last_cached_hour_are_fetched(self):
+        self.stats = {'1': [{'start_time': self.hour(2), 'requests': 10}, {'start_time': self.hour(1), 'requests': 20}]}
+        fastlydash.update_stats_cache(self.conn, 'key')
+        self.requests = []
+
+        self.now += 3600
+        self.stats = {'1': [{'start_time': self.hour(3), 'requests': 10}, {'start_time': self.hour(2), 'requests': 25},
+                            {'start_time': self.hour(1), 'requests': 30}]}
+        fastlydash.update_stats_cache(self.conn, 'key')
+
+        self.assertEqual(self.requests, [(self.hour(2), 'hour')])
+        self.assertEqual(self.cached(), [('1', self.hour(3), 10), ('1', self.hour(2), 25), ('1', self.hour(1), 30)])
+
+    def test_buckets_older_than_the_retention_are_evicted(self):
+        self.stats = {'1': [{'start_time': self.hour(30), 'requests': 10}]}
+        fastlydash.update_stats_cache(self.conn, 'key', from_hours_ago=48)
+
+        self.stats = {'1': [{'start_time': self.hour(0), 'requests': 20}]}
+        fastlydash.update_stats_cache(self.conn, 'key', retention_hours=24)
+
+        self.assertEqual(self.cached(), [('1', self.hour(0), 20)])
+
+    def test_summary_uses_only_the_window_from_the_cache(self):
+        self.stats = {'1': [{'start_time': self.hour(30), 'requests': 10}, {'start_time': self.hour(1), 'requests': 20}]}
+        fastlydash.update_stats_cache(self.conn, 'key', from_hours_ago=48)
+
+        stats = list(fastlydash.iter_cached_statistics(self.conn, 'key'))
+
+        self.assertEqual(stats, [('1', [{'start_time': self.hour(1), 'requests': 20}])])
+
+    def test_retention_shorter_than_the_summary_is_rejected(self):
+        kwargs = {'fastly_api_key': ['key'], 'accounts': None, 'cache': ':memory:', 'cache_retention': 12}
+
+        self.assertRaises(ValueError, fastlydash.generate_summary, kwargs)
+
+class CollectRowsTest(unittest.TestCase):
+
+    def setUp(self):
+        self.collect_account_rows = fastlydash.collect_account_rows
+        fastlydash.collect_account_rows = self.fake_collect_account_rows
+        self.kwargs = {'account_timeout': 5}
+        self.deadlines = []
+
+    def tearDown(self):
+        fastlydash.collect_account_rows = self.collect_account_rows
+
+    def fake_collect_account_rows(self, name, api_key, kwargs, lookup_name=True, deadline=None):
+        self.deadlines.append(deadline)
+        if api_key.startswith('bad'):
+            raise requests.HTTPError("401 Client Error")
+        return [{'name': 'service', 'account': name}]
+
+    def test_failed_accounts_are_left_out(self):
+        services_data, missing = fastlydash.collect_rows([('good', 'good-key'), ('bad', 'bad-key')], self.kwargs)
+
+        self.assertEqual(services_data, [{'name': 'service', 'account': 'good'}])
+        self.assertEqual(missing, ['bad'])
+
+    def test_accounts_share_a_deadline(self):
+        started = time.time()
+        fastlydash.collect_rows([('good', 'good-key'), ('bad', 'bad-key')], self.kwargs)
+
+        self.assertEqual(len(set(self.deadlines)), 1)
+        self.assertTrue(started + 5 <= self.deadlines[0] <= time.time() + 5, self.deadlines)
+
+    def test_no_accounts_collected_raises(self):
+        self.assertRaises(RuntimeError, fastlydash.collect_rows, [('bad', 'bad-key'), (None, 'bad-key-1234')], self.kwargs)
+
+class AggregationTest(unittest.TestCase):
+
+    def test_null_field_in_a_single_bucket_counts_as_zero(self):
+        bucket = dict.fromkeys(fastlydash.SUMMARY_FIELDS, 10)
+        bucket['miss'] = None
+
+        self.assertEqual(fastlydash.merge_buckets([bucket]), (10, 0, 10, 10, 10, 10, 10, 10))
+
+    def test_buckets_are_totalled(self):
+        buckets = [dict.fromkeys(fastlydash.SUMMARY_FIELDS, 10), dict.fromkeys(fastlydash.SUMMARY_FIELDS, 30)]
+        buckets[1]['status_5xx'] = 0
+
+        self.assertEqual(fastlydash.merge_buckets(buckets), (40, 40, 40, 40, 40, 40, 40, 10))
+
+    def test_services_are_summarised_together(self):
+        rows = fastlydash.summarise_services(['www', 'zero'], [(29, 71, 100, 2048, 29, 1, 0, 70),
+                                                              (0, 0, 0, 0, 0, 0, 0, 0)])
+
+        self.assertEqual([(row['name'], row['hit_ratio'], row['data'], row['requests'], row['20x'], row['30x'], row['50x'])
+                          for row in rows],
+                         [('www', 29, '2.0Kb', 100, 29, 1, 70), ('zero', None, '0.0b', 0, '-', '-', '-')])
+
+    def test_rollups_over_a_window(self):
+        buckets = [{'start_time': hour * 3600, 'requests': hour} for hour in range(1, 101)]
+
+        self.assertEqual(fastlydash.rollup_buckets(buckets, 'requests'), 5050)
+        self.assertEqual(fastlydash.rollup_buckets(buckets, 'requests', 'sum', to_time=4 * 3600), 6)
+        self.assertEqual(fastlydash.rollup_buckets(buckets, 'requests', 'mean', from_time=51 * 3600), 75.5)
+        self.assertEqual(fastlydash.rollup_buckets(buckets, 'requests', 'p95'), 95)
+        self.assertEqual(fastlydash.rollup_buckets(buckets, 'requests', 'p100', 10 * 3600, 20 * 3600), 19)
+        self.assertIsNone(fastlydash.rollup_buckets(buckets, 'requests', 'sum', from_time=200 * 3600))
+        self.assertRaises(ValueError, fastlydash.rollup_buckets, buckets, 'requests', 'median')
+
+class FormatDataTest(unittest.TestCase):
+
+    def test_placeholders_are_written_as_null(self):
+        services_data = ([fastlydash.empty_service_row('nostats')] +
+                         fastlydash.summarise_services(['zero'], [(0, 0, 0, 0, 0, 0, 0, 0)]))
+        for service_data in services_data:
+            service_data['account'] = None
+
+        data = json.loads(fastlydash.format_data(services_data, 'json'))
+
+        self.assertEqual(data['services'], [[None, 'nostats', None, None, None, None, None, None, None],
+                                            [None, 'zero', None, 0, 0, None, None, None, None]])
+
+class RollupHistoryTest(unittest.TestCase):
+
+    def setUp(self):
+        self.directory = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, self.directory)
+        self.now = 1400000000 - 1400000000 % 3600
+
+    def raw_path(self):
+        return fastlydash.history_path(self.directory, 'service', 'raw')
+
+    def test_expired_records_are_averaged_in_to_the_next_tier(self):
+        fastlydash.append_history(self.raw_path(), [(self.now - 3 * 24 * 3600, 10, 8, 2, 0, 1000),
+                                                    (self.now - 3 * 24 * 3600 + 600, 20, 16, 4, 2, 3000),
+                                                    (self.now - 300, 30, 24, 6, 0, 5000)])
+
+        fastlydash.rollup_history(self.directory, 'service', self.now)
+
+        self.assertEqual(fastlydash.read_history(self.raw_path()), [(self.now - 300, 30, 24, 6, 0, 5000)])
+        self.assertEqual(fastlydash.read_history(fastlydash.history_path(self.directory, 'service', 'hour')),
+                         [(self.now - 3 * 24 * 3600, 15, 12, 3, 1, 2000)])
+
+    def test_periods_already_rolled_up_are_skipped(self):
+        records = [(self.now - 3 * 24 * 3600, 10, 8, 2, 0, 1000),
+                   (self.now - 300, 30, 24, 6, 0, 5000)]
+        fastlydash.append_history(self.raw_path(), records)
+        hour_path = fastlydash.history_path(self.directory, 'service', 'hour')
+        # A previous run appended to the hour tier, then stopped before rewriting the raw tier
+        fastlydash.append_history(hour_path, [records[0]])
+
+        fastlydash.rollup_history(self.directory, 'service', self.now)
+
+        self.assertEqual(fastlydash.read_history(self.raw_path()), records[1:])
+        self.assertEqual(fastlydash.read_history(hour_path), records[:1])
+
+    def test_unexpired_history_is_not_read(self):
+        fastlydash.append_history(self.raw_path(), [(self.now - 300, 30, 24, 6, 0, 5000)])
+        read_history = fastlydash.read_history
+        fastlydash.read_history = self.fail
+        self.addCleanup(setattr, fastlydash, 'read_history', read_history)
+
+        fastlydash.rollup_history(self.directory, 'service', self.now)
+
+        self.assertFalse(os.path.exists(fastlydash.history_path(self.directory, 'service', 'hour')))
+
+    def test_missing_history_is_ignored(self):
+        fastlydash.rollup_history(self.directory, 'service', self.now)
+
+        self.assertEqual(os.listdir(self.directory), [])
+
+class AddHistoryTest(unittest.TestCase):
+
+    def setUp(self):
+        self.directory = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, self.directory)
+        self.now = 1400000000 - 1400000000 % 3600
+
+    def service_data(self, requests_total, hits, miss, status_5xx):
+        return {'id': 'service', 'name': 'www',
+                'totals': (hits, miss, requests_total, 1000, requests_total - status_5xx, 0, 0, status_5xx)}
+
+    def test_change_since_the_previous_day(self):
+        fastlydash.add_history(self.directory, [self.service_data(100, 80, 20, 2)], self.now - 24 * 3600)
+        services_data = [self.service_data(150, 135, 15, 0)]
+
+        fastlydash.add_history(self.directory, services_data, self.now)
+
+        self.assertEqual(services_data[0]['requests_change'], 50.0)
+        self.assertEqual(services_data[0]['hit_ratio_change'], 10.0)
+        self.assertEqual(services_data[0]['50x_change'], -2.0)
+
+    def test_no_change_without_a_previous_day(self):
+        services_data = [self.service_data(100, 80, 20, 2)]
+
+        fastlydash.add_history(self.directory, services_data, self.now)
+
+        self.assertIsNone(services_data[0]['requests_change'])
+        self.assertIsNone(services_data[0]['hit_ratio_change'])
+        self.assertIsNone(services_data[0]['50x_change'])
+        self.assertEqual(services_data[0]['requests_trend'], fastlydash.SPARKLINE_CHARS[0])
+
+    def test_trends_chart_each_point_of_the_week(self):
+        for days_ago, requests_total in ((6, 100), (4, 200), (2, 300)):
+            fastlydash.add_history(self.directory, [self.service_data(requests_total, 50, 50, 0)],
+                                   self.now - days_ago * 24 * 3600)
+        services_data = [self.service_data(400, 50, 50, 0)]
+
+        fastlydash.add_history(self.directory, services_data, self.now)
+
+        chars = fastlydash.SPARKLINE_CHARS
+        self.assertEqual(services_data[0]['requests_trend'],
+                         chars[0] + chars[int(round((len(chars) - 1) / 3.0))] +
+                         chars[int(round(2 * (len(chars) - 1) / 3.0))] + chars[-1])
+        self.assertEqual(services_data[0]['hit_ratio_trend'], chars[0] * 4)
+
+    def test_services_without_totals_have_no_history(self):
+        services_data = [{'id': 'service', 'name': 'www'}]
+
+        fastlydash.add_history(self.directory, services_data, self.now)
+
+        self.assertIsNone(services_data[0]['requests_trend'])
+        self.assertEqual(os.listdir(self.directory), [])
+
+class DashboardServerTest(unittest.TestCase):
+
+    def setUp(self):
+        self.dashboard = fastlydash.Dashboard('fastly-stats.html')
+        self.server = fastlydash.DashboardServer(('127.0.0.1', 0), self.dashboard)
+        thread = threading.Thread(target=self.server.serve_forever)
+        thread.daemon = True
+        thread.start()
+        self.addCleanup(self.server.server_close)
+        self.addCleanup(self.server.shutdown)
+        self.root = "http://127.0.0.1:{0}/".format(self.server.server_address[1])
+        self.generate_summary = fastlydash.generate_summary
+
+    def tearDown(self):
+        fastlydash.generate_summary = self.generate_summary
+
+    def fake_generate_summary(self, kwargs):
+        if kwargs.get('fail'):
+            raise requests.ConnectionError("Fastly is down")
+        return [{'name': 'www'}], None, u'<html>www</html>', {}
+
+    def test_unavailable_before_first_refresh(self):
+        resp = requests.get(self.root)
+
+        self.assertEqual(resp.status_code, 503)
+        self.assertEqual(resp.headers['Retry-After'], '5')
+
+    def test_conditional_request_not_modified(self):
+        self.dashboard.update([{'name': 'www'}], u'<html>www</html>', {})
+
+        resp = requests.get(self.root + 'fastly-stats.html')
+        self.assertEqual(resp.status_code, 200)
+        self.assertEqual(resp.content, b'<html>www</html>')
+
+        resp = requests.get(self.root, headers={'If-None-Match': 'W/"other", ' + resp.headers['ETag']})
+        self.assertEqual(resp.status_code, 304)
+        self.assertEqual(resp.content, b'')
+
+        self.assertEqual(requests.get(self.root + 'missing').status_code, 404)
+
+    def test_changed_dashboard_has_a_new_etag(self):
+        self.dashboard.update([{'name': 'www'}], u'<html>www</html>', {})
+        etag = requests.get(self.root).headers['ETag']
+
+        self.dashboard.update([{'name': 'api'}], u'<html>api</html>', {})
+        resp = requests.get(self.root, headers={'If-None-Match': etag})
+
+        self.assertEqual(resp.status_code, 200)
+        self.assertEqual(resp.content, b'<html>api</html>')
+
+    def test_failed_refresh_keeps_the_previous_dashboard(self):
+        fastlydash.generate_summary = self.fake_generate_summary
+        self.dashboard.refresh({'metrics': None, 'prometheus': None})
+        documents = self.dashboard.documents
+
+        self.dashboard.refresh({'metrics': None, 'prometheus': None, 'fail': True})
+
+        self.assertIs(self.dashboard.documents, documents)
+        resp = requests.get(self.root + 'services.json')
+        self.assertEqual(resp.status_code, 200)
+        self.assertEqual(resp.json()['services'], [{'name': 'www'}])
+
+class FakeKey(object):
+    """
+    An S3 object held in a FakeBucket
+    """
+
+    def __init__(self, bucket=None):
+        self.bucket = bucket
+        self.key = None
+        self.metadata = {}
+
+    def get_metadata(self, name):
+        return self.metadata.get(name)
+
+    def set_metadata(self, name, value):
+        self.metadata[name] = value
+
+    def set_contents_from_string(self, contents, headers=None, policy=None):
+        self.contents = contents
+        self.headers = headers
+        self.policy = policy
+        self.bucket.keys[self.key] = self
+
+class FakeBucket(object):
+    """
+    An in-memory S3 bucket
+    """
+    name = 'dashboards'
+
+    def __init__(self):
+        self.keys = {}
+
+    def get_key(self, key_name):
+        return self.keys.get(key_name)
+
+class PublishTest(unittest.TestCase):
+
+    def setUp(self):
+        self.key = fastlydash.Key
+        fastlydash.Key = FakeKey
+        fastlydash._PUBLISHED_DIGESTS.clear()
+        self.bucket = FakeBucket()
+        fastlydash._S3_BUCKETS[(fastlydash.S3_REGION, self.bucket.name)] = self.bucket
+
+    def tearDown(self):
+        fastlydash.Key = self.key
+        fastlydash._PUBLISHED_DIGESTS.clear()
+        fastlydash._S3_BUCKETS.clear()
+
+    def test_writes_gzip_with_headers(self):
+        written = fastlydash.publish_s3(self.bucket, 'fastly-stats.html', u'<html></html>', 'abc', 'text/html', 'public-read')
+
+        key = self.bucket.keys['fastly-stats.html']
+        self.assertTrue(written)
+        self.assertEqual(gzip.GzipFile(fileobj=io.BytesIO(key.contents)).read(), b'<html></html>')
+        self.assertEqual(key.headers, {'Content-Type': 'text/html',
+                                       'Content-Encoding': 'gzip',
+                                       'Cache-Control': fastlydash.S3_CACHE_CONTROL})
+        self.assertEqual(key.policy, 'public-read')
+        self.assertEqual(key.get_metadata('digest'), 'abc')
+
+    def test_skips_digest_already_published(self):
+        fastlydash.publish_s3(self.bucket, 'fastly-stats.html', 'one', 'abc', 'text/html', 'private')
+        self.bucket.keys.clear()
+
+        written = fastlydash.publish_s3(self.bucket, 'fastly-stats.html', 'two', 'abc', 'text/html', 'private')
+
+        self.assertFalse(written)
+        self.assertEqual(self.bucket.keys, {})
+
+    def test_skips_object_with_matching_digest(self):
+        existing = FakeKey(self.bucket)
+        existing.key = 'fastly-stats.html'
+        existing.set_metadata('digest', 'abc')
+        existing.set_contents_from_string('one')
+
+        written = fastlydash.publish_s3(self.bucket, 'fastly-stats.html', 'two', 'abc', 'text/html', 'private')
+
+        self.assertFalse(written)
+        self.assertEqual(self.bucket.keys['fastly-stats.html'].contents, 'one')
+
+    def test_rewrites_changed_digest(self):
+        fastlydash.publish_s3(self.bucket, 'fastly-stats.html', 'one', 'abc', 'text/html', 'private')
+
+        written = fastlydash.publish_s3(self.bucket, 'fastly-stats.html', 'two', 'def', 'text/html', 'private')
+
+        self.assertTrue(written)
+        self.assertEqual(self.bucket.keys['fastly-stats.html'].get_metadata('digest'), 'def')
+
+    def publish_summary(self, data_format, render_mode='virtual', assets=None):
+        kwargs = {'s3region': fastlydash.S3_REGION, 's3bucket': self.bucket.name, 's3acl': 'private',
+                  'filename': 'dashboards/fastly-stats.html', 'data_format': data_format, 'render_mode': render_mode}
+        services_data = [{'name': 'www', 'id': '1', 'hit_ratio': 90, 'requests': 10}]
+        if assets is None:
+            assets = {'fastlydash-0123456789ab.css': ('body {}', 'text/css')}
+        fastlydash.publish_summary(kwargs, services_data, u'<html></html>', assets)
+
+    def test_summary_writes_json_data_file_beside_html(self):
+        self.publish_summary('json')
+
+        self.assertEqual(sorted(self.bucket.keys), ['dashboards/fastly-stats.html', 'dashboards/fastly-stats.json',
+                                                    'dashboards/fastlydash-0123456789ab.css'])
+        self.assertEqual(self.bucket.keys['dashboards/fastly-stats.json'].headers['Content-Type'], 'application/json')
+        self.assertEqual(self.bucket.keys['dashboards/fastlydash-0123456789ab.css'].headers['Cache-Control'],
+                         fastlydash.ASSET_CACHE_CONTROL)
+
+    def test_summary_writes_csv_data_file_beside_html(self):
+        self.publish_summary('csv')
+
+        self.assertIn('dashboards/fastly-stats.csv', self.bucket.keys)
+        self.assertEqual(self.bucket.keys['dashboards/fastly-stats.csv'].headers['Content-Type'], 'text/csv')
+
+    def test_summary_html_rewritten_when_render_mode_changes(self):
+        self.publish_summary('json')
+        data_key = self.bucket.keys['dashboards/fastly-stats.json']
+        html_key = self.bucket.keys['dashboards/fastly-stats.html']
+
+        self.publish_summary('json', render_mode='table', assets={})
+
+        self.assertIs(self.bucket.keys['dashboards/fastly-stats.json'], data_key)
+        self.assertIsNot(self.bucket.keys['dashboards/fastly-stats.html'], html_key)
+
+if __name__ == "__main__":
+    unittest.main()